@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import importlib.metadata
-from .client import TDClient
+from .client import TDClient, AsyncTDClient
 
 try:
     # Change here if project is renamed and does not equal the package name
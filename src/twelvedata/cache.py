@@ -0,0 +1,226 @@
+# coding: utf-8
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+__all__ = ("MemoryCache", "DiskCache", "DEFAULT_TTLS")
+
+
+# Time to live in seconds of cached responses per endpoint path.
+# Responses of endpoints missing here are cached for `default_ttl` seconds.
+DEFAULT_TTLS = {
+    "/stocks": 86400,
+    "/stock_exchanges": 86400,
+    "/forex_pairs": 86400,
+    "/cryptocurrencies": 86400,
+    "/cryptocurrency_exchanges": 86400,
+    "/etf": 86400,
+    "/indices": 86400,
+    "/funds": 86400,
+    "/bonds": 86400,
+    "/exchanges": 86400,
+    "/technical_indicators": 86400,
+    "/logo": 86400,
+    "/profile": 86400,
+    "/price": 1,
+    "/quote": 1,
+    "/exchange_rate": 1,
+    "/currency_conversion": 1,
+}
+
+# These parameters do not affect the response, so they are not part of the key
+IGNORED_PARAMS = ("apikey", "source")
+
+
+class ResponseCache(object):
+    """
+    Base class of response caches used by HTTP clients.
+
+    :param ttls: mapping of endpoint path to time to live in seconds
+    :param default_ttl: time to live of endpoints missing in ttls,
+        responses are not cached if it evaluates to false
+    """
+
+    def __init__(self, ttls=None, default_ttl=0):
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+
+    def ttl(self, relative_url):
+        return self.ttls.get(relative_url, self.default_ttl)
+
+    @staticmethod
+    def key(relative_url, params):
+        params = sorted(
+            (k, str(v)) for k, v in (params or {}).items() if k not in IGNORED_PARAMS
+        )
+        return "{}?{}".format(relative_url, "&".join("{}={}".format(k, v) for k, v in params))
+
+    def get(self, relative_url, params):
+        """
+        Returns cached response or None if it's missing or expired
+        """
+        if not self.ttl(relative_url):
+            return None
+
+        entry = self._get(self.key(relative_url, params))
+        if entry is None:
+            return None
+
+        expires_at, resp = entry
+        if expires_at < time.time():
+            return None
+        return resp
+
+    def set(self, relative_url, params, resp):
+        ttl = self.ttl(relative_url)
+        if not ttl:
+            return
+        self._set(self.key(relative_url, params), (time.time() + ttl, resp))
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def _set(self, key, entry):
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    Thread-safe in-memory cache, least recently used responses are
+    evicted when it grows over maxsize.
+    """
+
+    def __init__(self, maxsize=1024, ttls=None, default_ttl=0):
+        super(MemoryCache, self).__init__(ttls=ttls, default_ttl=default_ttl)
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def _set(self, key, entry):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class DiskCache(ResponseCache):
+    """
+    Cache which keeps responses in a directory, so it can be shared by
+    several processes. Every file holds a JSON line with the status,
+    headers and expiry of the response followed by its raw body, nothing
+    is unpickled or executed on read. Files are replaced atomically and
+    least recently used ones are removed when there are more than maxsize
+    of them.
+    """
+
+    suffix = ".tdcache"
+
+    def __init__(self, directory, maxsize=4096, ttls=None, default_ttl=0):
+        super(DiskCache, self).__init__(ttls=ttls, default_ttl=default_ttl)
+        self.directory = directory
+        self.maxsize = maxsize
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(
+            self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + self.suffix
+        )
+
+    @staticmethod
+    def _dump(resp):
+        return {
+            "async": not isinstance(resp, Response),
+            "status_code": resp.status_code,
+            "headers": dict(resp.headers),
+            "encoding": resp.encoding,
+            "url": getattr(resp, "url", None),
+        }
+
+    @staticmethod
+    def _load(meta, content):
+        headers = CaseInsensitiveDict(meta["headers"])
+        if meta["async"]:
+            from .http_client import AsyncHttpResponse
+
+            return AsyncHttpResponse(meta["status_code"], headers, content, meta["encoding"])
+
+        resp = Response()
+        resp.status_code = meta["status_code"]
+        resp.headers = headers
+        resp.encoding = meta["encoding"]
+        resp.url = meta["url"]
+        resp._content = content
+        return resp
+
+    def _get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+            entry = meta["expires_at"], self._load(meta, content)
+            # Access time is tracked via mtime, since atime is often disabled
+            os.utime(path)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        return entry
+
+    def _set(self, key, entry):
+        expires_at, resp = entry
+        meta = dict(self._dump(resp), expires_at=expires_at)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(resp.content)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(self.suffix)
+        ]
+        if len(paths) <= self.maxsize:
+            return
+
+        def mtime(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0
+
+        paths.sort(key=mtime)
+        for path in paths[:len(paths) - self.maxsize]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                os.unlink(os.path.join(self.directory, name))
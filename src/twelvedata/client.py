@@ -1,66 +1,32 @@
 from .context import Context
-from .endpoints import (
-    CustomEndpoint,
-    StocksListEndpoint,
-    StockExchangesListEndpoint,
-    ForexPairsListEndpoint,
-    ETFListEndpoint,
-    IndicesListEndpoint,
-    FundsListEndpoint,
-    BondsListEndpoint,
-    ExchangesListEndpoint,
-    CryptocurrenciesListEndpoint,
-    CryptocurrencyExchangesListEndpoint,
-    TechnicalIndicatorsListEndpoint,
-    SymbolSearchEndpoint,
-    EarliestTimestampEndpoint,
-    ExchangeRateEndpoint,
-    CurrencyConversionEndpoint,
-    QuoteEndpoint,
-    PriceEndpoint,
-    EODEndpoint,
-    LogoEndpoint,
-    ProfileEndpoint,
-    DividendsEndpoint,
-    DividendsCalendarEndpoint,
-    SplitsEndpoint,
-    SplitsCalendarEndpoint,
-    EarningsEndpoint,
-    EarningsCalendarEndpoint,
-    IPOCalendarEndpoint,
-    StatisticsEndpoint,
-    InsiderTransactionsEndpoint,
-    IncomeStatementEndpoint,
-    BalanceSheetEndpoint,
-    CashFlowEndpoint,
-    OptionsExpirationEndpoint,
-    OptionsChainEndpoint,
-    KeyExecutivesEndpoint,
-    InstitutionalHoldersEndpoint,
-    FundHoldersEndpoint,
-    APIUsageEndpoint,
-    MarketStateEndpoint,
-)
-from .http_client import DefaultHttpClient
-from .time_series import TimeSeries
+from .http_client import DefaultHttpClient, AsyncHttpClient
 from .utils import patch_endpoints_meta
-from .websocket import TDWebSocket
 
 
 class TDClient:
+    # Class of the HTTP client created when none is passed
+    http_client_class = DefaultHttpClient
+
     def __init__(self, apikey, http_client=None, base_url=None, self_heal_time_s=None, **defaults):
         self.ctx = Context()
         self.ctx.apikey = apikey
         self.ctx.self_heal_time_s = self_heal_time_s
         self.ctx.base_url = base_url or "https://api.twelvedata.com"
-        self.ctx.http_client = http_client or DefaultHttpClient(self.ctx.base_url)
+        self.ctx.http_client = http_client or self.http_client_class(self.ctx.base_url)
         self.ctx.defaults = defaults
 
+        self._patch_endpoints_meta()
+
+    def _patch_endpoints_meta(self):
         patch_endpoints_meta(self.ctx)
 
     def websocket(self, **defaults):
+        from .websocket import TDWebSocket, ShardedTDWebSocket
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
+        if defaults.get("shards", 1) > 1:
+            return ShardedTDWebSocket(ctx)
         return TDWebSocket(ctx)
 
     def custom_endpoint(self, **defaults):
@@ -73,6 +39,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: CustomEndpointRequestBuilder
         """
+        from .endpoints import CustomEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return CustomEndpoint(ctx, **ctx.defaults)
@@ -87,6 +55,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: StocksListRequestBuilder
         """
+        from .endpoints import StocksListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return StocksListEndpoint(ctx, **ctx.defaults)
@@ -101,6 +71,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: StockExchangesListRequestBuilder
         """
+        from .endpoints import StockExchangesListEndpoint
+
         return StockExchangesListEndpoint(ctx=self.ctx)
 
     def get_forex_pairs_list(self, **defaults):
@@ -113,6 +85,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: ForexPairsListRequestBuilder
         """
+        from .endpoints import ForexPairsListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return ForexPairsListEndpoint(ctx, **ctx.defaults)
@@ -127,6 +101,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: CryptocurrenciesListRequestBuilder
         """
+        from .endpoints import CryptocurrenciesListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return CryptocurrenciesListEndpoint(ctx, **ctx.defaults)
@@ -141,6 +117,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: ETFListRequestBuilder
         """
+        from .endpoints import ETFListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return ETFListEndpoint(ctx, **ctx.defaults)
@@ -155,6 +133,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: IndicesListRequestBuilder
         """
+        from .endpoints import IndicesListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return IndicesListEndpoint(ctx, **ctx.defaults)
@@ -169,6 +149,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: FundsListRequestBuilder
         """
+        from .endpoints import FundsListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return FundsListEndpoint(ctx, **ctx.defaults)
@@ -183,6 +165,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: BondsListRequestBuilder
         """
+        from .endpoints import BondsListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return BondsListEndpoint(ctx, **ctx.defaults)
@@ -197,6 +181,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: ExchangesListRequestBuilder
         """
+        from .endpoints import ExchangesListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return ExchangesListEndpoint(ctx, **ctx.defaults)
@@ -211,6 +197,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: CryptocurrencyExchangesListRequestBuilder
         """
+        from .endpoints import CryptocurrencyExchangesListEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return CryptocurrencyExchangesListEndpoint(ctx, **ctx.defaults)
@@ -225,6 +213,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: TechnicalIndicatorsListRequestBuilder
         """
+        from .endpoints import TechnicalIndicatorsListEndpoint
+
         return TechnicalIndicatorsListEndpoint(ctx=self.ctx)
 
     def symbol_search(self, **defaults):
@@ -237,6 +227,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: SymbolSearchRequestBuilder
         """
+        from .endpoints import SymbolSearchEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return SymbolSearchEndpoint(ctx, **ctx.defaults)
@@ -250,6 +242,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: EarliestTimestampRequestBuilder
         """
+        from .endpoints import EarliestTimestampEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return EarliestTimestampEndpoint(ctx, **ctx.defaults)
@@ -263,6 +257,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: MarketStateRequestBuilder
         """
+        from .endpoints import MarketStateEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return MarketStateEndpoint(ctx, **ctx.defaults)
@@ -274,6 +270,8 @@ class TDClient:
         :returns: request factory instance
         :rtype: TimeSeries
         """
+        from .time_series import TimeSeries
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return TimeSeries(ctx)
@@ -285,6 +283,8 @@ class TDClient:
         :returns: request factory instance
         :rtype: ExchangeRate
         """
+        from .endpoints import ExchangeRateEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return ExchangeRateEndpoint(ctx, **ctx.defaults)
@@ -296,6 +296,8 @@ class TDClient:
         :returns: request factory instance
         :rtype: CurrencyConversion
         """
+        from .endpoints import CurrencyConversionEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return CurrencyConversionEndpoint(ctx, **ctx.defaults)
@@ -307,6 +309,8 @@ class TDClient:
         :returns: request factory instance
         :rtype: Quote
         """
+        from .endpoints import QuoteEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return QuoteEndpoint(ctx, **ctx.defaults)
@@ -318,6 +322,8 @@ class TDClient:
         :returns: request factory instance
         :rtype: Price
         """
+        from .endpoints import PriceEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return PriceEndpoint(ctx, **ctx.defaults)
@@ -329,6 +335,8 @@ class TDClient:
         :returns: request factory instance
         :rtype: EOD
         """
+        from .endpoints import EODEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return EODEndpoint(ctx, **ctx.defaults)
@@ -342,6 +350,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: LogoRequestBuilder
         """
+        from .endpoints import LogoEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return LogoEndpoint(ctx, **ctx.defaults)
@@ -355,6 +365,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: ProfileRequestBuilder
         """
+        from .endpoints import ProfileEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return ProfileEndpoint(ctx, **ctx.defaults)
@@ -368,6 +380,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: DividendsRequestBuilder
         """
+        from .endpoints import DividendsEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return DividendsEndpoint(ctx, **ctx.defaults)
@@ -381,6 +395,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: DividendsCalendarRequestBuilder
         """
+        from .endpoints import DividendsCalendarEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return DividendsCalendarEndpoint(ctx, **ctx.defaults)
@@ -394,6 +410,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: SplitsRequestBuilder
         """
+        from .endpoints import SplitsEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return SplitsEndpoint(ctx, **ctx.defaults)
@@ -407,6 +425,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: SplitsCalendarRequestBuilder
         """
+        from .endpoints import SplitsCalendarEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return SplitsCalendarEndpoint(ctx, **ctx.defaults)
@@ -421,6 +441,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: EarningsRequestBuilder
         """
+        from .endpoints import EarningsEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return EarningsEndpoint(ctx, **ctx.defaults)
@@ -435,6 +457,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: EarningsCalendarRequestBuilder
         """
+        from .endpoints import EarningsCalendarEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return EarningsCalendarEndpoint(ctx, **ctx.defaults)
@@ -448,6 +472,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: IPOCalendarRequestBuilder
         """
+        from .endpoints import IPOCalendarEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return IPOCalendarEndpoint(ctx, **ctx.defaults)
@@ -461,6 +487,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: StatisticsRequestBuilder
         """
+        from .endpoints import StatisticsEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return StatisticsEndpoint(ctx, **ctx.defaults)
@@ -474,6 +502,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: InsiderTransactionsRequestBuilder
         """
+        from .endpoints import InsiderTransactionsEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return InsiderTransactionsEndpoint(ctx, **ctx.defaults)
@@ -488,6 +518,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: IncomeStatementRequestBuilder
         """
+        from .endpoints import IncomeStatementEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return IncomeStatementEndpoint(ctx, **ctx.defaults)
@@ -502,6 +534,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: BalanceSheetRequestBuilder
         """
+        from .endpoints import BalanceSheetEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return BalanceSheetEndpoint(ctx, **ctx.defaults)
@@ -516,6 +550,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: CashFlowRequestBuilder
         """
+        from .endpoints import CashFlowEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return CashFlowEndpoint(ctx, **ctx.defaults)
@@ -529,6 +565,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: OptionsExpirationRequestBuilder
         """
+        from .endpoints import OptionsExpirationEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return OptionsExpirationEndpoint(ctx, **ctx.defaults)
@@ -544,6 +582,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: OptionsChainRequestBuilder
         """
+        from .endpoints import OptionsChainEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return OptionsChainEndpoint(ctx, **ctx.defaults)
@@ -557,6 +597,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: KeyExecutivesRequestBuilder
         """
+        from .endpoints import KeyExecutivesEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return KeyExecutivesEndpoint(ctx, **ctx.defaults)
@@ -572,6 +614,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: InstitutionalHoldersRequestBuilder
         """
+        from .endpoints import InstitutionalHoldersEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return InstitutionalHoldersEndpoint(ctx, **ctx.defaults)
@@ -585,6 +629,8 @@ class TDClient:
         :returns: request builder instance
         :rtype: FundHoldersRequestBuilder
         """
+        from .endpoints import FundHoldersEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return FundHoldersEndpoint(ctx, **ctx.defaults)
@@ -598,6 +644,49 @@ class TDClient:
         :returns: request builder instance
         :rtype: APIUsage
         """
+        from .endpoints import APIUsageEndpoint
+
         ctx = Context.from_context(self.ctx)
         ctx.defaults.update(defaults)
         return APIUsageEndpoint(ctx, **ctx.defaults)
+
+
+class AsyncTDClient(TDClient):
+    """
+    Client whose request builders send requests through an asynchronous
+    HTTP client, so ``as_json``, ``as_csv``, ``as_pandas`` and friends
+    return awaitables::
+
+        async with AsyncTDClient(apikey="demo") as td:
+            quotes = await asyncio.gather(
+                *(td.quote(symbol=s).as_json() for s in symbols)
+            )
+    """
+
+    http_client_class = AsyncHttpClient
+
+    def _patch_endpoints_meta(self):
+        # Metadata is loaded with blocking requests, so it needs a blocking client
+        meta_ctx = Context.from_context(self.ctx)
+        meta_ctx.http_client = DefaultHttpClient(self.ctx.base_url)
+        patch_endpoints_meta(meta_ctx)
+
+    def websocket(self, **defaults):
+        """
+        Creates asyncio websocket client, it connects on ``await ws.connect()``
+        or when used as an asynchronous context manager
+        """
+        from .websocket import AsyncTDWebSocket
+
+        ctx = Context.from_context(self.ctx)
+        ctx.defaults.update(defaults)
+        return AsyncTDWebSocket(ctx)
+
+    async def close(self):
+        await self.ctx.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,111 @@
+# coding: utf-8
+
+import threading
+
+__all__ = ("SingleFlight", "AsyncSingleFlight", "request_key")
+
+
+# This parameter does not affect the response, so it's not part of the key
+IGNORED_PARAMS = ("source",)
+
+
+def request_key(relative_url, params):
+    """
+    Returns key which is equal for requests with the same path and
+    parameters, regardless of the order and types of parameter values
+    """
+    return relative_url, tuple(sorted(
+        (k, str(v)) for k, v in (params or {}).items() if k not in IGNORED_PARAMS
+    ))
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Thread-safe coalescing of identical calls. The first caller of a key
+    runs the function, the callers which arrive while it's running wait
+    for it and receive the same result or exception.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, func):
+        with self.lock:
+            call = self.calls.get(key)
+            if call is None:
+                call = self.calls[key] = _Call()
+                self.executed += 1
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self):
+        """
+        Returns number of executed calls and number of calls which shared
+        the result of another one
+        """
+        with self.lock:
+            return {"executed": self.executed, "shared": self.shared, "in_flight": len(self.calls)}
+
+
+class AsyncSingleFlight(object):
+    """
+    Coalescing of identical calls on the event loop. The coroutine of the
+    first caller runs as a task, which is shielded from cancellation of
+    any single caller, and every caller of the key awaits it.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key, func):
+        import asyncio
+
+        task = self.calls.get(key)
+        if task is None:
+            task = self.calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda t: self._done(key, t))
+            self.executed += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self.calls.get(key) is task:
+            del self.calls[key]
+        # Callers may have been cancelled, don't report the error as unhandled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        return {"executed": self.executed, "shared": self.shared, "in_flight": len(self.calls)}
@@ -1,5 +1,12 @@
+import copy
+import asyncio
+import datetime
+import inspect
 import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .exceptions import BadRequestError
 from .mixins import AsMixin
+from .utils import ensure_endpoints_meta, parse_date, split_date_range
 
 
 __all__ = (
@@ -141,6 +148,42 @@ def get_symbol(symbol) -> (str, bool):
         raise TypeError('The type of argument "symbol" can be only: str, list, tuple')
 
 
+def split_symbols(symbol):
+    if isinstance(symbol, str):
+        return [s for s in purify_symbol(symbol).split(',') if s]
+    return list(symbol)
+
+
+def chunk_symbols(symbols, size):
+    """
+    Splits symbols into contiguous chunks of at most size symbols. Chunks are
+    balanced and never contain a single symbol, because a one-symbol request
+    is not treated as a batch one by the API.
+    """
+    size = max(size, 2)
+    count = max(1, min(-(-len(symbols) // size), len(symbols) // 2))
+    step, extra = divmod(len(symbols), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + step + (1 if i < extra else 0)
+        chunks.append(symbols[start:end])
+        start = end
+    return chunks
+
+
+class _LazyResult(object):
+    """
+    Future-like wrapper which calls the function when its result is requested
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def result(self):
+        return self.func()
+
+
 def build_url(base, endpoint, params):
     query_params = '&'.join(['{}={}'.format(k, v) for k, v in params.items()])
     return '{}{}?{}'.format(base, endpoint, query_params)
@@ -159,16 +202,118 @@ class Endpoint(object):
     # This flag indicates that the current request is a batch request
     is_batch = False
 
+    # This flag indicates that the endpoint accepts multiple symbols at once
+    supports_batch = False
+
+    # Maximum number of symbols sent in one batch request, larger lists
+    # are split into chunks which are requested concurrently
+    batch_size = 120
+
+    # Maximum number of chunks requested at the same time
+    max_workers = 8
+
+    # Known dtypes of the columns returned by the endpoint
+    dtypes = {}
+
     # Colors for chart
     colormap = {}
 
     # The fill between lines
     fill_area = {}
 
+    # Path of the API endpoint
+    _path = None
+
+    # Names of the request parameters in the order they are sent, the ones
+    # set to None are left out. Every name is an attribute of the builder.
+    _params = ()
+
+    def execute(self, format="JSON", debug=False):
+        params = {}
+        for name in self._params:
+            value = getattr(self, name)
+            if value is not None:
+                params[name] = value
+
+        if self.supports_batch and "symbol" in params:
+            params["symbol"], self.is_batch = get_symbol(params["symbol"])
+
+        params["format"] = format
+        params["apikey"] = self.ctx.apikey
+
+        if debug:
+            return build_url(self.ctx.base_url, self._path, params)
+        return self.ctx.http_client.get(self._path, params=params)
+
+    def _symbol_chunks(self):
+        if not self.supports_batch or getattr(self, "symbol", None) is None:
+            return None
+
+        symbols = split_symbols(self.symbol)
+        if len(symbols) <= self.batch_size:
+            return None
+        return chunk_symbols(symbols, self.batch_size)
+
+    def _as_json_chunked(self, chunks):
+        """
+        Requests every chunk of symbols as a separate batch request and merges
+        the results into one dict. Failure of a chunk is reported as an error
+        of each of its symbols instead of failing the whole request.
+        """
+        self.is_batch = True
+        endpoints = []
+        for chunk in chunks:
+            ep = copy.copy(self)
+            ep.symbol = chunk
+            endpoints.append(ep)
+
+        if inspect.iscoroutinefunction(self.ctx.http_client.get):
+            async def _result(result):
+                return await result if inspect.isawaitable(result) else result
+
+            async def _gather():
+                results = await asyncio.gather(
+                    *(_result(self._safe_as_json(ep)) for ep in endpoints)
+                )
+                return self._merge_chunks(chunks, results)
+            return _gather()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            results = list(executor.map(self._safe_as_json, endpoints))
+        return self._merge_chunks(chunks, results)
+
+    @staticmethod
+    def _safe_as_json(ep):
+        try:
+            result = ep.as_json()
+        except Exception as e:
+            return e
+
+        if inspect.isawaitable(result):
+            async def _await():
+                try:
+                    return await result
+                except Exception as e:
+                    return e
+            return _await()
+        return result
+
+    @staticmethod
+    def _merge_chunks(chunks, results):
+        out = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                for symbol in chunk:
+                    out[symbol] = {"status": "error", "message": str(result)}
+            else:
+                out.update(result)
+        return out
+
     def render_matplotlib(self, **kwargs):
         import matplotlib.dates as mdates
         from .renders import RENDERS_MAPPING, RenderContext
 
+        ensure_endpoints_meta()
         df = kwargs.pop('df', None)
         if df is None:
             df = self.as_pandas()
@@ -188,6 +333,7 @@ class Endpoint(object):
     def render_plotly(self, **kwargs):
         from .renders import RENDERS_MAPPING, RenderContext
 
+        ensure_endpoints_meta()
         ctx = RenderContext()
         ctx.colormap = self.colormap
         ctx.fill_area = self.fill_area
@@ -233,6 +379,24 @@ class CustomEndpoint(AsMixin, Endpoint):
 
 class TimeSeriesEndpoint(AsMixin, Endpoint):
     _name = "time_series"
+    _path = "/time_series"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code", "date", "previous_close",
+        "adjust",
+    )
+    supports_batch = True
+    dtypes = {
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+        "volume": "int64",
+        "previous_close": "float64",
+    }
+
+    # OHLCVStore consulted by as_pandas(), see with_store()
+    store = None
 
     def __init__(
         self,
@@ -273,53 +437,330 @@ class TimeSeriesEndpoint(AsMixin, Endpoint):
         self.previous_close = previous_close
         self.adjust = adjust
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-        if self.date is not None:
-            params["date"] = self.date
-        if self.previous_close is not None:
-            params["previous_close"] = self.previous_close
-        if self.adjust is not None:
-            params["adjust"] = self.adjust
+    def with_store(self, store):
+        """
+        Returns copy of the request builder which keeps bars in the store,
+        so as_pandas() requests only the bars missing there
+
+        :param store: OHLCVStore instance
+        """
+        ep = copy.copy(self)
+        ep.store = store
+        return ep
+
+    def as_pandas(self, **kwargs):
+        if self.store is None or self.date is not None or self.end_date is not None \
+                or self.previous_close or len(split_symbols(self.symbol)) > 1 \
+                or inspect.iscoroutinefunction(self.ctx.http_client.get):
+            return super(TimeSeriesEndpoint, self).as_pandas(**kwargs)
+        return self._as_pandas_stored(**kwargs)
+
+    def _as_pandas_stored(self, **kwargs):
+        """
+        Serves the request from the store, requesting only the bars after
+        the latest stored one. The latest stored bar is requested again,
+        since it may have been incomplete.
+        """
+        store = self.store
+        key = store.key(
+            self.symbol, self.interval, timezone=self.timezone, adjust=self.adjust,
+            exchange=self.exchange, mic_code=self.mic_code, prepost=self.prepost,
+        )
+        outputsize = int(self.outputsize or 30)
+        start_date = parse_date(self.start_date) if self.start_date is not None else None
+
+        stored = store.read(key)
+        if stored is not None and len(stored):
+            if start_date is not None:
+                covered = stored.index[0] <= start_date
+            else:
+                covered = len(stored) >= outputsize
+        else:
+            covered = False
+
+        ep = copy.copy(self)
+        ep.store = None
+        if not covered:
+            df = ep.as_pandas(**kwargs)
+            # Stored bars have to stay contiguous, so a window which doesn't
+            # overlap them replaces them
+            if (stored is not None and len(stored) and len(df)
+                    and df.index.min() <= stored.index[-1] and df.index.max() >= stored.index[0]):
+                store.append(key, df)
+            else:
+                store.write(key, df)
+            return df
+
+        ep.start_date = stored.index[-1].strftime("%Y-%m-%d %H:%M:%S")
+        ep.outputsize = 5000
+        try:
+            tail = ep.as_pandas(**kwargs)
+        except BadRequestError:
+            # No bars since the latest stored one
+            tail = None
+
+        if tail is not None and len(tail) >= ep.outputsize:
+            # The gap is larger than a single request, so it's not filled
+            ep = copy.copy(self)
+            ep.store = None
+            df = ep.as_pandas(**kwargs)
+            store.write(key, df)
+            return df
+
+        if tail is not None and len(tail):
+            stored = store.append(key, tail)
+
+        if start_date is not None:
+            stored = stored[stored.index >= start_date]
+        stored = stored.iloc[-outputsize:]
+        if self.order != "asc":
+            stored = stored.iloc[::-1]
+        return stored
+
+    def _history_endpoints(self, page_size):
+        """
+        Creates request builders for consecutive windows between start_date
+        and end_date (now by default), each holding up to page_size bars.
+        """
+        if self.start_date is None:
+            raise ValueError("Parameter 'start_date' is required to fetch the history")
+        if len(split_symbols(self.symbol)) > 1:
+            raise ValueError("History can not be fetched for batch requests")
+
+        end_date = self.end_date or datetime.datetime.now()
+        windows = split_date_range(self.start_date, end_date, self.interval, page_size)
+        if self.order == "desc":
+            windows.reverse()
+
+        endpoints = []
+        for start, end in windows:
+            ep = copy.copy(self)
+            ep.start_date = start.strftime("%Y-%m-%d %H:%M:%S")
+            ep.end_date = end.strftime("%Y-%m-%d %H:%M:%S")
+            ep.outputsize = page_size
+            endpoints.append(ep)
+        return endpoints
+
+    @staticmethod
+    def _history_page(ep):
+        rows = ep.as_json()
+        if not rows:
+            return None
+        return ep._parse_pandas(rows)
+
+    def iter_history(self, page_size=5000, max_workers=4):
+        """
+        Fetches all bars between start_date and end_date, splitting the range
+        into pages of page_size bars which are requested in parallel.
+        Yields a DataFrame per page as soon as it arrives, rows at the
+        boundaries of pages are yielded only once.
+
+        :param page_size: Number of bars requested per page, at most 5000
+        :param max_workers: Number of pages requested at the same time
+        """
+        import pandas as pd
+
+        if inspect.iscoroutinefunction(self.ctx.http_client.get):
+            raise TypeError(
+                "iter_history() needs a blocking HTTP client, "
+                "await as_pandas_history() with an asynchronous one"
+            )
 
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/time_series"
+        endpoints = self._history_endpoints(page_size)
+        if not endpoints:
+            return
+
+        boundaries = set()
+        for ep in endpoints:
+            boundaries.update((pd.Timestamp(ep.start_date), pd.Timestamp(ep.end_date)))
+        seen_boundaries = set()
+
+        errors = []
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(endpoints)))
+        try:
+            futures = [executor.submit(self._history_page, ep) for ep in endpoints]
+            for future in as_completed(futures):
+                try:
+                    df = future.result()
+                except BadRequestError as e:
+                    # Windows without any bars (e.g. weekends) are reported as errors
+                    errors.append(e)
+                    continue
+                if df is None:
+                    continue
+
+                edges = df.index.isin(boundaries)
+                if edges.any():
+                    duplicated = edges & df.index.isin(seen_boundaries)
+                    seen_boundaries.update(df.index[edges])
+                    df = df[~duplicated]
+                yield df
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if len(errors) == len(endpoints):
+            raise errors[0]
+
+    def iter_pages(self, page_size=5000, as_pandas=False, prefetch=True):
+        """
+        Fetches all bars between start_date and end_date one page at a time
+        and yields each page as a list of rows, or as a DataFrame if
+        as_pandas is set. Pages follow the order parameter and a page is
+        requested only when the previous one has been consumed (or while it
+        is being consumed, if prefetch is set), so memory usage does not
+        depend on the length of the range.
+
+        :param page_size: Number of bars requested per page, at most 5000
+        :param as_pandas: Yield DataFrames instead of lists of rows
+        :param prefetch: Request the next page in background
+        """
+        if inspect.iscoroutinefunction(self.ctx.http_client.get):
+            raise TypeError(
+                "iter_pages() needs a blocking HTTP client, "
+                "use aiter_pages() with an asynchronous one"
+            )
 
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
+        endpoints = self._history_endpoints(page_size)
+        if not endpoints:
+            return
+
+        errors = []
+        prev_edges = set()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(endpoints[0].as_json)
+            for i in range(len(endpoints)):
+                try:
+                    rows = future.result()
+                except BadRequestError as e:
+                    # Windows without any bars (e.g. weekends) are reported as errors
+                    errors.append(e)
+                    rows = []
+                future = None
+
+                if i + 1 < len(endpoints):
+                    if prefetch:
+                        future = executor.submit(endpoints[i + 1].as_json)
+                    else:
+                        future = _LazyResult(endpoints[i + 1].as_json)
+
+                rows, prev_edges = self._trim_page(rows, prev_edges)
+                if not rows:
+                    continue
+
+                yield self._parse_pandas(rows) if as_pandas else rows
+                del rows
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if len(errors) == len(endpoints):
+            raise errors[0]
+
+    async def aiter_pages(self, page_size=5000, as_pandas=False, prefetch=True):
+        """
+        Same as iter_pages, but for an asynchronous HTTP client::
+
+            async for rows in ts.price_endpoint.aiter_pages():
+                ...
+        """
+        endpoints = self._history_endpoints(page_size)
+        if not endpoints:
+            return
+
+        errors = []
+
+        async def _page(ep):
+            try:
+                return await ep.as_json()
+            except BadRequestError as e:
+                # Windows without any bars (e.g. weekends) are reported as errors
+                errors.append(e)
+                return []
+
+        prev_edges = set()
+        pending = None
+        try:
+            for i, ep in enumerate(endpoints):
+                rows = await (pending if pending is not None else _page(ep))
+                pending = None
+                if prefetch and i + 1 < len(endpoints):
+                    pending = asyncio.ensure_future(_page(endpoints[i + 1]))
+
+                rows, prev_edges = self._trim_page(rows, prev_edges)
+                if not rows:
+                    continue
+
+                yield self._parse_pandas(rows) if as_pandas else rows
+                del rows
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        if len(errors) == len(endpoints):
+            raise errors[0]
+
+    @staticmethod
+    def _trim_page(rows, prev_edges):
+        """
+        Returns rows of the page without the first one if it repeats the last
+        row of the previous page, since adjacent windows share their
+        boundary, and the edges of the page
+        """
+        if not rows:
+            return rows, set()
+
+        first, last = parse_date(rows[0]["datetime"]), parse_date(rows[-1]["datetime"])
+        if first in prev_edges:
+            rows = rows[1:]
+        return rows, {first, last}
+
+    def as_pandas_history(self, page_size=5000, max_workers=4):
+        """
+        Same as iter_history, but returns all pages as one DataFrame ordered
+        according to the order parameter. If the endpoint uses an
+        asynchronous HTTP client, returns a coroutine.
+        """
+        if inspect.iscoroutinefunction(self.ctx.http_client.get):
+            return self._as_pandas_history_async(self._history_endpoints(page_size), max_workers)
+
+        pages = list(self.iter_history(page_size=page_size, max_workers=max_workers))
+        return self._concat_history(pages)
+
+    async def _as_pandas_history_async(self, endpoints, max_workers):
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _page(ep):
+            async with semaphore:
+                try:
+                    rows = await ep.as_json()
+                except BadRequestError as e:
+                    # Windows without any bars (e.g. weekends) are reported as errors
+                    return e
+            return ep._parse_pandas(rows) if rows else None
+
+        results = await asyncio.gather(*(_page(ep) for ep in endpoints))
+        errors = [r for r in results if isinstance(r, BadRequestError)]
+        if errors and len(errors) == len(endpoints):
+            raise errors[0]
+
+        pages = [r for r in results if r is not None and not isinstance(r, BadRequestError)]
+        return self._concat_history(pages)
+
+    def _concat_history(self, pages):
+        import pandas as pd
+
+        if not pages:
+            return pd.DataFrame()
+        df = pd.concat(pages)
+        # Adjacent windows share their boundary, so its row may be returned twice
+        df = df[~df.index.duplicated()]
+        return df.sort_index(ascending=self.order == "asc")
 
 
 class ExchangeRateEndpoint(AsMixin, Endpoint):
     _name = "exchange_rate"
+    _path = "/exchange_rate"
+    _params = ("symbol", "date", "dp", "timezone")
 
     def __init__(self,
                  ctx,
@@ -334,29 +775,11 @@ class ExchangeRateEndpoint(AsMixin, Endpoint):
         self.dp = dp
         self.timezone = timezone
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.date is not None:
-            params["date"] = self.date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/exchange_rate"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CurrencyConversionEndpoint(AsMixin, Endpoint):
     _name = "currency_conversion"
+    _path = "/currency_conversion"
+    _params = ("symbol", "amount", "date", "dp", "timezone")
 
     def __init__(self,
                  ctx,
@@ -373,28 +796,6 @@ class CurrencyConversionEndpoint(AsMixin, Endpoint):
         self.dp = dp
         self.timezone = timezone
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.amount is not None:
-            params["amount"] = self.amount
-        if self.date is not None:
-            params["date"] = self.date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/currency_conversion"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class QuoteEndpoint(AsMixin, Endpoint):
     _name = "quote"
@@ -469,6 +870,9 @@ class QuoteEndpoint(AsMixin, Endpoint):
 
 class PriceEndpoint(AsMixin, Endpoint):
     _name = "price"
+    _path = "/price"
+    _params = ("symbol", "exchange", "country", "type", "dp", "prepost")
+    supports_batch = True
 
     def __init__(self,
                  ctx,
@@ -489,33 +893,12 @@ class PriceEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/price"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class EODEndpoint(AsMixin, Endpoint):
     _name = "eod"
+    _path = "/eod"
+    _params = ("symbol", "exchange", "country", "type", "dp", "prepost", "mic_code", "date")
+    supports_batch = True
 
     def __init__(self,
                  ctx,
@@ -538,54 +921,21 @@ class EODEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.date = date
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-        if self.date is not None:
-            params["date"] = self.date
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/eod"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class TechIndicatorsMetaEndpoint(AsMixin, Endpoint):
     _name = "technical_indicators"
+    _path = "/technical_indicators"
 
     def __init__(self, ctx):
         self.ctx = ctx
 
-    def execute(self, format="JSON", debug=False):
-        params = {}
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/technical_indicators"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class StocksListEndpoint(AsMixin, Endpoint):
     _name = "stocks"
+    _path = "/stocks"
+    _params = (
+        "symbol", "exchange", "country", "type", "mic_code", "show_plan", "include_delisted",
+    )
 
     def __init__(self,
                  ctx,
@@ -606,54 +956,19 @@ class StocksListEndpoint(AsMixin, Endpoint):
         self.show_plan = show_plan
         self.include_delisted = include_delisted
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-        if self.show_plan is not None:
-            params["show_plan"] = self.show_plan
-        if self.include_delisted is not None:
-            params["include_delisted"] = self.include_delisted
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/stocks"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class StockExchangesListEndpoint(AsMixin, Endpoint):
     _name = "stock_exchanges"
+    _path = "/stock_exchanges"
 
     def __init__(self, ctx):
         self.ctx = ctx
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/stock_exchanges"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ForexPairsListEndpoint(AsMixin, Endpoint):
     _name = "forex_pairs"
+    _path = "/forex_pairs"
+    _params = ("symbol", "currency_base", "currency_quote")
 
     def __init__(self,
                  ctx,
@@ -666,27 +981,11 @@ class ForexPairsListEndpoint(AsMixin, Endpoint):
         self.currency_base = currency_base
         self.currency_quote = currency_quote
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.currency_base is not None:
-            params["currency_base"] = self.currency_base
-        if self.currency_quote is not None:
-            params["currency_quote"] = self.currency_quote
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/forex_pairs"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CryptocurrenciesListEndpoint(AsMixin, Endpoint):
     _name = "cryptocurrencies"
+    _path = "/cryptocurrencies"
+    _params = ("symbol", "exchange", "currency_base", "currency_quote")
 
     def __init__(self,
                  ctx,
@@ -701,29 +1000,11 @@ class CryptocurrenciesListEndpoint(AsMixin, Endpoint):
         self.currency_base = currency_base
         self.currency_quote = currency_quote
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.currency_base is not None:
-            params["currency_base"] = self.currency_base
-        if self.currency_quote is not None:
-            params["currency_quote"] = self.currency_quote
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/cryptocurrencies"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ETFListEndpoint(AsMixin, Endpoint):
     _name = "etf"
+    _path = "/etf"
+    _params = ("symbol", "exchange", "country", "mic_code", "show_plan", "include_delisted")
 
     def __init__(self,
                  ctx,
@@ -742,33 +1023,11 @@ class ETFListEndpoint(AsMixin, Endpoint):
         self.show_plan = show_plan
         self.include_delisted = include_delisted
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-        if self.show_plan is not None:
-            params["show_plan"] = self.show_plan
-        if self.include_delisted is not None:
-            params["include_delisted"] = self.include_delisted
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/etf"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class IndicesListEndpoint(AsMixin, Endpoint):
     _name = "indices"
+    _path = "/indices"
+    _params = ("symbol", "exchange", "country", "mic_code", "show_plan", "include_delisted")
 
     def __init__(self,
                  ctx,
@@ -787,33 +1046,14 @@ class IndicesListEndpoint(AsMixin, Endpoint):
         self.show_plan = show_plan
         self.include_delisted = include_delisted
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-        if self.show_plan is not None:
-            params["show_plan"] = self.show_plan
-        if self.include_delisted is not None:
-            params["include_delisted"] = self.include_delisted
 
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/indices"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
-
-class FundsListEndpoint(AsMixin, Endpoint):
-    _name = "funds"
+class FundsListEndpoint(AsMixin, Endpoint):
+    _name = "funds"
+    _path = "/funds"
+    _params = (
+        "symbol", "exchange", "country", "type", "show_plan", "include_delisted", "page",
+        "outputsize",
+    )
 
     def __init__(self,
                  ctx,
@@ -836,37 +1076,14 @@ class FundsListEndpoint(AsMixin, Endpoint):
         self.page = page
         self.outputsize = outputsize
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.show_plan is not None:
-            params["show_plan"] = self.show_plan
-        if self.include_delisted is not None:
-            params["include_delisted"] = self.include_delisted
-        if self.page is not None:
-            params["page"] = self.page
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/funds"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class BondsListEndpoint(AsMixin, Endpoint):
     _name = "bonds"
+    _path = "/bonds"
+    _params = (
+        "symbol", "exchange", "country", "type", "show_plan", "include_delisted", "page",
+        "outputsize",
+    )
 
     def __init__(self,
                  ctx,
@@ -889,37 +1106,11 @@ class BondsListEndpoint(AsMixin, Endpoint):
         self.page = page
         self.outputsize = outputsize
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.show_plan is not None:
-            params["show_plan"] = self.show_plan
-        if self.include_delisted is not None:
-            params["include_delisted"] = self.include_delisted
-        if self.page is not None:
-            params["page"] = self.page
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/bonds"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ExchangesListEndpoint(AsMixin, Endpoint):
     _name = "exchanges"
+    _path = "/exchanges"
+    _params = ("name", "code", "country", "type", "show_plan")
 
     def __init__(self,
                  ctx,
@@ -936,47 +1127,14 @@ class ExchangesListEndpoint(AsMixin, Endpoint):
         self.type = type
         self.show_plan = show_plan
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.name is not None:
-            params["name"] = self.name
-        if self.code is not None:
-            params["code"] = self.code
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.show_plan is not None:
-            params["show_plan"] = self.show_plan
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/exchanges"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CryptocurrencyExchangesListEndpoint(AsMixin, Endpoint):
     _name = "cryptocurrency_exchanges"
+    _path = "/cryptocurrency_exchanges"
 
     def __init__(self, ctx):
         self.ctx = ctx
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/cryptocurrency_exchanges"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class TechnicalIndicatorsListEndpoint(AsMixin, Endpoint):
     _name = "technical_indicators"
@@ -1031,6 +1189,8 @@ class SymbolSearchEndpoint(AsMixin, Endpoint):
 
 class EarliestTimestampEndpoint(AsMixin, Endpoint):
     _name = "earliest_timestamp"
+    _path = "/earliest_timestamp"
+    _params = ("symbol", "interval", "exchange", "mic_code", "timezone")
 
     def __init__(self,
                  ctx,
@@ -1047,31 +1207,11 @@ class EarliestTimestampEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.timezone = timezone
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/earliest_timestamp"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MarketStateEndpoint(AsMixin, Endpoint):
     _name = "market_state"
+    _path = "/market_state"
+    _params = ("exchange", "code", "country")
 
     def __init__(self,
                  ctx,
@@ -1084,27 +1224,11 @@ class MarketStateEndpoint(AsMixin, Endpoint):
         self.code = code
         self.country = country
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.code is not None:
-            params["code"] = self.code
-        if self.country is not None:
-            params["country"] = self.country
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/market_state"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class LogoEndpoint(AsMixin, Endpoint):
     _name = "logo"
+    _path = "/logo"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1120,29 +1244,11 @@ class LogoEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "logo"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/logo"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ProfileEndpoint(AsMixin, Endpoint):
     _name = "profile"
+    _path = "/profile"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1158,29 +1264,11 @@ class ProfileEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "profile"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/profile"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class DividendsEndpoint(AsMixin, Endpoint):
     _name = "dividends"
+    _path = "/dividends"
+    _params = ("symbol", "exchange", "country", "range", "start_date", "end_date", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1202,35 +1290,11 @@ class DividendsEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "dividends"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.range is not None:
-            params["range"] = self.range
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/dividends"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class DividendsCalendarEndpoint(AsMixin, Endpoint):
     _name = "dividends_calendar"
+    _path = "/dividends_calendar"
+    _params = ("symbol", "exchange", "country", "start_date", "end_date", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1250,33 +1314,11 @@ class DividendsCalendarEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "dividends_calendar"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/dividends_calendar"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class SplitsEndpoint(AsMixin, Endpoint):
     _name = "splits"
+    _path = "/splits"
+    _params = ("symbol", "exchange", "country", "range", "start_date", "end_date")
 
     def __init__(self,
                  ctx,
@@ -1296,33 +1338,11 @@ class SplitsEndpoint(AsMixin, Endpoint):
         self.end_date = end_date
         self.method = "splits"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.range is not None:
-            params["range"] = self.range
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/splits"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class SplitsCalendarEndpoint(AsMixin, Endpoint):
     _name = "splits_calendar"
+    _path = "/splits_calendar"
+    _params = ("symbol", "exchange", "country", "start_date", "end_date", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1342,33 +1362,14 @@ class SplitsCalendarEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "splits_calendar"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/splits_calendar"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class EarningsEndpoint(AsMixin, Endpoint):
     _name = "earnings"
+    _path = "/earnings"
+    _params = (
+        "symbol", "exchange", "country", "period", "outputsize", "start_date", "end_date",
+        "mic_code", "dp", "type",
+    )
 
     def __init__(self,
                  ctx,
@@ -1396,41 +1397,11 @@ class EarningsEndpoint(AsMixin, Endpoint):
         self.type = type
         self.method = "earnings"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.period is not None:
-            params["period"] = self.period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.type is not None:
-            params["type"] = self.type
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/earnings"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class EarningsCalendarEndpoint(AsMixin, Endpoint):
     _name = "earnings_calendar"
+    _path = "/earnings_calendar"
+    _params = ("symbol", "exchange", "country", "period", "start_date", "end_date", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1452,35 +1423,11 @@ class EarningsCalendarEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "earnings_calendar"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.period is not None:
-            params["period"] = self.period
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/earnings_calendar"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class IPOCalendarEndpoint(AsMixin, Endpoint):
     _name = "ipo_calendar"
+    _path = "/ipo_calendar"
+    _params = ("symbol", "exchange", "country", "start_date", "end_date")
 
     def __init__(self,
                  ctx,
@@ -1498,31 +1445,11 @@ class IPOCalendarEndpoint(AsMixin, Endpoint):
         self.end_date = end_date
         self.method = "ipo_calendar"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ipo_calendar"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class StatisticsEndpoint(AsMixin, Endpoint):
     _name = "statistics"
+    _path = "/statistics"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1538,29 +1465,11 @@ class StatisticsEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "statistics"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/statistics"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class InsiderTransactionsEndpoint(AsMixin, Endpoint):
     _name = "insider_transactions"
+    _path = "/insider_transactions"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1576,29 +1485,11 @@ class InsiderTransactionsEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "insider_transactions"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/insider_transactions"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class IncomeStatementEndpoint(AsMixin, Endpoint):
     _name = "income_statement"
+    _path = "/income_statement"
+    _params = ("symbol", "exchange", "country", "period", "start_date", "end_date", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1620,35 +1511,11 @@ class IncomeStatementEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "income_statement"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.period is not None:
-            params["period"] = self.period
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/income_statement"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class BalanceSheetEndpoint(AsMixin, Endpoint):
     _name = "balance_sheet"
+    _path = "/balance_sheet"
+    _params = ("symbol", "exchange", "country", "period", "start_date", "end_date", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1670,35 +1537,11 @@ class BalanceSheetEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "balance_sheet"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.period is not None:
-            params["period"] = self.period
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/balance_sheet"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CashFlowEndpoint(AsMixin, Endpoint):
     _name = "cash_flow"
+    _path = "/cash_flow"
+    _params = ("symbol", "exchange", "country", "period", "start_date", "end_date", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1720,35 +1563,11 @@ class CashFlowEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "cash_flow"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.period is not None:
-            params["period"] = self.period
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/cash_flow"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class OptionsExpirationEndpoint(AsMixin, Endpoint):
     _name = "options_expiration"
+    _path = "/options/expiration"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1764,29 +1583,11 @@ class OptionsExpirationEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "options_expiration"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/options/expiration"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class OptionsChainEndpoint(AsMixin, Endpoint):
     _name = "options_chain"
+    _path = "/options/chain"
+    _params = ("symbol", "exchange", "country", "expiration_date", "option_id", "side", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1808,35 +1609,11 @@ class OptionsChainEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "options_chain"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.expiration_date is not None:
-            params["expiration_date"] = self.expiration_date
-        if self.option_id is not None:
-            params["option_id"] = self.option_id
-        if self.side is not None:
-            params["side"] = self.side
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/options/chain"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class KeyExecutivesEndpoint(AsMixin, Endpoint):
     _name = "key_executives"
+    _path = "/key_executives"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1852,29 +1629,11 @@ class KeyExecutivesEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "key_executives"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/key_executives"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class InstitutionalHoldersEndpoint(AsMixin, Endpoint):
     _name = "institutional_holders"
+    _path = "/institutional_holders"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1890,29 +1649,11 @@ class InstitutionalHoldersEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "institutional_holders"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/institutional_holders"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class FundHoldersEndpoint(AsMixin, Endpoint):
     _name = "fund_holders"
+    _path = "/fund_holders"
+    _params = ("symbol", "exchange", "country", "mic_code")
 
     def __init__(self,
                  ctx,
@@ -1928,46 +1669,23 @@ class FundHoldersEndpoint(AsMixin, Endpoint):
         self.mic_code = mic_code
         self.method = "fund_holders"
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"] = self.symbol
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/fund_holders"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class APIUsageEndpoint(AsMixin, Endpoint):
     _name = "api_usage"
+    _path = "/api_usage"
 
     def __init__(self, ctx):
         self.ctx = ctx
 
-    def execute(self, format="JSON", debug=False):
-        params = {}
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/api_usage"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ADEndpoint(AsMixin, Endpoint):
     _name = "ad"
+    _path = "/ad"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2003,47 +1721,15 @@ class ADEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ad"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ADOSCEndpoint(AsMixin, Endpoint):
     _name = "adosc"
+    _path = "/adosc"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "fast_period", "slow_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2083,51 +1769,15 @@ class ADOSCEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.fast_period is not None:
-            params["fast_period"] = self.fast_period
-        if self.slow_period is not None:
-            params["slow_period"] = self.slow_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/adosc"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ADXEndpoint(AsMixin, Endpoint):
     _name = "adx"
+    _path = "/adx"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2165,49 +1815,15 @@ class ADXEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/adx"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ADXREndpoint(AsMixin, Endpoint):
     _name = "adxr"
+    _path = "/adxr"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2236,58 +1852,25 @@ class ADXREndpoint(AsMixin, Endpoint):
         self.country = country
         self.type = type
         self.time_period = time_period
-        self.outputsize = outputsize
-        self.start_date = start_date
-        self.end_date = end_date
-        self.dp = dp
-        self.timezone = timezone
-        self.order = order
-        self.prepost = prepost
-        self.mic_code = mic_code
-
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/adxr"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
+        self.outputsize = outputsize
+        self.start_date = start_date
+        self.end_date = end_date
+        self.dp = dp
+        self.timezone = timezone
+        self.order = order
+        self.prepost = prepost
+        self.mic_code = mic_code
 
 
 class APOEndpoint(AsMixin, Endpoint):
     _name = "apo"
+    _path = "/apo"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "fast_period",
+        "slow_period", "ma_type", "outputsize", "start_date", "end_date", "dp", "timezone",
+        "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2331,55 +1914,15 @@ class APOEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.fast_period is not None:
-            params["fast_period"] = self.fast_period
-        if self.slow_period is not None:
-            params["slow_period"] = self.slow_period
-        if self.ma_type is not None:
-            params["ma_type"] = self.ma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/apo"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class AROONEndpoint(AsMixin, Endpoint):
     _name = "aroon"
+    _path = "/aroon"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2417,49 +1960,15 @@ class AROONEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/aroon"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class AROONOSCEndpoint(AsMixin, Endpoint):
     _name = "aroonosc"
+    _path = "/aroonosc"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2497,49 +2006,15 @@ class AROONOSCEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/aroonosc"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ATREndpoint(AsMixin, Endpoint):
     _name = "atr"
+    _path = "/atr"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2577,49 +2052,15 @@ class ATREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/atr"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class AVGPRICEEndpoint(AsMixin, Endpoint):
     _name = "avgprice"
+    _path = "/avgprice"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2655,47 +2096,16 @@ class AVGPRICEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/avgprice"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class BBANDSEndpoint(AsMixin, Endpoint):
     _name = "bbands"
+    _path = "/bbands"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period", "sd",
+        "ma_type", "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost",
+        "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2739,55 +2149,16 @@ class BBANDSEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.sd is not None:
-            params["sd"] = self.sd
-        if self.ma_type is not None:
-            params["ma_type"] = self.ma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/bbands"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class BETAEndpoint(AsMixin, Endpoint):
     _name = "beta"
+    _path = "/beta"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type_1", "series_type_2",
+        "time_period", "outputsize", "start_date", "end_date", "dp", "timezone", "order",
+        "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2829,53 +2200,16 @@ class BETAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type_1 is not None:
-            params["series_type_1"] = self.series_type_1
-        if self.series_type_2 is not None:
-            params["series_type_2"] = self.series_type_2
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/beta"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class PercentBEndpoint(AsMixin, Endpoint):
     _name = "percent_b"
+    _path = "/percent_b"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period", "sd",
+        "ma_type", "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost",
+        "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -2919,55 +2253,15 @@ class PercentBEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.sd is not None:
-            params["sd"] = self.sd
-        if self.ma_type is not None:
-            params["ma_type"] = self.ma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/percent_b"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class PivotPointsHLEndpoint(AsMixin, Endpoint):
     _name = "pivot_points_hl"
+    _path = "/pivot_points_hl"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3005,49 +2299,15 @@ class PivotPointsHLEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/pivot_points_hl"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class BOPEndpoint(AsMixin, Endpoint):
     _name = "bop"
+    _path = "/bop"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3083,47 +2343,15 @@ class BOPEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/bop"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CCIEndpoint(AsMixin, Endpoint):
     _name = "cci"
+    _path = "/cci"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3161,49 +2389,15 @@ class CCIEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/cci"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CEILEndpoint(AsMixin, Endpoint):
     _name = "ceil"
+    _path = "/ceil"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3241,49 +2435,15 @@ class CEILEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ceil"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CMOEndpoint(AsMixin, Endpoint):
     _name = "cmo"
+    _path = "/cmo"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3323,51 +2483,16 @@ class CMOEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/cmo"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class COPPOCKEndpoint(AsMixin, Endpoint):
     _name = "coppock"
+    _path = "/coppock"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "long_roc_period",
+        "short_roc_period", "wma_period", "outputsize", "start_date", "end_date", "dp", "timezone",
+        "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3411,55 +2536,15 @@ class COPPOCKEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.long_roc_period is not None:
-            params["long_roc_period"] = self.long_roc_period
-        if self.short_roc_period is not None:
-            params["short_roc_period"] = self.short_roc_period
-        if self.wma_period is not None:
-            params["wma_period"] = self.wma_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/coppock"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class CEILEndpoint(AsMixin, Endpoint):
     _name = "ceil"
+    _path = "/ceil"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3497,49 +2582,15 @@ class CEILEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ceil"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class DEMAEndpoint(AsMixin, Endpoint):
     _name = "dema"
+    _path = "/dema"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3570,60 +2621,24 @@ class DEMAEndpoint(AsMixin, Endpoint):
         self.type = type
         self.series_type = series_type
         self.time_period = time_period
-        self.outputsize = outputsize
-        self.start_date = start_date
-        self.end_date = end_date
-        self.dp = dp
-        self.timezone = timezone
-        self.order = order
-        self.prepost = prepost
-        self.mic_code = mic_code
-
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/dema"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
+        self.outputsize = outputsize
+        self.start_date = start_date
+        self.end_date = end_date
+        self.dp = dp
+        self.timezone = timezone
+        self.order = order
+        self.prepost = prepost
+        self.mic_code = mic_code
 
 
 class DXEndpoint(AsMixin, Endpoint):
     _name = "dx"
+    _path = "/dx"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3661,49 +2676,15 @@ class DXEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/dx"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class EMAEndpoint(AsMixin, Endpoint):
     _name = "ema"
+    _path = "/ema"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3743,51 +2724,15 @@ class EMAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ema"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class EXPEndpoint(AsMixin, Endpoint):
     _name = "exp"
+    _path = "/exp"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3825,49 +2770,15 @@ class EXPEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/exp"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class FLOOREndpoint(AsMixin, Endpoint):
     _name = "floor"
+    _path = "/floor"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3905,49 +2816,15 @@ class FLOOREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/floor"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HEIKINASHICANDLESEndpoint(AsMixin, Endpoint):
     _name = "heikinashicandles"
+    _path = "/heikinashicandles"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -3983,47 +2860,15 @@ class HEIKINASHICANDLESEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/heikinashicandles"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HLC3Endpoint(AsMixin, Endpoint):
     _name = "hlc3"
+    _path = "/hlc3"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4059,47 +2904,15 @@ class HLC3Endpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/hlc3"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HT_DCPERIODEndpoint(AsMixin, Endpoint):
     _name = "ht_dcperiod"
+    _path = "/ht_dcperiod"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4137,49 +2950,15 @@ class HT_DCPERIODEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ht_dcperiod"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HT_DCPHASEEndpoint(AsMixin, Endpoint):
     _name = "ht_dcphase"
+    _path = "/ht_dcphase"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4217,49 +2996,15 @@ class HT_DCPHASEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ht_dcphase"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HT_PHASOREndpoint(AsMixin, Endpoint):
     _name = "ht_phasor"
+    _path = "/ht_phasor"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4297,49 +3042,15 @@ class HT_PHASOREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ht_phasor"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HT_SINEEndpoint(AsMixin, Endpoint):
     _name = "ht_sine"
+    _path = "/ht_sine"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4377,49 +3088,15 @@ class HT_SINEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ht_sine"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HT_TRENDLINEEndpoint(AsMixin, Endpoint):
     _name = "ht_trendline"
+    _path = "/ht_trendline"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4457,49 +3134,15 @@ class HT_TRENDLINEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ht_trendline"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class HT_TRENDMODEEndpoint(AsMixin, Endpoint):
     _name = "ht_trendmode"
+    _path = "/ht_trendmode"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4537,49 +3180,17 @@ class HT_TRENDMODEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ht_trendmode"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ICHIMOKUEndpoint(AsMixin, Endpoint):
     _name = "ichimoku"
+    _path = "/ichimoku"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "conversion_line_period",
+        "base_line_period", "leading_span_b_period", "lagging_span_period",
+        "include_ahead_span_period", "outputsize", "start_date", "end_date", "dp", "timezone",
+        "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4625,57 +3236,15 @@ class ICHIMOKUEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.conversion_line_period is not None:
-            params["conversion_line_period"] = self.conversion_line_period
-        if self.base_line_period is not None:
-            params["base_line_period"] = self.base_line_period
-        if self.leading_span_b_period is not None:
-            params["leading_span_b_period"] = self.leading_span_b_period
-        if self.lagging_span_period is not None:
-            params["lagging_span_period"] = self.lagging_span_period
-        if self.include_ahead_span_period is not None:
-            params["include_ahead_span_period"] = self.include_ahead_span_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ichimoku"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class KAMAEndpoint(AsMixin, Endpoint):
     _name = "kama"
+    _path = "/kama"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4715,51 +3284,16 @@ class KAMAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/kama"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class KELTNEREndpoint(AsMixin, Endpoint):
     _name = "keltner"
+    _path = "/keltner"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "atr_time_period", "multiplier", "ma_type", "outputsize", "start_date", "end_date", "dp",
+        "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4805,57 +3339,17 @@ class KELTNEREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.atr_time_period is not None:
-            params["atr_time_period"] = self.atr_time_period
-        if self.multiplier is not None:
-            params["multiplier"] = self.multiplier
-        if self.ma_type is not None:
-            params["ma_type"] = self.ma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/keltner"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class KSTEndpoint(AsMixin, Endpoint):
     _name = "kst"
+    _path = "/kst"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "roc_period_1", "roc_period_2",
+        "roc_period_3", "roc_period_4", "signal_period", "sma_period_1", "sma_period_2",
+        "sma_period_3", "sma_period_4", "outputsize", "start_date", "end_date", "dp", "timezone",
+        "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -4900,74 +3394,24 @@ class KSTEndpoint(AsMixin, Endpoint):
         self.sma_period_2 = sma_period_2
         self.sma_period_3 = sma_period_3
         self.sma_period_4 = sma_period_4
-        self.outputsize = outputsize
-        self.start_date = start_date
-        self.end_date = end_date
-        self.dp = dp
-        self.timezone = timezone
-        self.order = order
-        self.prepost = prepost
-        self.mic_code = mic_code
-
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.roc_period_1 is not None:
-            params["roc_period_1"] = self.roc_period_1
-        if self.roc_period_2 is not None:
-            params["roc_period_2"] = self.roc_period_2
-        if self.roc_period_3 is not None:
-            params["roc_period_3"] = self.roc_period_3
-        if self.roc_period_4 is not None:
-            params["roc_period_4"] = self.roc_period_4
-        if self.signal_period is not None:
-            params["signal_period"] = self.signal_period
-        if self.sma_period_1 is not None:
-            params["sma_period_1"] = self.sma_period_1
-        if self.sma_period_2 is not None:
-            params["sma_period_2"] = self.sma_period_2
-        if self.sma_period_3 is not None:
-            params["sma_period_3"] = self.sma_period_3
-        if self.sma_period_4 is not None:
-            params["sma_period_4"] = self.sma_period_4
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/kst"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
+        self.outputsize = outputsize
+        self.start_date = start_date
+        self.end_date = end_date
+        self.dp = dp
+        self.timezone = timezone
+        self.order = order
+        self.prepost = prepost
+        self.mic_code = mic_code
 
 
 class LINEARREGEndpoint(AsMixin, Endpoint):
     _name = "linearreg"
+    _path = "/linearreg"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5007,51 +3451,15 @@ class LINEARREGEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/linearreg"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class LINEARREGANGLEEndpoint(AsMixin, Endpoint):
     _name = "linearregangle"
+    _path = "/linearregangle"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5091,51 +3499,15 @@ class LINEARREGANGLEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/linearregangle"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class LINEARREGINTERCEPTEndpoint(AsMixin, Endpoint):
     _name = "linearregintercept"
+    _path = "/linearregintercept"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5175,51 +3547,15 @@ class LINEARREGINTERCEPTEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/linearregintercept"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class LINEARREGSLOPEEndpoint(AsMixin, Endpoint):
     _name = "linearregslope"
+    _path = "/linearregslope"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5259,51 +3595,15 @@ class LINEARREGSLOPEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/linearregslope"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class LNEndpoint(AsMixin, Endpoint):
     _name = "ln"
+    _path = "/ln"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5341,49 +3641,15 @@ class LNEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ln"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class LOG10Endpoint(AsMixin, Endpoint):
     _name = "log10"
+    _path = "/log10"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5421,49 +3687,16 @@ class LOG10Endpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/log10"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MAEndpoint(AsMixin, Endpoint):
     _name = "ma"
+    _path = "/ma"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "ma_type", "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost",
+        "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5505,53 +3738,16 @@ class MAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.ma_type is not None:
-            params["ma_type"] = self.ma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ma"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MACDEndpoint(AsMixin, Endpoint):
     _name = "macd"
+    _path = "/macd"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "fast_period",
+        "slow_period", "signal_period", "outputsize", "start_date", "end_date", "dp", "timezone",
+        "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5595,55 +3791,16 @@ class MACDEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.fast_period is not None:
-            params["fast_period"] = self.fast_period
-        if self.slow_period is not None:
-            params["slow_period"] = self.slow_period
-        if self.signal_period is not None:
-            params["signal_period"] = self.signal_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/macd"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MACDSlopeEndpoint(AsMixin, Endpoint):
     _name = "macd_slope"
+    _path = "/macd_slope"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "fast_period",
+        "slow_period", "signal_period", "time_period", "outputsize", "start_date", "end_date",
+        "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5689,57 +3846,16 @@ class MACDSlopeEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.fast_period is not None:
-            params["fast_period"] = self.fast_period
-        if self.slow_period is not None:
-            params["slow_period"] = self.slow_period
-        if self.signal_period is not None:
-            params["signal_period"] = self.signal_period
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/macd_slope"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MACDEXTEndpoint(AsMixin, Endpoint):
     _name = "macdext"
+    _path = "/macdext"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "fast_period",
+        "fast_ma_type", "slow_period", "slow_ma_type", "signal_period", "signal_ma_type",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5789,61 +3905,16 @@ class MACDEXTEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.fast_period is not None:
-            params["fast_period"] = self.fast_period
-        if self.fast_ma_type is not None:
-            params["fast_ma_type"] = self.fast_ma_type
-        if self.slow_period is not None:
-            params["slow_period"] = self.slow_period
-        if self.slow_ma_type is not None:
-            params["slow_ma_type"] = self.slow_ma_type
-        if self.signal_period is not None:
-            params["signal_period"] = self.signal_period
-        if self.signal_ma_type is not None:
-            params["signal_ma_type"] = self.signal_ma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/macdext"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MAMAEndpoint(AsMixin, Endpoint):
     _name = "mama"
+    _path = "/mama"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "fast_limit",
+        "slow_limit", "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost",
+        "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5885,53 +3956,15 @@ class MAMAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.fast_limit is not None:
-            params["fast_limit"] = self.fast_limit
-        if self.slow_limit is not None:
-            params["slow_limit"] = self.slow_limit
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/mama"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MAXEndpoint(AsMixin, Endpoint):
     _name = "max"
+    _path = "/max"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -5971,51 +4004,15 @@ class MAXEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/max"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MAXINDEXEndpoint(AsMixin, Endpoint):
     _name = "maxindex"
+    _path = "/maxindex"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6055,51 +4052,15 @@ class MAXINDEXEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/maxindex"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class McGinleyDynamicEndpoint(AsMixin, Endpoint):
     _name = "mcginley_dynamic"
+    _path = "/mcginley_dynamic"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6137,49 +4098,15 @@ class McGinleyDynamicEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/mcginley_dynamic"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MEDPRICEEndpoint(AsMixin, Endpoint):
     _name = "medprice"
+    _path = "/medprice"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6219,51 +4146,15 @@ class MEDPRICEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/medprice"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MFIEndpoint(AsMixin, Endpoint):
     _name = "mfi"
+    _path = "/mfi"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6292,58 +4183,24 @@ class MFIEndpoint(AsMixin, Endpoint):
         self.country = country
         self.type = type
         self.time_period = time_period
-        self.outputsize = outputsize
-        self.start_date = start_date
-        self.end_date = end_date
-        self.dp = dp
-        self.timezone = timezone
-        self.order = order
-        self.prepost = prepost
-        self.mic_code = mic_code
-
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/mfi"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
+        self.outputsize = outputsize
+        self.start_date = start_date
+        self.end_date = end_date
+        self.dp = dp
+        self.timezone = timezone
+        self.order = order
+        self.prepost = prepost
+        self.mic_code = mic_code
 
 
 class MIDPOINTEndpoint(AsMixin, Endpoint):
     _name = "midpoint"
+    _path = "/midpoint"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6383,51 +4240,15 @@ class MIDPOINTEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/midpoint"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MIDPRICEEndpoint(AsMixin, Endpoint):
     _name = "midprice"
+    _path = "/midprice"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6465,49 +4286,15 @@ class MIDPRICEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/midprice"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MINEndpoint(AsMixin, Endpoint):
     _name = "min"
+    _path = "/min"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6547,51 +4334,15 @@ class MINEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/min"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MININDEXEndpoint(AsMixin, Endpoint):
     _name = "minindex"
+    _path = "/minindex"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6631,51 +4382,15 @@ class MININDEXEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/minindex"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MINMAXEndpoint(AsMixin, Endpoint):
     _name = "minmax"
+    _path = "/minmax"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6715,51 +4430,15 @@ class MINMAXEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/minmax"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MINMAXINDEXEndpoint(AsMixin, Endpoint):
     _name = "minmaxindex"
+    _path = "/minmaxindex"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6799,51 +4478,15 @@ class MINMAXINDEXEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/minmaxindex"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MINUS_DIEndpoint(AsMixin, Endpoint):
     _name = "minus_di"
+    _path = "/minus_di"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6881,49 +4524,15 @@ class MINUS_DIEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/minus_di"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MINUS_DMEndpoint(AsMixin, Endpoint):
     _name = "minus_dm"
+    _path = "/minus_dm"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -6961,49 +4570,15 @@ class MINUS_DMEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/minus_dm"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class MOMEndpoint(AsMixin, Endpoint):
     _name = "mom"
+    _path = "/mom"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7043,51 +4618,15 @@ class MOMEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/mom"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class NATREndpoint(AsMixin, Endpoint):
     _name = "natr"
+    _path = "/natr"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7125,49 +4664,15 @@ class NATREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/natr"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class OBVEndpoint(AsMixin, Endpoint):
     _name = "obv"
+    _path = "/obv"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7205,49 +4710,15 @@ class OBVEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/obv"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class PLUS_DIEndpoint(AsMixin, Endpoint):
     _name = "plus_di"
+    _path = "/plus_di"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7285,49 +4756,15 @@ class PLUS_DIEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/plus_di"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class PLUS_DMEndpoint(AsMixin, Endpoint):
     _name = "plus_dm"
+    _path = "/plus_dm"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7365,49 +4802,16 @@ class PLUS_DMEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/plus_dm"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class PPOEndpoint(AsMixin, Endpoint):
     _name = "ppo"
+    _path = "/ppo"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "fast_period",
+        "slow_period", "ma_type", "outputsize", "start_date", "end_date", "dp", "timezone",
+        "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7451,55 +4855,15 @@ class PPOEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.fast_period is not None:
-            params["fast_period"] = self.fast_period
-        if self.slow_period is not None:
-            params["slow_period"] = self.slow_period
-        if self.ma_type is not None:
-            params["ma_type"] = self.ma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ppo"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ROCEndpoint(AsMixin, Endpoint):
     _name = "roc"
+    _path = "/roc"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7539,51 +4903,15 @@ class ROCEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/roc"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ROCPEndpoint(AsMixin, Endpoint):
     _name = "rocp"
+    _path = "/rocp"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7614,60 +4942,24 @@ class ROCPEndpoint(AsMixin, Endpoint):
         self.type = type
         self.series_type = series_type
         self.time_period = time_period
-        self.outputsize = outputsize
-        self.start_date = start_date
-        self.end_date = end_date
-        self.dp = dp
-        self.timezone = timezone
-        self.order = order
-        self.prepost = prepost
-        self.mic_code = mic_code
-
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/rocp"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
+        self.outputsize = outputsize
+        self.start_date = start_date
+        self.end_date = end_date
+        self.dp = dp
+        self.timezone = timezone
+        self.order = order
+        self.prepost = prepost
+        self.mic_code = mic_code
 
 
 class ROCREndpoint(AsMixin, Endpoint):
     _name = "rocr"
+    _path = "/rocr"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7707,51 +4999,15 @@ class ROCREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/rocr"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ROCR100Endpoint(AsMixin, Endpoint):
     _name = "rocr100"
+    _path = "/rocr100"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7791,51 +5047,15 @@ class ROCR100Endpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/rocr100"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class RSIEndpoint(AsMixin, Endpoint):
     _name = "rsi"
+    _path = "/rsi"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7875,51 +5095,15 @@ class RSIEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/rsi"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class RVOLEndpoint(AsMixin, Endpoint):
     _name = "rvol"
+    _path = "/rvol"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -7957,49 +5141,15 @@ class RVOLEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/rvol"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class SAREndpoint(AsMixin, Endpoint):
     _name = "sar"
+    _path = "/sar"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "acceleration", "maximum",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8039,51 +5189,15 @@ class SAREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.acceleration is not None:
-            params["acceleration"] = self.acceleration
-        if self.maximum is not None:
-            params["maximum"] = self.maximum
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/sar"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class SMAEndpoint(AsMixin, Endpoint):
     _name = "sma"
+    _path = "/sma"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8123,51 +5237,15 @@ class SMAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/sma"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class SQRTEndpoint(AsMixin, Endpoint):
     _name = "sqrt"
+    _path = "/sqrt"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8205,49 +5283,15 @@ class SQRTEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/sqrt"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class STDDEVEndpoint(AsMixin, Endpoint):
     _name = "stddev"
+    _path = "/stddev"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period", "sd",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8289,53 +5333,16 @@ class STDDEVEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.sd is not None:
-            params["sd"] = self.sd
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/stddev"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class STOCHEndpoint(AsMixin, Endpoint):
     _name = "stoch"
+    _path = "/stoch"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "fast_k_period", "slow_k_period",
+        "slow_d_period", "slow_kma_type", "slow_dma_type", "outputsize", "start_date", "end_date",
+        "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8381,57 +5388,16 @@ class STOCHEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.fast_k_period is not None:
-            params["fast_k_period"] = self.fast_k_period
-        if self.slow_k_period is not None:
-            params["slow_k_period"] = self.slow_k_period
-        if self.slow_d_period is not None:
-            params["slow_d_period"] = self.slow_d_period
-        if self.slow_kma_type is not None:
-            params["slow_kma_type"] = self.slow_kma_type
-        if self.slow_dma_type is not None:
-            params["slow_dma_type"] = self.slow_dma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/stoch"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class STOCHFEndpoint(AsMixin, Endpoint):
     _name = "stochf"
+    _path = "/stochf"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "fast_k_period", "fast_d_period",
+        "fast_dma_type", "outputsize", "start_date", "end_date", "dp", "timezone", "order",
+        "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8473,53 +5439,16 @@ class STOCHFEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.fast_k_period is not None:
-            params["fast_k_period"] = self.fast_k_period
-        if self.fast_d_period is not None:
-            params["fast_d_period"] = self.fast_d_period
-        if self.fast_dma_type is not None:
-            params["fast_dma_type"] = self.fast_dma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/stochf"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class STOCHRSIEndpoint(AsMixin, Endpoint):
     _name = "stochrsi"
+    _path = "/stochrsi"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "fast_k_period", "fast_d_period", "fast_dma_type", "outputsize", "start_date", "end_date",
+        "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8565,57 +5494,15 @@ class STOCHRSIEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.fast_k_period is not None:
-            params["fast_k_period"] = self.fast_k_period
-        if self.fast_d_period is not None:
-            params["fast_d_period"] = self.fast_d_period
-        if self.fast_dma_type is not None:
-            params["fast_dma_type"] = self.fast_dma_type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/stochrsi"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class SuperTrendEndpoint(AsMixin, Endpoint):
     _name = "supertrend"
+    _path = "/supertrend"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "multiplier", "period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8655,51 +5542,16 @@ class SuperTrendEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.multiplier is not None:
-            params["multiplier"] = self.multiplier
-        if self.period is not None:
-            params["period"] = self.period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/supertrend"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class T3MAEndpoint(AsMixin, Endpoint):
     _name = "t3ma"
+    _path = "/t3ma"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "v_factor", "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost",
+        "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8741,53 +5593,15 @@ class T3MAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.v_factor is not None:
-            params["v_factor"] = self.v_factor
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/t3ma"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class TEMAEndpoint(AsMixin, Endpoint):
     _name = "tema"
+    _path = "/tema"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8827,51 +5641,15 @@ class TEMAEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/tema"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class TRANGEEndpoint(AsMixin, Endpoint):
     _name = "trange"
+    _path = "/trange"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8907,47 +5685,15 @@ class TRANGEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/trange"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class TRIMAEndpoint(AsMixin, Endpoint):
     _name = "trima"
+    _path = "/trima"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -8978,60 +5724,24 @@ class TRIMAEndpoint(AsMixin, Endpoint):
         self.type = type
         self.series_type = series_type
         self.time_period = time_period
-        self.outputsize = outputsize
-        self.start_date = start_date
-        self.end_date = end_date
-        self.dp = dp
-        self.timezone = timezone
-        self.order = order
-        self.prepost = prepost
-        self.mic_code = mic_code
-
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/trima"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
+        self.outputsize = outputsize
+        self.start_date = start_date
+        self.end_date = end_date
+        self.dp = dp
+        self.timezone = timezone
+        self.order = order
+        self.prepost = prepost
+        self.mic_code = mic_code
 
 
 class TSFEndpoint(AsMixin, Endpoint):
     _name = "tsf"
+    _path = "/tsf"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9071,51 +5781,15 @@ class TSFEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/tsf"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class TYPPRICEEndpoint(AsMixin, Endpoint):
     _name = "typprice"
+    _path = "/typprice"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9151,47 +5825,16 @@ class TYPPRICEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/typprice"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class ULTOSCEndpoint(AsMixin, Endpoint):
     _name = "ultosc"
+    _path = "/ultosc"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period_1", "time_period_2",
+        "time_period_3", "outputsize", "start_date", "end_date", "dp", "timezone", "order",
+        "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9233,53 +5876,15 @@ class ULTOSCEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period_1 is not None:
-            params["time_period_1"] = self.time_period_1
-        if self.time_period_2 is not None:
-            params["time_period_2"] = self.time_period_2
-        if self.time_period_3 is not None:
-            params["time_period_3"] = self.time_period_3
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/ultosc"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class VAREndpoint(AsMixin, Endpoint):
     _name = "var"
+    _path = "/var"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9319,51 +5924,15 @@ class VAREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/var"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class VWAPEndpoint(AsMixin, Endpoint):
     _name = "vwap"
+    _path = "/vwap"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9399,47 +5968,15 @@ class VWAPEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/vwap"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class WCLPRICEEndpoint(AsMixin, Endpoint):
     _name = "wclprice"
+    _path = "/wclprice"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "outputsize", "start_date",
+        "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9475,47 +6012,15 @@ class WCLPRICEEndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/wclprice"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class WILLREndpoint(AsMixin, Endpoint):
     _name = "willr"
+    _path = "/willr"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "time_period", "outputsize",
+        "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9553,49 +6058,15 @@ class WILLREndpoint(AsMixin, Endpoint):
         self.prepost = prepost
         self.mic_code = mic_code
 
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/willr"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
-
 
 class WMAEndpoint(AsMixin, Endpoint):
     _name = "wma"
+    _path = "/wma"
+    _params = (
+        "symbol", "interval", "exchange", "country", "type", "series_type", "time_period",
+        "outputsize", "start_date", "end_date", "dp", "timezone", "order", "prepost", "mic_code",
+    )
+    supports_batch = True
 
     def __init__(
         self,
@@ -9634,45 +6105,3 @@ class WMAEndpoint(AsMixin, Endpoint):
         self.order = order
         self.prepost = prepost
         self.mic_code = mic_code
-
-    def execute(self, format="JSON", debug=False):
-
-        params = {}
-        if self.symbol is not None:
-            params["symbol"], self.is_batch = get_symbol(self.symbol)
-        if self.interval is not None:
-            params["interval"] = self.interval
-        if self.exchange is not None:
-            params["exchange"] = self.exchange
-        if self.country is not None:
-            params["country"] = self.country
-        if self.type is not None:
-            params["type"] = self.type
-        if self.series_type is not None:
-            params["series_type"] = self.series_type
-        if self.time_period is not None:
-            params["time_period"] = self.time_period
-        if self.outputsize is not None:
-            params["outputsize"] = self.outputsize
-        if self.start_date is not None:
-            params["start_date"] = self.start_date
-        if self.end_date is not None:
-            params["end_date"] = self.end_date
-        if self.dp is not None:
-            params["dp"] = self.dp
-        if self.timezone is not None:
-            params["timezone"] = self.timezone
-        if self.order is not None:
-            params["order"] = self.order
-        if self.prepost is not None:
-            params["prepost"] = self.prepost
-        if self.mic_code is not None:
-            params["mic_code"] = self.mic_code
-
-        params["format"] = format
-        params["apikey"] = self.ctx.apikey
-        endpoint = "/wma"
-
-        if debug:
-            return build_url(self.ctx.base_url, endpoint, params)
-        return self.ctx.http_client.get(endpoint, params=params)
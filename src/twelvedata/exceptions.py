@@ -9,7 +9,15 @@ __all__ = (
 
 
 class TwelveDataError(RuntimeError):
-    pass
+    """
+    :param code: HTTP status or error code reported by the API, if known
+    :param headers: headers of the HTTP response, if known
+    """
+
+    def __init__(self, *args, code=None, headers=None):
+        super(TwelveDataError, self).__init__(*args)
+        self.code = code
+        self.headers = headers
 
 
 class BadRequestError(TwelveDataError):
@@ -1,21 +1,111 @@
 # coding: utf-8
 
+import time
+import textwrap
+from collections import Counter
 from requests import Session
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from requests.structures import CaseInsensitiveDict
 from json import JSONDecodeError
 
+from .coalesce import SingleFlight, AsyncSingleFlight, request_key
 from .exceptions import (
     BadRequestError,
     InternalServerError,
     InvalidApiKeyError,
     TwelveDataError,
 )
+from .utils import decode_response
 
-__all__ = ("DefaultHttpClient",)
+__all__ = ("DefaultHttpClient", "AsyncHttpClient", "AsyncHttpResponse")
+
+
+def _is_raw_response(resp):
+    return ('Is_batch' in resp.headers and resp.headers['Is_batch'] == 'true') or \
+        ('Content-Type' in resp.headers and resp.headers['Content-Type'] == 'text/csv')
+
+
+def _check_response(resp):
+    """
+    Raises an appropriate exception if the response (either HTTP or JSON
+    encoded) reports an error, otherwise returns the response as is.
+    """
+    if _is_raw_response(resp):
+        return resp
+
+    if not resp.ok:
+        _raise_error(resp.status_code, resp.text, resp.headers)
+
+    # The decoded body is reused when the caller parses the response
+    json_resp = decode_response(resp, keep=True)
+    if 'status' not in json_resp:
+        return resp
+
+    status = json_resp['status']
+    if status == 'error':
+        error_code = json_resp['code']
+    else:
+        return resp
+
+    try:
+        message = json_resp["message"]
+    except ValueError:
+        message = resp.text
+
+    _raise_error(error_code, message, resp.headers)
+
+
+def _raise_error(error_code, message, headers=None):
+    if error_code == 401:
+        raise InvalidApiKeyError(message, code=error_code, headers=headers)
+
+    if error_code == 400:
+        raise BadRequestError(message, code=error_code, headers=headers)
+
+    if error_code >= 500:
+        raise InternalServerError(message, code=error_code, headers=headers)
+
+    raise TwelveDataError(message, code=error_code, headers=headers)
+
+
+def _retry_delay(policy, error, errors, retries, started_at):
+    """
+    Returns seconds to wait before the failed request is sent again, or None
+    if the error should be raised
+
+    :param errors: exceptions of the HTTP library which are retried as
+        connection errors
+    """
+    if policy is None:
+        return None
+    if isinstance(error, TwelveDataError):
+        if error.code is None:
+            return None
+        return policy.delay("GET", error.code, retries, started_at, error.headers)
+    if isinstance(error, errors):
+        return policy.delay("GET", None, retries, started_at)
+    return None
 
 
 class DefaultHttpClient(object):
-    def __init__(self, base_url):
+    """
+    :param base_url: Base URL for Twelvedata API
+    :param rate_limiter: RateLimiter which paces requests, optional
+    :param cache: response cache (MemoryCache or DiskCache), optional
+    :param coalesce: share one in-flight request between concurrent
+        identical requests
+    :param timeout: timeout of a single request in seconds
+    :param retry_policy: RetryPolicy of failed requests, optional
+    """
+
+    def __init__(self, base_url, rate_limiter=None, cache=None, coalesce=False, timeout=30,
+                 retry_policy=None):
         self.base_url = base_url
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.singleflight = SingleFlight() if coalesce else None
         self.session = Session()
 
     def get(self, relative_url, *args, **kwargs):
@@ -25,40 +115,187 @@ class DefaultHttpClient(object):
         params["source"] = "python"
         kwargs["params"] = params
 
-        resp = self.session.get("{}{}".format(self.base_url, relative_url), timeout=30, *args, **kwargs)
-        if ('Is_batch' in resp.headers and resp.headers['Is_batch'] == 'true') or \
-                ('Content-Type' in resp.headers and resp.headers['Content-Type'] == 'text/csv'):
-            return resp
+        if self.cache is not None:
+            resp = self.cache.get(relative_url, params)
+            if resp is not None:
+                return resp
 
-        if not resp.ok:
-            self._raise_error(resp.status_code, resp.text)
+        if self.singleflight is not None:
+            return self.singleflight.do(
+                request_key(relative_url, params),
+                lambda: self._request(relative_url, *args, **kwargs),
+            )
+        return self._request(relative_url, *args, **kwargs)
 
-        json_resp = resp.json()
-        if 'status' not in json_resp:
-            return resp
+    def _request(self, relative_url, *args, **kwargs):
+        params = kwargs["params"]
+        url = "{}{}".format(self.base_url, relative_url)
+        started_at = time.monotonic()
+        retries = Counter()
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.rate_limiter.cost(relative_url, params))
 
-        status = json_resp['status']
-        if status == 'error':
-            error_code = json_resp['code']
-        else:
-            return resp
+            timeout = self.timeout
+            if self.retry_policy is not None:
+                timeout = self.retry_policy.timeout(timeout, started_at)
+            try:
+                resp = _check_response(self.session.get(url, timeout=timeout, *args, **kwargs))
+                break
+            except (TwelveDataError, RequestsConnectionError, Timeout) as e:
+                delay = _retry_delay(
+                    self.retry_policy, e, (RequestsConnectionError, Timeout), retries, started_at
+                )
+                if delay is None:
+                    raise
+            time.sleep(delay)
 
-        try:
-            message = json_resp["message"]
-        except ValueError:
-            message = resp.text
-
-        self._raise_error(error_code, message)
+        if self.cache is not None:
+            self.cache.set(relative_url, params, resp)
+        return resp
 
     @staticmethod
     def _raise_error(error_code, message):
-        if error_code == 401:
-            raise InvalidApiKeyError(message)
+        _raise_error(error_code, message)
+
+
+class AsyncHttpResponse(object):
+    """
+    Fully read response of the AsyncHttpClient.
+
+    Mimics the subset of ``requests.Response`` used by request builders,
+    so the same parsing code serves both clients.
+    """
+
+    def __init__(self, status_code, headers, content, encoding=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return decode_response(self)
+
+
+class AsyncHttpClient(object):
+    """
+    HTTP client based on aiohttp. Requests are sent through a pooled
+    connector, so many of them can be in flight on the same event loop.
+
+    :param base_url: Base URL for Twelvedata API
+    :param limit: Maximum number of simultaneous connections
+    :param timeout: Total timeout of a single request in seconds
+    :param rate_limiter: RateLimiter which paces requests, optional
+    :param cache: response cache (MemoryCache or DiskCache), optional
+    :param coalesce: share one in-flight request between concurrent
+        identical requests
+    :param retry_policy: RetryPolicy of failed requests, optional
+    """
+
+    def __init__(self, base_url, limit=100, timeout=30, rate_limiter=None, cache=None,
+                 coalesce=False, retry_policy=None):
+        self.base_url = base_url
+        self.limit = limit
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.singleflight = AsyncSingleFlight() if coalesce else None
+        self.session = None
+
+    def _get_session(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                textwrap.dedent(
+                    """
+                        No module named 'aiohttp'. You can install it with follow command:
+
+                        > pip install twelvedata[async]
+
+                        or
+
+                        > pip install aiohttp
+                    """
+                ).strip()
+            )
+
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def get(self, relative_url, *args, **kwargs):
+
+        # For the sake of monitoring, we add a "source" parameter
+        params = kwargs.get("params", {})
+        params["source"] = "python"
+        kwargs["params"] = {k: str(v) for k, v in params.items()}
+
+        if self.cache is not None:
+            resp = self.cache.get(relative_url, params)
+            if resp is not None:
+                return resp
+
+        if self.singleflight is not None:
+            return await self.singleflight.do(
+                request_key(relative_url, params),
+                lambda: self._request(relative_url, *args, **kwargs),
+            )
+        return await self._request(relative_url, *args, **kwargs)
+
+    async def _request(self, relative_url, *args, **kwargs):
+        # Reports missing aiohttp with the installation hint
+        self._get_session()
+        import asyncio
+        import aiohttp
+
+        params = kwargs["params"]
+        url = "{}{}".format(self.base_url, relative_url)
+        policy = self.retry_policy
+        started_at = time.monotonic()
+        retries = Counter()
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(self.rate_limiter.cost(relative_url, params))
 
-        if error_code == 400:
-            raise BadRequestError(message)
+            session = self._get_session()
+            if policy is not None and policy.deadline is not None:
+                kwargs["timeout"] = aiohttp.ClientTimeout(
+                    total=policy.timeout(self.timeout, started_at)
+                )
+            try:
+                async with session.get(url, *args, **kwargs) as r:
+                    content = await r.read()
+                    resp = AsyncHttpResponse(
+                        r.status, CaseInsensitiveDict(r.headers), content, r.get_encoding()
+                    )
+                resp = _check_response(resp)
+                break
+            except (TwelveDataError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = _retry_delay(
+                    policy, e, (aiohttp.ClientError, asyncio.TimeoutError), retries, started_at
+                )
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
 
-        if error_code >= 500:
-            raise InternalServerError(message)
+        if self.cache is not None:
+            self.cache.set(relative_url, params, resp)
+        return resp
 
-        raise TwelveDataError(message)
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -0,0 +1,284 @@
+# coding: utf-8
+
+from .endpoints import (
+    ATREndpoint,
+    AVGPRICEEndpoint,
+    BBANDSEndpoint,
+    EMAEndpoint,
+    HLC3Endpoint,
+    MACDEndpoint,
+    MEDPRICEEndpoint,
+    MOMEndpoint,
+    OBVEndpoint,
+    PercentBEndpoint,
+    ROCEndpoint,
+    RSIEndpoint,
+    SMAEndpoint,
+    STDDEVEndpoint,
+    TRANGEEndpoint,
+    TYPPRICEEndpoint,
+    VWAPEndpoint,
+    WCLPRICEEndpoint,
+    WILLREndpoint,
+    WMAEndpoint,
+)
+
+__all__ = ("LOCAL_INDICATORS", "compute_indicator", "warmup_size")
+
+
+# Computations follow the TA-Lib conventions used by the API: moving
+# averages are seeded with the simple average of the first period and
+# RSI/ATR use Wilder's smoothing. Every function accepts OHLCV DataFrame
+# sorted in ascending order and returns DataFrame with the columns of the
+# API response, or None when the parameters can't be reproduced locally.
+
+
+def _sma(values, n):
+    return values.rolling(n).mean()
+
+
+def _seeded_ewm(values, n, alpha):
+    import numpy as np
+    import pandas as pd
+
+    out = pd.Series(np.nan, index=values.index)
+    valid = values.dropna()
+    if len(valid) < n:
+        return out
+
+    # The first value is the simple average of the first n ones
+    seed = valid.iloc[:n].mean()
+    tail = valid.iloc[n - 1:].copy()
+    tail.iloc[0] = seed
+    out.loc[tail.index] = tail.ewm(alpha=alpha, adjust=False).mean()
+    return out
+
+
+def _ema(values, n):
+    return _seeded_ewm(values, n, 2.0 / (n + 1))
+
+
+def _wilder(values, n):
+    return _seeded_ewm(values, n, 1.0 / n)
+
+
+def _wma(values, n):
+    import numpy as np
+
+    weights = np.arange(1, n + 1, dtype="float64")
+    return values.rolling(n).apply(lambda x: np.dot(x, weights), raw=True) / weights.sum()
+
+
+MOVING_AVERAGES = {
+    "SMA": _sma,
+    "EMA": _ema,
+    "WMA": _wma,
+}
+
+
+def _series(df, ep):
+    return df[getattr(ep, "series_type", None) or "close"]
+
+
+def _true_range(df):
+    import pandas as pd
+
+    prev_close = df["close"].shift(1)
+    return pd.concat(
+        [df["high"] - df["low"], (df["high"] - prev_close).abs(), (df["low"] - prev_close).abs()],
+        axis=1,
+    ).max(axis=1, skipna=False)
+
+
+def _bands(df, ep):
+    ma = MOVING_AVERAGES.get(str(ep.ma_type).upper())
+    if ma is None:
+        return None
+
+    n, sd = int(ep.time_period), float(ep.sd)
+    values = _series(df, ep)
+    middle = ma(values, n)
+    deviation = values.rolling(n).std(ddof=0) * sd
+    return middle + deviation, middle, middle - deviation
+
+
+def sma(df, ep):
+    return {"sma": _sma(_series(df, ep), int(ep.time_period))}
+
+
+def ema(df, ep):
+    return {"ema": _ema(_series(df, ep), int(ep.time_period))}
+
+
+def wma(df, ep):
+    return {"wma": _wma(_series(df, ep), int(ep.time_period))}
+
+
+def rsi(df, ep):
+    n = int(ep.time_period)
+    diff = _series(df, ep).diff().iloc[1:]
+    gain = _wilder(diff.clip(lower=0), n)
+    loss = _wilder(-diff.clip(upper=0), n)
+    return {"rsi": (100 - 100 / (1 + gain / loss)).reindex(df.index)}
+
+
+def macd(df, ep):
+    values = _series(df, ep)
+    line = _ema(values, int(ep.fast_period)) - _ema(values, int(ep.slow_period))
+    signal = _ema(line, int(ep.signal_period))
+    return {"macd": line, "macd_signal": signal, "macd_hist": line - signal}
+
+
+def bbands(df, ep):
+    bands = _bands(df, ep)
+    if bands is None:
+        return None
+    upper, middle, lower = bands
+    return {"upper_band": upper, "middle_band": middle, "lower_band": lower}
+
+
+def percent_b(df, ep):
+    bands = _bands(df, ep)
+    if bands is None:
+        return None
+    upper, _, lower = bands
+    return {"percent_b": (_series(df, ep) - lower) / (upper - lower)}
+
+
+def atr(df, ep):
+    tr = _true_range(df).iloc[1:]
+    return {"atr": _wilder(tr, int(ep.time_period)).reindex(df.index)}
+
+
+def trange(df, ep):
+    return {"trange": _true_range(df)}
+
+
+def obv(df, ep):
+    import numpy as np
+
+    direction = np.sign(_series(df, ep).diff()).fillna(1)
+    return {"obv": (direction * df["volume"]).cumsum()}
+
+
+def mom(df, ep):
+    values = _series(df, ep)
+    return {"mom": values - values.shift(int(ep.time_period))}
+
+
+def roc(df, ep):
+    values = _series(df, ep)
+    prev = values.shift(int(ep.time_period))
+    return {"roc": (values - prev) / prev * 100}
+
+
+def stddev(df, ep):
+    return {"stddev": _series(df, ep).rolling(int(ep.time_period)).std(ddof=0) * float(ep.sd)}
+
+
+def willr(df, ep):
+    n = int(ep.time_period)
+    highest, lowest = df["high"].rolling(n).max(), df["low"].rolling(n).min()
+    return {"willr": (highest - df["close"]) / (highest - lowest) * -100}
+
+
+def avgprice(df, ep):
+    return {"avgprice": (df["open"] + df["high"] + df["low"] + df["close"]) / 4}
+
+
+def medprice(df, ep):
+    return {"medprice": (df["high"] + df["low"]) / 2}
+
+
+def typprice(df, ep):
+    return {"typprice": (df["high"] + df["low"] + df["close"]) / 3}
+
+
+def hlc3(df, ep):
+    return {"hlc3": (df["high"] + df["low"] + df["close"]) / 3}
+
+
+def wclprice(df, ep):
+    return {"wclprice": (df["high"] + df["low"] + df["close"] * 2) / 4}
+
+
+def vwap(df, ep):
+    # Volume weighted average price is accumulated over every trading day
+    days = df.index.normalize()
+    typical = (df["high"] + df["low"] + df["close"]) / 3
+    volume = df["volume"]
+    return {
+        "vwap": (typical * volume).groupby(days).cumsum() / volume.groupby(days).cumsum()
+    }
+
+
+LOCAL_INDICATORS = {
+    ATREndpoint: atr,
+    AVGPRICEEndpoint: avgprice,
+    BBANDSEndpoint: bbands,
+    EMAEndpoint: ema,
+    HLC3Endpoint: hlc3,
+    MACDEndpoint: macd,
+    MEDPRICEEndpoint: medprice,
+    MOMEndpoint: mom,
+    OBVEndpoint: obv,
+    PercentBEndpoint: percent_b,
+    ROCEndpoint: roc,
+    RSIEndpoint: rsi,
+    SMAEndpoint: sma,
+    STDDEVEndpoint: stddev,
+    TRANGEEndpoint: trange,
+    TYPPRICEEndpoint: typprice,
+    VWAPEndpoint: vwap,
+    WCLPRICEEndpoint: wclprice,
+    WILLREndpoint: willr,
+    WMAEndpoint: wma,
+}
+
+
+def warmup_size(ep):
+    """
+    Returns number of extra bars needed before the first output value
+    of the indicator is settled
+    """
+    periods = [
+        int(getattr(ep, name))
+        for name in ("time_period", "slow_period", "signal_period")
+        if getattr(ep, name, None) is not None
+    ]
+    # Exponential averages need several periods to forget their seed
+    if isinstance(ep, (EMAEndpoint, RSIEndpoint, ATREndpoint, MACDEndpoint)):
+        return sum(periods) * 4
+    return sum(periods)
+
+
+def compute_indicator(df, ep):
+    """
+    Computes the indicator of the endpoint from OHLCV DataFrame.
+
+    Returns DataFrame indexed the same way as df, or None if the indicator
+    has to be requested from the API.
+
+    :param df: DataFrame returned by TimeSeriesEndpoint.as_pandas()
+    :param ep: indicator endpoint
+    """
+    import pandas as pd
+
+    func = LOCAL_INDICATORS.get(ep.__class__)
+    if func is None:
+        return None
+
+    ordered = df.sort_index()
+    try:
+        columns = func(ordered.select_dtypes("number").astype("float64"), ep)
+    except KeyError:
+        # E.g. volume based indicator of the instrument without volume
+        return None
+    if columns is None:
+        return None
+
+    out = pd.DataFrame(columns, index=ordered.index).reindex(df.index)
+    dp = getattr(ep, "dp", None)
+    if dp is not None:
+        out = out.round(int(dp))
+    return out
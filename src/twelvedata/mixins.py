@@ -1,16 +1,41 @@
 # coding: utf-8
 
 import csv
-from .utils import convert_collection_to_pandas, convert_collection_to_pandas_multi_index, convert_pandas_to_plotly
+import inspect
+from .utils import (
+    convert_collection_to_pandas,
+    convert_collection_to_pandas_multi_index,
+    convert_pandas_to_plotly,
+    convert_to_datetime_index,
+    decode_response,
+)
 
 
 __all__ = ("AsJsonMixin", "AsCsvMixin", "AsPandasMixin", "AsUrlMixin", "AsMixin")
 
 
+def resolve(value, callback):
+    """
+    Applies callback to the value. If the value is awaitable (the request
+    was sent by an asynchronous HTTP client), returns a coroutine which
+    awaits the value first.
+    """
+    if inspect.isawaitable(value):
+        async def _resolve():
+            return callback(await value)
+        return _resolve()
+    return callback(value)
+
+
 class AsJsonMixin(object):
     def as_json(self):
-        resp = self.execute(format="JSON")
-        json = resp.json()
+        chunks = self._symbol_chunks() if hasattr(self, "_symbol_chunks") else None
+        if chunks:
+            return self._as_json_chunked(chunks)
+        return resolve(self.execute(format="JSON"), self._parse_json)
+
+    def _parse_json(self, resp):
+        json = decode_response(resp)
         if hasattr(self, 'is_batch') and self.is_batch:
             return json
         if isinstance(json, dict) and json.get("status") == "ok":
@@ -21,30 +46,33 @@ class AsJsonMixin(object):
         return json
 
     def as_raw_json(self):
-        resp = self.execute(format="JSON")
-        return resp.text
+        return resolve(self.execute(format="JSON"), lambda resp: resp.text)
 
 
 class AsCsvMixin(object):
     def as_csv(self, **kwargs):
-        resp = self.execute(format="CSV")
+        return resolve(self.execute(format="CSV"), lambda resp: self._parse_csv(resp, **kwargs))
+
+    @staticmethod
+    def _parse_csv(resp, **kwargs):
         lines = resp.text.strip().split("\n")
         delimiter = "," if "," in lines[0] else ";"
         kwargs["delimiter"] = kwargs.get("delimiter", delimiter)
         return tuple(map(tuple, csv.reader(lines, **kwargs)))
 
     def as_raw_csv(self):
-        resp = self.execute(format="CSV")
-        return resp.text
+        return resolve(self.execute(format="CSV"), lambda resp: resp.text)
 
 
 class AsPandasMixin(object):
     def as_pandas(self, **kwargs):
-        import pandas as pd
-
         assert hasattr(self, "as_json")
 
-        data = self.as_json()
+        return resolve(self.as_json(), lambda data: self._parse_pandas(data, **kwargs))
+
+    def _parse_pandas(self, data, **kwargs):
+        import pandas as pd
+
         if hasattr(self, "is_batch") and self.is_batch:
             df = convert_collection_to_pandas_multi_index(data)
         elif hasattr(self, "method") and self.method == "earnings":
@@ -58,17 +86,19 @@ class AsPandasMixin(object):
 
             df = self.create_basic_df(modified_data, pd, index_column="date", **kwargs)
         else:
-            df = self.create_basic_df(data, pd, **kwargs)
+            df = self.create_basic_df(data, pd, dtypes=getattr(self, "dtypes", None), **kwargs)
 
         return df
 
     @staticmethod
-    def create_basic_df(data, pd, index_column="datetime", **kwargs):
-        df = convert_collection_to_pandas(data, **kwargs)
+    def create_basic_df(data, pd, index_column="datetime", dtypes=None, **kwargs):
+        df = convert_collection_to_pandas(data, dtypes=dtypes, **kwargs)
         df = df.set_index(index_column)
-        df.index = pd.to_datetime(df.index)
+        df.index = convert_to_datetime_index(df.index)
 
         for col in df.columns:
+            if pd.api.types.is_numeric_dtype(df[col]):
+                continue
             try:
                 df[col] = pd.to_numeric(df[col])
             except (ValueError, TypeError):
@@ -0,0 +1,125 @@
+# coding: utf-8
+
+import time
+import threading
+
+__all__ = ("RateLimiter", "CREDIT_COSTS")
+
+
+# API credits charged per symbol by endpoints which cost more than one credit.
+# Endpoints missing here are charged `default_cost` credits per symbol.
+CREDIT_COSTS = {
+    "/api_usage": 0,
+    "/technical_indicators": 0,
+    "/profile": 10,
+    "/dividends": 20,
+    "/splits": 20,
+    "/earnings": 20,
+    "/dividends_calendar": 40,
+    "/splits_calendar": 40,
+    "/earnings_calendar": 40,
+    "/ipo_calendar": 40,
+    "/statistics": 50,
+    "/income_statement": 100,
+    "/balance_sheet": 100,
+    "/cash_flow": 100,
+    "/insider_transactions": 200,
+    "/key_executives": 1000,
+    "/institutional_holders": 1500,
+    "/fund_holders": 1500,
+}
+
+
+class RateLimiter(object):
+    """
+    Thread-safe token bucket which paces requests to stay within the
+    per-minute API credits budget of the plan.
+
+    Each request reserves its credits up front. When the bucket runs dry
+    the reservation is queued behind the previous ones and the caller
+    sleeps exactly until the bucket has been refilled for it.
+
+    :param credits_per_minute: API credits available per minute
+    :param costs: mapping of endpoint path to API credits per symbol
+    :param default_cost: credits per symbol of endpoints missing in costs
+    """
+
+    def __init__(self, credits_per_minute, costs=None, default_cost=1):
+        self.capacity = float(credits_per_minute)
+        self.rate = self.capacity / 60.0
+        self.costs = dict(CREDIT_COSTS, **(costs or {}))
+        self.default_cost = default_cost
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_api_usage(cls, usage, **kwargs):
+        """
+        Creates rate limiter seeded with the remaining budget of the current
+        minute.
+
+        :param usage: response of APIUsageEndpoint.as_json()
+        """
+        limiter = cls(usage["plan_limit"], **kwargs)
+        limiter.seed(usage)
+        return limiter
+
+    def seed(self, usage):
+        """
+        Adjusts available credits to the response of APIUsageEndpoint.as_json()
+        """
+        with self.lock:
+            self.capacity = float(usage["plan_limit"])
+            self.rate = self.capacity / 60.0
+            self.tokens = self.capacity - float(usage.get("current_usage", 0))
+            self.updated_at = time.monotonic()
+
+    def cost(self, relative_url, params=None):
+        """
+        Estimates API credits charged for the request
+        """
+        params = params or {}
+        per_symbol = self.costs.get(relative_url, self.default_cost)
+        symbol = params.get("symbol")
+        if isinstance(symbol, str) and symbol:
+            return per_symbol * len(symbol.split(","))
+        return per_symbol
+
+    def reserve(self, credits):
+        """
+        Reserves credits and returns the number of seconds the caller has
+        to wait before sending the request.
+        """
+        # A single request may cost more than the whole bucket (e.g. large batch),
+        # it should not wait longer than it takes to refill the bucket completely
+        credits = min(float(credits), self.capacity)
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= credits
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, credits=1):
+        """
+        Blocks until the credits can be spent
+        """
+        wait = self.reserve(credits)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, credits=1):
+        """
+        Same as acquire, but does not block the event loop
+        """
+        import asyncio
+
+        wait = self.reserve(credits)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+import time
+import datetime
+import threading
+from collections import Counter
+from email.utils import parsedate_to_datetime
+
+from .utils import ExponentialBackoff
+
+__all__ = ("RetryPolicy", "RETRY_STATUSES", "IDEMPOTENT_METHODS")
+
+
+# Maximum number of retries per HTTP status or error code reported by the API.
+# Codes missing here are never retried.
+RETRY_STATUSES = {
+    429: 5,
+    500: 2,
+    502: 3,
+    503: 3,
+    504: 3,
+}
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Key of connection errors and timeouts in the counters
+ERROR = "error"
+
+
+def parse_retry_after(value):
+    """
+    Returns number of seconds from the Retry-After header, which holds
+    either seconds or HTTP date, or None if it can't be parsed
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class RetryPolicy(object):
+    """
+    Thread-safe policy which decides whether failed request is sent again
+    and how long to wait before it. Delays grow exponentially and are
+    picked uniformly from zero to the exponential value (full jitter),
+    unless the response tells how long to wait in its Retry-After header.
+
+    :param statuses: mapping of HTTP status or API error code to maximum
+        number of retries
+    :param errors: maximum number of retries of connection errors and timeouts
+    :param base: maximum delay before the first retry in seconds
+    :param factor: multiplier applied after every retry
+    :param cap: maximum delay in seconds
+    :param deadline: total time in seconds which request may take with all
+        its retries, None for no limit
+    :param methods: HTTP methods which are safe to repeat
+    """
+
+    def __init__(self, statuses=None, errors=2, base=0.5, factor=2.0, cap=30.0, deadline=120.0,
+                 methods=IDEMPOTENT_METHODS):
+        self.statuses = dict(RETRY_STATUSES if statuses is None else statuses)
+        self.errors = errors
+        self.base = base
+        self.factor = factor
+        self.cap = cap
+        self.deadline = deadline
+        self.methods = tuple(m.upper() for m in methods)
+        self.retries = Counter()
+        self.gave_up = Counter()
+        self.lock = threading.Lock()
+
+    def remaining(self, started_at):
+        """
+        Returns seconds left until the deadline of the request started at
+        time.monotonic() value started_at, or None if there is no deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - (time.monotonic() - started_at))
+
+    def timeout(self, timeout, started_at):
+        """
+        Returns timeout of the next attempt, it doesn't outlive the deadline
+        """
+        remaining = self.remaining(started_at)
+        if remaining is None:
+            return timeout
+        return min(timeout, max(remaining, 0.001))
+
+    def delay(self, method, code, retries, started_at, headers=None):
+        """
+        Returns seconds to wait before the request is sent again, or None if
+        it should fail
+
+        :param method: HTTP method of the request
+        :param code: HTTP status or API error code, None for connection
+            errors and timeouts
+        :param retries: Counter of retries of the request made so far per
+            code, it's updated when the request is to be retried
+        :param started_at: time.monotonic() value of the first attempt
+        :param headers: headers of the failed response
+        """
+        key = ERROR if code is None else code
+        limit = self.errors if code is None else self.statuses.get(code)
+        if not limit or method.upper() not in self.methods:
+            return None
+
+        delay = parse_retry_after((headers or {}).get("Retry-After"))
+        if delay is None:
+            backoff = ExponentialBackoff(self.base, self.factor, self.cap)
+            backoff.attempts = sum(retries.values())
+            delay = backoff.next()
+
+        remaining = self.remaining(started_at)
+        with self.lock:
+            if retries[key] >= limit or (remaining is not None and delay >= remaining):
+                self.gave_up[key] += 1
+                return None
+            self.retries[key] += 1
+        retries[key] += 1
+        return delay
+
+    def stats(self):
+        """
+        Returns number of retries and of requests which failed after all
+        allowed retries, per code
+        """
+        with self.lock:
+            return {"retries": dict(self.retries), "gave_up": dict(self.gave_up)}
+
+    def reset_stats(self):
+        with self.lock:
+            self.retries.clear()
+            self.gave_up.clear()
@@ -0,0 +1,107 @@
+# coding: utf-8
+
+import os
+import hashlib
+import tempfile
+
+__all__ = ("OHLCVStore",)
+
+
+COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class OHLCVStore(object):
+    """
+    On-disk store of time series, one memory-mapped NumPy file per
+    symbol, interval, timezone and adjustment. Bars are kept in ascending
+    order in a structured array, files are replaced atomically, so
+    several processes may share the directory.
+
+    Use it with TimeSeriesEndpoint.with_store() or TimeSeries.with_store()
+    to request only the bars which are missing on disk.
+
+    :param directory: directory of the store, created if missing
+    """
+
+    suffix = ".npy"
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(symbol, interval, timezone="Exchange", adjust=None, exchange=None, mic_code=None,
+            prepost="false"):
+        return "|".join(
+            str(part or "") for part in
+            (symbol.upper(), interval, timezone, adjust, exchange, mic_code, prepost)
+        )
+
+    def _path(self, key):
+        return os.path.join(
+            self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + self.suffix
+        )
+
+    def read(self, key):
+        """
+        Returns stored bars as DataFrame in ascending order, or None
+        """
+        import numpy as np
+        import pandas as pd
+
+        try:
+            data = np.load(self._path(key), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        columns = [name for name in data.dtype.names if name != "datetime"]
+        df = pd.DataFrame({col: np.asarray(data[col]) for col in columns})
+        df.index = pd.DatetimeIndex(np.asarray(data["datetime"]), name="datetime")
+        if "volume" in df:
+            df["volume"] = df["volume"].astype("int64")
+        return df
+
+    def write(self, key, df):
+        """
+        Replaces stored bars with df
+        """
+        import numpy as np
+
+        df = df.sort_index()
+        columns = [col for col in COLUMNS if col in df.columns]
+        dtype = [("datetime", "M8[us]")] + [
+            (col, "i8" if col == "volume" else "f8") for col in columns
+        ]
+        data = np.empty(len(df), dtype=dtype)
+        data["datetime"] = df.index.values.astype("M8[us]")
+        for col in columns:
+            data[col] = df[col].to_numpy()
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=self.suffix)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, data)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def append(self, key, df):
+        """
+        Merges df into stored bars, rows of df replace stored rows with the
+        same datetime. Returns the merged DataFrame.
+        """
+        import pandas as pd
+
+        stored = self.read(key)
+        if stored is not None and len(stored):
+            df = pd.concat([stored[~stored.index.isin(df.index)], df])
+        df = df.sort_index()
+        self.write(key, df)
+        return df
+
+    def delete(self, key):
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
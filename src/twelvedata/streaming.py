@@ -0,0 +1,517 @@
+# coding: utf-8
+
+import math
+import datetime
+import threading
+from collections import deque
+
+from .utils import parse_interval_in_minutes
+
+__all__ = (
+    "EMA", "SMA", "RSI", "MACD", "ATR", "BBANDS", "VWAP", "OBV", "BarBuilder", "IndicatorFeed",
+)
+
+
+def _to_bar(bar):
+    if isinstance(bar, dict):
+        return bar
+    return {"close": float(bar)}
+
+
+class StreamingIndicator(object):
+    """
+    Base class of indicators which are updated in O(1) per bar.
+
+    ``update(bar)`` adds closed bar to the state, ``preview(bar)`` returns
+    the value as if the bar was closed without changing the state, so it
+    can be called on every tick of the forming bar. Bar is a dict with
+    open, high, low, close, volume (and optional datetime) keys or a number
+    which is treated as the close price. Values are None until there are
+    enough bars, names of multiple outputs match the API columns.
+    """
+
+    window_size = 0
+
+    def __init__(self):
+        self.window = deque(maxlen=self.window_size) if self.window_size else None
+        self.state = self.initial_state()
+        self.value = None
+
+    def initial_state(self):
+        return None
+
+    def _step(self, bar):
+        """
+        Returns new state, value and an item to append to the window,
+        must not modify the indicator
+        """
+        raise NotImplementedError
+
+    def update(self, bar):
+        self.state, self.value, item = self._step(_to_bar(bar))
+        if self.window is not None:
+            self.window.append(item)
+        return self.value
+
+    def preview(self, bar):
+        return self._step(_to_bar(bar))[1]
+
+    def warm_up(self, df):
+        """
+        Feeds the indicator with bars of TimeSeriesEndpoint.as_pandas()
+        """
+        for bar in _iter_bars(df):
+            self.update(bar)
+        return self
+
+
+class SMA(StreamingIndicator):
+    def __init__(self, time_period=9, series_type="close"):
+        self.window_size = self.time_period = int(time_period)
+        self.series_type = series_type
+        super(SMA, self).__init__()
+
+    def initial_state(self):
+        return 0.0
+
+    def _step(self, bar):
+        x = float(bar[self.series_type])
+        total = self.state + x
+        if len(self.window) == self.time_period:
+            total -= self.window[0]
+        value = total / self.time_period if len(self.window) >= self.time_period - 1 else None
+        return total, value, x
+
+
+class EMA(StreamingIndicator):
+    """
+    Exponential moving average seeded with the simple average of the first
+    time_period values. Wilder's smoothing is used when alpha is 1 / time_period.
+    """
+
+    def __init__(self, time_period=9, series_type="close", alpha=None):
+        self.time_period = int(time_period)
+        self.series_type = series_type
+        self.alpha = alpha or 2.0 / (self.time_period + 1)
+        super(EMA, self).__init__()
+
+    def initial_state(self):
+        # (number of values, sum of the seed values, current average)
+        return 0, 0.0, None
+
+    def next_value(self, x):
+        count, total, ema = self.state
+        if ema is not None:
+            ema += self.alpha * (x - ema)
+            return (count + 1, total, ema), ema
+
+        count, total = count + 1, total + x
+        if count == self.time_period:
+            ema = total / count
+        return (count, total, ema), ema
+
+    def _step(self, bar):
+        state, value = self.next_value(float(bar[self.series_type]))
+        return state, value, None
+
+
+class RSI(StreamingIndicator):
+    def __init__(self, time_period=14, series_type="close"):
+        self.time_period = int(time_period)
+        self.series_type = series_type
+        super(RSI, self).__init__()
+        self.gain = EMA(self.time_period, alpha=1.0 / self.time_period)
+        self.loss = EMA(self.time_period, alpha=1.0 / self.time_period)
+
+    def _step(self, bar):
+        x = float(bar[self.series_type])
+        if self.state is None:
+            return (x, None, None), None, None
+
+        prev, _, _ = self.state
+        gain_state, gain = self.gain.next_value(max(x - prev, 0.0))
+        loss_state, loss = self.loss.next_value(max(prev - x, 0.0))
+        if gain is None:
+            value = None
+        elif loss == 0:
+            value = 100.0
+        else:
+            value = 100 - 100 / (1 + gain / loss)
+        return (x, gain_state, loss_state), value, None
+
+    def update(self, bar):
+        value = super(RSI, self).update(bar)
+        _, gain_state, loss_state = self.state
+        if gain_state is not None:
+            self.gain.state, self.loss.state = gain_state, loss_state
+        return value
+
+
+class MACD(StreamingIndicator):
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9, series_type="close"):
+        self.series_type = series_type
+        self.fast = EMA(fast_period)
+        self.slow = EMA(slow_period)
+        self.signal = EMA(signal_period)
+        super(MACD, self).__init__()
+
+    def _step(self, bar):
+        x = float(bar[self.series_type])
+        fast_state, fast = self.fast.next_value(x)
+        slow_state, slow = self.slow.next_value(x)
+        signal_state, signal = self.signal.state, None
+        value = None
+        if slow is not None:
+            line = fast - slow
+            signal_state, signal = self.signal.next_value(line)
+            value = {
+                "macd": line,
+                "macd_signal": signal,
+                "macd_hist": None if signal is None else line - signal,
+            }
+        return (fast_state, slow_state, signal_state), value, None
+
+    def update(self, bar):
+        value = super(MACD, self).update(bar)
+        self.fast.state, self.slow.state, self.signal.state = self.state
+        return value
+
+
+class ATR(StreamingIndicator):
+    def __init__(self, time_period=14):
+        self.time_period = int(time_period)
+        super(ATR, self).__init__()
+        self.average = EMA(self.time_period, alpha=1.0 / self.time_period)
+
+    def _step(self, bar):
+        high, low, close = float(bar["high"]), float(bar["low"]), float(bar["close"])
+        if self.state is None:
+            return (close, None), None, None
+
+        prev, _ = self.state
+        true_range = max(high - low, abs(high - prev), abs(low - prev))
+        average_state, value = self.average.next_value(true_range)
+        return (close, average_state), value, None
+
+    def update(self, bar):
+        value = super(ATR, self).update(bar)
+        if self.state[1] is not None:
+            self.average.state = self.state[1]
+        return value
+
+
+class BBANDS(StreamingIndicator):
+    def __init__(self, time_period=20, sd=2, series_type="close"):
+        self.window_size = self.time_period = int(time_period)
+        self.sd = float(sd)
+        self.series_type = series_type
+        super(BBANDS, self).__init__()
+
+    def initial_state(self):
+        # Sum of values and sum of their squares
+        return 0.0, 0.0
+
+    def _step(self, bar):
+        x = float(bar[self.series_type])
+        total, squares = self.state[0] + x, self.state[1] + x * x
+        if len(self.window) == self.time_period:
+            total -= self.window[0]
+            squares -= self.window[0] ** 2
+
+        value = None
+        if len(self.window) >= self.time_period - 1:
+            mean = total / self.time_period
+            deviation = math.sqrt(max(squares / self.time_period - mean * mean, 0.0)) * self.sd
+            value = {
+                "upper_band": mean + deviation,
+                "middle_band": mean,
+                "lower_band": mean - deviation,
+            }
+        return (total, squares), value, x
+
+
+class VWAP(StreamingIndicator):
+    """
+    Volume weighted average price accumulated since the start of the day
+    of the bar datetime.
+    """
+
+    def initial_state(self):
+        return None, 0.0, 0.0
+
+    def _step(self, bar):
+        day, price_volume, volume = self.state
+        bar_day = bar["datetime"].date() if bar.get("datetime") is not None else day
+        if bar_day != day:
+            price_volume, volume = 0.0, 0.0
+
+        typical = (float(bar["high"]) + float(bar["low"]) + float(bar["close"])) / 3
+        price_volume += typical * float(bar["volume"])
+        volume += float(bar["volume"])
+        value = price_volume / volume if volume else None
+        return (bar_day, price_volume, volume), value, None
+
+
+class OBV(StreamingIndicator):
+    def __init__(self, series_type="close"):
+        self.series_type = series_type
+        super(OBV, self).__init__()
+
+    def _step(self, bar):
+        x, volume = float(bar[self.series_type]), float(bar["volume"])
+        if self.state is None:
+            return (x, volume), volume, None
+
+        prev, obv = self.state
+        if x > prev:
+            obv += volume
+        elif x < prev:
+            obv -= volume
+        return (x, obv), obv, None
+
+
+def _tzinfo(timezone):
+    if timezone is None:
+        return datetime.timezone.utc
+    if isinstance(timezone, datetime.tzinfo):
+        return timezone
+    from zoneinfo import ZoneInfo
+
+    return ZoneInfo(timezone)
+
+
+def _iter_bars(df, tz=None):
+    df = df.sort_index()
+    if tz is not None:
+        # Naive datetimes are in the given timezone, aware ones are converted to it
+        if df.index.tz is None:
+            df = df.tz_localize(tz)
+        else:
+            df = df.tz_convert(tz)
+    columns = [col for col in ("open", "high", "low", "close", "volume") if col in df.columns]
+    for dt, row in zip(df.index, df[columns].itertuples(index=False)):
+        bar = dict(zip(columns, row))
+        bar["datetime"] = dt.to_pydatetime() if hasattr(dt, "to_pydatetime") else dt
+        yield bar
+
+
+class BarBuilder(object):
+    """
+    Aggregates price events of TDWebSocket into OHLCV bars of several
+    intervals at once.
+
+    Bar datetimes are timezone aware, in the timezone of the symbol (see
+    warm_up), and bars are aligned to multiples of the interval since the
+    midnight of that timezone. Volume is taken from the differences of the
+    day_volume field, so it's zero for instruments which don't report it.
+    Closed bars are kept in a ring buffer per symbol and interval. Ticks
+    of bars which are already closed are skipped and counted in
+    ``late_events``.
+
+    :param intervals: interval or list of intervals, e.g. ["1min", "5min"]
+    :param maxlen: number of closed bars kept per symbol and interval
+    :param on_bar: function called as on_bar(symbol, interval, bar)
+        when a bar is closed
+    :param websocket: TDWebSocket to receive events from, optional
+    :param timezone: IANA name or tzinfo of symbols without their own
+        timezone, UTC by default
+    """
+
+    def __init__(self, intervals="1min", maxlen=1000, on_bar=None, websocket=None, timezone=None):
+        if isinstance(intervals, str):
+            intervals = [intervals]
+
+        self.seconds = {}
+        for interval in intervals:
+            minutes = parse_interval_in_minutes(interval)
+            if not minutes:
+                raise ValueError("Unknown interval: {}".format(interval))
+            self.seconds[interval] = int(minutes * 60)
+
+        self.maxlen = maxlen
+        self.on_bar = on_bar
+        self.timezone = _tzinfo(timezone)
+        self.timezones = {}
+        self.late_events = 0
+        self.closed = {}
+        self.forming = {}
+        self.day_volumes = {}
+        self.lock = threading.Lock()
+
+        if websocket is not None:
+            websocket.add_listener(self.on_event)
+
+    def _buffer(self, key):
+        if key not in self.closed:
+            self.closed[key] = deque(maxlen=self.maxlen)
+        return self.closed[key]
+
+    def _bar_start(self, interval, timestamp, tz):
+        seconds = self.seconds[interval]
+        timestamp = int(timestamp)
+        offset = int(datetime.datetime.fromtimestamp(timestamp, tz).utcoffset().total_seconds())
+        return datetime.datetime.fromtimestamp(
+            timestamp - (timestamp + offset) % seconds, tz
+        )
+
+    def _volume(self, symbol, event):
+        if event.get("day_volume") is None:
+            return 0.0
+
+        day_volume = float(event["day_volume"])
+        prev = self.day_volumes.get(symbol)
+        self.day_volumes[symbol] = day_volume
+        if prev is None:
+            return 0.0
+        # Day volume drops when the new trading day starts
+        return day_volume - prev if day_volume >= prev else day_volume
+
+    def on_event(self, event):
+        if event.get("event") != "price":
+            return
+
+        symbol = event["symbol"].upper()
+        price = float(event["price"])
+        closed = []
+
+        with self.lock:
+            volume = self._volume(symbol, event)
+            tz = self.timezones.get(symbol, self.timezone)
+            for interval in self.seconds:
+                key = (symbol, interval)
+                start_dt = self._bar_start(interval, event["timestamp"], tz)
+                bar = self.forming.get(key)
+
+                if bar is not None and start_dt < bar["datetime"]:
+                    # The bar of the tick is already closed
+                    self.late_events += 1
+                    continue
+
+                if bar is not None and start_dt > bar["datetime"]:
+                    self._buffer(key).append(bar)
+                    closed.append((symbol, interval, bar))
+                    bar = None
+
+                if bar is None:
+                    self.forming[key] = {
+                        "datetime": start_dt,
+                        "open": price, "high": price, "low": price, "close": price,
+                        "volume": volume,
+                    }
+                else:
+                    bar["high"] = max(bar["high"], price)
+                    bar["low"] = min(bar["low"], price)
+                    bar["close"] = price
+                    bar["volume"] = bar.get("volume", 0.0) + volume
+
+        if callable(self.on_bar):
+            for args in closed:
+                self.on_bar(*args)
+
+    __call__ = on_event
+
+    def warm_up(self, symbol, interval, df, timezone=None):
+        """
+        Fills the buffer with TimeSeriesEndpoint.as_pandas() of the symbol.
+        The latest bar is treated as the forming one, since REST data
+        usually includes the current bar.
+
+        :param timezone: IANA name or tzinfo of the naive datetimes of df,
+            e.g. exchange_timezone of the time series meta. Live bars of the
+            symbol are built in it as well.
+        """
+        key = (symbol.upper(), interval)
+        tz = _tzinfo(timezone) if timezone is not None else self.timezone
+        bars = list(_iter_bars(df, tz))
+        with self.lock:
+            self.timezones[key[0]] = tz
+            buffer = self._buffer(key)
+            buffer.extend(bars[:-1])
+            if bars:
+                self.forming[key] = bars[-1]
+        return bars[:-1]
+
+    def get_bars(self, symbol, interval, include_forming=False):
+        """
+        Returns closed bars in ascending order, optionally followed by a copy
+        of the forming one
+        """
+        key = (symbol.upper(), interval)
+        with self.lock:
+            bars = list(self.closed.get(key, ()))
+            if include_forming and key in self.forming:
+                bars.append(dict(self.forming[key]))
+        return bars
+
+    def get_forming_bar(self, symbol, interval):
+        with self.lock:
+            bar = self.forming.get((symbol.upper(), interval))
+            return dict(bar) if bar is not None else None
+
+    def as_pandas(self, symbol, interval, include_forming=False):
+        import pandas as pd
+
+        bars = self.get_bars(symbol, interval, include_forming=include_forming)
+        return pd.DataFrame(
+            bars, columns=["datetime", "open", "high", "low", "close", "volume"]
+        ).set_index("datetime")
+
+
+class IndicatorFeed(object):
+    """
+    Keeps streaming indicators of a symbol up to date with price events of
+    TDWebSocket.
+
+    Ticks are aggregated into bars of the interval by BarBuilder, indicators
+    are updated when a bar closes, while ``values()`` previews them with the
+    forming bar.
+
+    :param symbol: symbol of the events to handle
+    :param interval: bar interval, e.g. 1min, 5min, 1h
+    :param timezone: IANA name or tzinfo of the bars, UTC by default
+    :param indicators: indicators keyed by name, e.g. ema=EMA(9)
+    """
+
+    def __init__(self, symbol, interval="1min", timezone=None, **indicators):
+        self.symbol = symbol.upper()
+        self.interval = interval
+        self.indicators = indicators
+        self.builder = BarBuilder(interval, maxlen=1, on_bar=self._on_bar, timezone=timezone)
+        self.lock = threading.Lock()
+
+    @property
+    def bar(self):
+        return self.builder.get_forming_bar(self.symbol, self.interval)
+
+    def warm_up(self, df, timezone=None):
+        """
+        Seeds indicators with TimeSeriesEndpoint.as_pandas() of the symbol
+
+        :param timezone: IANA name or tzinfo of the naive datetimes of df
+        """
+        with self.lock:
+            for bar in self.builder.warm_up(self.symbol, self.interval, df, timezone=timezone):
+                for indicator in self.indicators.values():
+                    indicator.update(bar)
+        return self
+
+    def _on_bar(self, symbol, interval, bar):
+        with self.lock:
+            for indicator in self.indicators.values():
+                indicator.update(bar)
+
+    def on_event(self, event):
+        if event.get("symbol", "").upper() == self.symbol:
+            self.builder.on_event(event)
+
+    __call__ = on_event
+
+    def values(self):
+        """
+        Returns indicator values including the forming bar
+        """
+        bar = self.bar
+        with self.lock:
+            if bar is None:
+                return {name: indicator.value for name, indicator in self.indicators.items()}
+            return {name: indicator.preview(bar) for name, indicator in self.indicators.items()}
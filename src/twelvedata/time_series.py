@@ -1,20 +1,35 @@
 # coding: utf-8
 
+import copy
+import asyncio
+import inspect
 import time
 import pytimeparse
 import re
 import itertools
 from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from .endpoints import *
-from .utils import apply_context_defaults, force_use_kwargs, parse_interval_in_minutes
+from .endpoints import split_symbols
+from .utils import (
+    apply_context_defaults,
+    ensure_endpoints_meta,
+    force_use_kwargs,
+    parse_interval_in_minutes,
+)
 
 __all__ = ("TimeSeries",)
 
 
+# Maximum number of requests of one chart sent at the same time by default
+MAX_WORKERS = 8
+
+
 class TimeSeries(object):
     def __init__(
-            self, ctx, endpoints=(), price_endpoint=None, price_endpoint_enabled=True
+            self, ctx, endpoints=(), price_endpoint=None, price_endpoint_enabled=True,
+            executor=None, max_workers=MAX_WORKERS, local_indicators=False,
     ):
         self.ctx = ctx
         self.price_endpoint_enabled = price_endpoint_enabled
@@ -22,6 +37,9 @@ class TimeSeries(object):
             self.ctx, **self.ctx.defaults
         )
         self.endpoints = endpoints
+        self.executor = executor
+        self.max_workers = max_workers
+        self.local_indicators = local_indicators
 
     def clone(self):
         return TimeSeries(
@@ -29,16 +47,89 @@ class TimeSeries(object):
             endpoints=self.endpoints,
             price_endpoint=self.price_endpoint,
             price_endpoint_enabled=self.price_endpoint_enabled,
+            executor=self.executor,
+            max_workers=self.max_workers,
+            local_indicators=self.local_indicators,
         )
 
+    def with_executor(self, executor=None, max_workers=MAX_WORKERS):
+        """
+        Sets how the requests of the chart are sent concurrently
+
+        :param executor: concurrent.futures.Executor used to send requests,
+            by default a thread pool is created for every call
+        :param max_workers: size of the default thread pool, 1 sends the
+            requests one after another
+        """
+        ts = self.clone()
+        ts.executor = executor
+        ts.max_workers = max_workers
+        return ts
+
+    def with_store(self, store):
+        """
+        Keeps price data in the OHLCVStore, so only the bars missing there
+        are requested
+
+        :param store: OHLCVStore instance, None disables the store
+        """
+        return self._with_price_endpoint(self.price_endpoint.with_store(store))
+
+    def with_local_indicators(self, enabled=True):
+        """
+        Computes supported indicators from the price data instead of
+        requesting them from the API, so as_pandas() costs a single request.
+        Indicators which can't be computed locally are still requested.
+
+        :param enabled: False turns remote indicators back on
+        """
+        ts = self.clone()
+        ts.local_indicators = enabled
+        return ts
+
+    def _endpoints_to_fetch(self):
+        if self.price_endpoint_enabled:
+            return (self.price_endpoint,) + tuple(self.endpoints)
+        return tuple(self.endpoints)
+
+    def _fetch(self, fetch, merge):
+        """
+        Calls fetch for the price endpoint (if enabled) and for every
+        indicator endpoint concurrently, then merges the results in their
+        original order. If the endpoints use an asynchronous HTTP client,
+        returns a coroutine.
+        """
+        endpoints = self._endpoints_to_fetch()
+
+        if inspect.iscoroutinefunction(self.ctx.http_client.get):
+            async def _gather():
+                return merge(await asyncio.gather(*(fetch(ep) for ep in endpoints)))
+            return _gather()
+
+        return merge(self._map(fetch, endpoints))
+
+    def _map(self, fetch, endpoints):
+        if self.executor is not None:
+            return list(self.executor.map(fetch, endpoints))
+
+        if len(endpoints) < 2 or self.max_workers < 2:
+            return [fetch(ep) for ep in endpoints]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(endpoints))) as executor:
+            return list(executor.map(fetch, endpoints))
+
     def as_json(self):
+        return self._fetch(lambda ep: ep.as_json(), self._merge_json)
+
+    def _merge_json(self, results):
         out = OrderedDict()
         is_batch = False
         postfixes = self._generate_postfixes()
+        results = iter(results)
 
         error_symbols = []
         if self.price_endpoint_enabled:
-            time_series_json = self.price_endpoint.as_json()
+            time_series_json = next(results)
             is_batch = self.price_endpoint.is_batch
             for row_symbol in time_series_json:
                 if self.price_endpoint.is_batch:
@@ -52,12 +143,11 @@ class TimeSeries(object):
                 else:
                     out.setdefault(row_symbol["datetime"], {}).update(row_symbol)
 
-        for ep in self.endpoints:
+        for ep, indicator_json in zip(self.endpoints, results):
             postfix = str(next(postfixes[ep.__class__]))
-            indicator_json = ep.as_json()
             for row in indicator_json:
                 if ep.is_batch:
-                    if row.upper() in error_symbols:
+                    if row.upper() in error_symbols or indicator_json[row].get('status') == 'error':
                         continue
                     values = out[row]
                     for v in indicator_json[row]['values']:
@@ -84,17 +174,24 @@ class TimeSeries(object):
         return tuple(out.values())
 
     def as_csv(self, **kwargs):
+        return self._fetch(
+            lambda ep: ep.as_csv(**(kwargs if ep is not self.price_endpoint else {})),
+            self._merge_csv,
+        )
+
+    def _merge_csv(self, results):
         out = OrderedDict()
         postfixes = self._generate_postfixes()
+        results = iter(results)
 
         if self.price_endpoint_enabled:
-            for row in self.price_endpoint.as_csv():
+            for row in next(results):
                 out.setdefault(row[0], []).extend(row)
 
-        for ep in self.endpoints:
+        for ep, rows in zip(self.endpoints, results):
             postfix = str(next(postfixes[ep.__class__]))
 
-            for row in ep.as_csv(**kwargs):
+            for row in rows:
                 if row[0] == "datetime":
                     row = ["{}{}".format(header, postfix) for header in row[1:]]
                     row.insert(0, "datetime")
@@ -106,17 +203,77 @@ class TimeSeries(object):
         return tuple(out.values())
 
     def as_pandas(self, **kwargs):
+        if self._uses_local_indicators():
+            return self._as_pandas_local(**kwargs)
+
+        return self._fetch(
+            lambda ep: ep.as_pandas(**(kwargs if ep is not self.price_endpoint else {})),
+            self._merge_pandas,
+        )
+
+    def _uses_local_indicators(self):
+        if not self.local_indicators or inspect.iscoroutinefunction(self.ctx.http_client.get):
+            return False
+        if len(split_symbols(self.price_endpoint.symbol)) > 1:
+            return False
+
+        from .indicators import LOCAL_INDICATORS
+        return any(ep.__class__ in LOCAL_INDICATORS for ep in self.endpoints)
+
+    def _as_pandas_local(self, **kwargs):
+        """
+        Fetches price data (with extra bars to warm up the indicators) and
+        remote indicators concurrently, then computes local ones from it.
+        """
+        from .indicators import LOCAL_INDICATORS, compute_indicator, warmup_size
+
+        local = [ep for ep in self.endpoints if ep.__class__ in LOCAL_INDICATORS]
+        remote = [ep for ep in self.endpoints if ep.__class__ not in LOCAL_INDICATORS]
+
+        price_ep = copy.copy(self.price_endpoint)
+        outputsize = price_ep.outputsize
+        extended = price_ep.start_date is None and outputsize is not None
+        if extended:
+            warmup = max(warmup_size(ep) for ep in local)
+            price_ep.outputsize = min(int(outputsize) + warmup, 5000)
+
+        frames = self._map(
+            lambda ep: ep.as_pandas(**(kwargs if ep is not price_ep else {})),
+            [price_ep] + remote,
+        )
+        price_df = frames[0]
+        if extended:
+            latest = price_df.index.sort_values()[-int(outputsize):]
+            price_df = price_df[price_df.index.isin(latest)]
+
+        remote_frames = dict(zip(map(id, remote), frames[1:]))
+        results = [price_df] if self.price_endpoint_enabled else []
+        for ep in self.endpoints:
+            if id(ep) in remote_frames:
+                results.append(remote_frames[id(ep)])
+                continue
+
+            df = compute_indicator(frames[0], ep)
+            if df is None:
+                df = ep.as_pandas(**kwargs)
+            else:
+                df = df.loc[price_df.index]
+            results.append(df)
+
+        return self._merge_pandas(results)
+
+    def _merge_pandas(self, results):
         import pandas
 
         postfixes = self._generate_postfixes()
+        results = iter(results)
 
         if self.price_endpoint_enabled:
-            df = self.price_endpoint.as_pandas()
+            df = next(results)
         else:
             df = None
 
-        for ep in self.endpoints:
-            tmp_df = ep.as_pandas(**kwargs)
+        for ep, tmp_df in zip(self.endpoints, results):
             tmp_df = tmp_df.add_suffix(str(next(postfixes[ep.__class__])))
 
             if df is None:
@@ -178,6 +335,7 @@ class TimeSeries(object):
         register_matplotlib_converters()
 
         plt.rcParams["figure.figsize"] = figsize
+        ensure_endpoints_meta()
         subplots_count = self._count_subplots()
 
         def mark_xaxis_as_date(x):
@@ -262,6 +420,7 @@ class TimeSeries(object):
         from plotly.subplots import make_subplots
         import plotly.graph_objs as go
 
+        ensure_endpoints_meta()
         subplots_count = self._count_subplots()
 
         # All subplots should have %25 height from the main plot
@@ -1,7 +1,14 @@
 # coding: utf-8
 
+import os
+import json
+import time
+import random
 import inspect
-import operator
+import logging
+import tempfile
+import threading
+import datetime
 import functools
 import textwrap
 import pytimeparse
@@ -9,18 +16,134 @@ import pytimeparse
 from .exceptions import BadRequestError
 
 
-def patch_endpoints_meta(ctx):
+def _import_json_decoder(name):
+    if name == "orjson":
+        import orjson
+        return orjson.loads
+    if name == "ujson":
+        import ujson
+        return ujson.loads
+    if name == "json":
+        return json.loads
+    raise ValueError("Unknown JSON decoder: {}".format(name))
+
+
+def _default_json_decoder():
+    for name in ("orjson", "ujson"):
+        try:
+            return _import_json_decoder(name)
+        except ImportError:
+            pass
+    return json.loads
+
+
+json_loads = _default_json_decoder()
+
+
+def set_json_decoder(decoder):
     """
-    Loads technical indicators metadata from the remote source 
-    and patches endpoint classes according to the loaded metadata.
+    Sets the function used to decode JSON responses and websocket events.
+    By default orjson or ujson is used when installed, otherwise the
+    standard json module.
+
+    :param decoder: "orjson", "ujson", "json" or a callable accepting bytes or str
     """
-    from . import endpoints
+    global json_loads
 
-    if hasattr(patch_endpoints_meta, "patched"):
-        return
+    if callable(decoder):
+        json_loads = decoder
+    else:
+        json_loads = _import_json_decoder(decoder)
+
+
+def decode_json(data):
+    """
+    Decodes JSON document with the configured decoder. Documents rejected
+    by a fast decoder (e.g. containing NaN) are decoded by the standard
+    json module.
+    """
+    try:
+        return json_loads(data)
+    except ValueError:
+        if json_loads is json.loads:
+            raise
+        return json.loads(data)
+
+
+def decode_response(resp, keep=False):
+    """
+    Decodes JSON body of the HTTP response.
+
+    With keep the decoded body is left on the response and handed over to
+    the next call, so the body of a request is decoded only once. It's
+    handed over only once, because the same response may be returned to
+    several callers by caches and coalesced requests, and the callers
+    must not share mutable objects.
+
+    :param keep: keep the decoded body for the next call
+    """
+    data = vars(resp).pop("_decoded_json", None)
+    if data is None:
+        data = decode_json(resp.content)
+        if keep:
+            resp._decoded_json = data
+    return data
+
+
+# Technical indicators metadata cached on disk is refreshed after this many seconds
+META_CACHE_TTL_S = 86400
+
+_meta_lock = threading.Lock()
+_meta_ctx = []
 
-    meta_ep = endpoints.TechIndicatorsMetaEndpoint(ctx)
-    all_meta = meta_ep.as_json()
+
+def _meta_cache_path():
+    directory = os.environ.get("TWELVEDATA_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "twelvedata",
+    )
+    return os.path.join(directory, "technical_indicators.json")
+
+
+def _load_bundled_meta():
+    # The snapshot has the format of the cache file which is written by
+    # refresh_endpoints_meta(), it's regenerated by copying that file
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "technical_indicators.json")
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _load_cached_meta():
+    """
+    Returns metadata cached on disk (or None) and whether it's still fresh
+    """
+    path = _meta_cache_path()
+    try:
+        with open(path, "r") as f:
+            meta = json.load(f)
+        age = time.time() - os.path.getmtime(path)
+    except (OSError, ValueError):
+        return None, False
+    return meta, age < META_CACHE_TTL_S
+
+
+def _save_cached_meta(meta):
+    path = _meta_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def apply_endpoints_meta(all_meta):
+    """
+    Patches endpoint classes according to technical indicators metadata
+    """
+    from . import endpoints
 
     for ep in (getattr(endpoints, attr) for attr in endpoints.__all__):
         meta = all_meta.get(ep._name)
@@ -44,7 +167,59 @@ def patch_endpoints_meta(ctx):
             fill_area = meta["tinting"].get("area") or {}
             ep.fill_area = fill_area
 
-    setattr(patch_endpoints_meta, "patched", True)
+
+def patch_endpoints_meta(ctx):
+    """
+    Remembers the context used to refresh technical indicators metadata,
+    the one of the most recently created client wins. Nothing is requested
+    here, the metadata is applied lazily by ensure_endpoints_meta() when
+    it's needed for rendering.
+    """
+    _meta_ctx[:] = [ctx]
+
+
+def ensure_endpoints_meta():
+    """
+    Patches endpoint classes with technical indicators metadata once per
+    process. The copy cached on disk, or the snapshot bundled with the
+    package when there is none, is applied at once, so rendering never
+    waits for the API. Unless the cached copy is fresh, the metadata is
+    refreshed from the API in a background thread.
+    """
+    if hasattr(patch_endpoints_meta, "patched"):
+        return
+
+    with _meta_lock:
+        if hasattr(patch_endpoints_meta, "patched"):
+            return
+
+        meta, fresh = _load_cached_meta()
+        apply_endpoints_meta(meta or _load_bundled_meta())
+        setattr(patch_endpoints_meta, "patched", True)
+
+    if not fresh and _meta_ctx:
+        thread = threading.Thread(target=refresh_endpoints_meta, args=(_meta_ctx[-1],))
+        thread.daemon = True
+        thread.start()
+
+
+def refresh_endpoints_meta(ctx):
+    """
+    Loads technical indicators metadata from the API, applies it and
+    caches it on disk. Returns False if it could not be loaded.
+    """
+    from . import endpoints
+
+    try:
+        meta = endpoints.TechIndicatorsMetaEndpoint(ctx).as_json()
+    except Exception as e:
+        logging.getLogger(__name__).warning(
+            "Cannot load technical indicators metadata: {}".format(e))
+        return False
+
+    apply_endpoints_meta(meta)
+    _save_cached_meta(meta)
+    return True
 
 
 def force_use_kwargs(func):
@@ -58,11 +233,11 @@ def force_use_kwargs(func):
 
 
 def apply_context_defaults(func):
+    # Arguments are looked up once, not on every call
+    func_args = frozenset(inspect.getargs(func.__code__).args) - {"self"}
+
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        func_args = inspect.getargs(func.__code__).args
-        func_args.remove("self")
-
         _kwargs = {k: v for k, v in self.ctx.defaults.items() if k in func_args}
         _kwargs.update(kwargs)
         return func(self, *args, **_kwargs)
@@ -107,15 +282,18 @@ def add_null_obj_values(obj, columns) -> dict:
     return obj
 
 
-def convert_collection_to_pandas(val, indexing_type=None):
+def convert_collection_to_pandas(val, indexing_type=None, dtypes=None):
     """
     Converts list/dict to DataFrame
 
     :param val: list or dict
+    :param dtypes: mapping of column name to dtype, columns which can't be
+        converted to the dtype are kept as is
     :returns: pandas DataFrame
     """
     try:
         import pandas
+        import numpy
     except ImportError:
         raise ImportError(
             textwrap.dedent(
@@ -135,13 +313,21 @@ def convert_collection_to_pandas(val, indexing_type=None):
         if len(val) == 0:
             return pandas.DataFrame()
         else:
-            columns_beg = tuple(val[0].keys())
-            columns_end = tuple(val[-1].keys())
-            get_row = operator.itemgetter(*columns_end)
-            data = [get_row(add_null_obj_values(obj, columns_end)) if
-                    columns_beg != columns_end else
-                    get_row(obj) for obj in val]
-            return pandas.DataFrame(data, columns=columns_end)
+            # Build the frame column by column, which is much faster than
+            # building it from rows and lets pandas skip dtype inference
+            columns = tuple(val[-1].keys())
+            dtypes = dtypes or {}
+            data = {}
+            for col in columns:
+                values = [obj.get(col) for obj in val]
+                dtype = dtypes.get(col)
+                if dtype is not None:
+                    try:
+                        values = numpy.asarray(values, dtype=dtype)
+                    except (ValueError, TypeError):
+                        pass
+                data[col] = values
+            return pandas.DataFrame(data, columns=columns)
     elif isinstance(val, dict):
         try:
             return pandas.DataFrame.from_dict(val, orient="index", dtype="float")
@@ -153,6 +339,36 @@ def convert_collection_to_pandas(val, indexing_type=None):
         raise ValueError("Expected list, tuple or dict, but {} found".format(type(val)))
 
 
+def datetime_format(value):
+    """
+    Returns format of the datetime string returned by the API or None
+    if the format is unknown.
+    """
+    if isinstance(value, str):
+        if len(value) == 10:
+            return "%Y-%m-%d"
+        if len(value) == 19 and value[10] == " ":
+            return "%Y-%m-%d %H:%M:%S"
+    return None
+
+
+def convert_to_datetime_index(values):
+    """
+    Converts datetime strings returned by the API to DatetimeIndex. Known
+    formats are parsed with an explicit format, which is faster than
+    letting pandas guess it.
+    """
+    import pandas
+
+    fmt = datetime_format(values[0]) if len(values) > 0 else None
+    if fmt is not None:
+        try:
+            return pandas.to_datetime(values, format=fmt)
+        except ValueError:
+            pass
+    return pandas.to_datetime(values)
+
+
 def convert_collection_to_pandas_multi_index(val):
     try:
         import pandas
@@ -171,28 +387,45 @@ def convert_collection_to_pandas_multi_index(val):
             ).strip()
         )
 
-    columns = ()
+    import numpy
+
+    symbols = []
+    rows = []
+    columns = {}
     for symbol, data in val.items():
         if data['status'] == 'error':
             raise BadRequestError(data['message'])
-        keys = list(data['values'][-1].keys())[1:]
-        if len(keys) > len(columns):
-            columns = keys
-
-    arr = []
-    multi_index = []
-
-    for symbol, data in val.items():
-        if 'values' in data:
-            values = data['values']
-            for quote in values:
-                candle = tuple(quote.values())
-                multi_index.append((symbol, candle[0]))
-                arr.append(candle[1:])
-
-    idx = pandas.MultiIndex.from_tuples(multi_index)
-
-    return pandas.DataFrame(arr, index=idx, columns=columns)
+        values = data.get('values') or []
+        symbols.append(symbol)
+        rows.append(values)
+
+        # Union of the columns of all symbols, in order of appearance,
+        # since e.g. forex pairs have no volume
+        for quote in (values[0], values[-1]) if values else ():
+            for key in quote:
+                if key != 'datetime':
+                    columns.setdefault(key, None)
+
+    # Build the index from codes and levels instead of tuples
+    lengths = [len(values) for values in rows]
+    datetimes = [quote['datetime'] for values in rows for quote in values]
+    symbol_codes, symbol_levels = pandas.factorize(
+        numpy.repeat(numpy.array(symbols, dtype=object), lengths), sort=True
+    )
+    datetime_codes, datetime_levels = pandas.factorize(
+        numpy.array(datetimes, dtype=object), sort=True
+    )
+    idx = pandas.MultiIndex(
+        levels=[symbol_levels, datetime_levels],
+        codes=[symbol_codes, datetime_codes],
+        verify_integrity=False,
+    )
+
+    data = {
+        col: [quote.get(col) for values in rows for quote in values]
+        for col in columns
+    }
+    return pandas.DataFrame(data, index=idx, columns=list(columns))
 
 
 def parse_interval_in_minutes(interval):
@@ -216,3 +449,84 @@ def parse_interval_in_minutes(interval):
         return secs / 60
     else:
         return None
+
+
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+def parse_date(value):
+    """
+    Parses the date in one of the formats accepted by the API.
+
+    :param value: string such as 2020-01-01 or 2020-01-01 10:00:00, or datetime
+    :returns: datetime
+    """
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day)
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            pass
+    raise ValueError("Unsupported date format: {}".format(value))
+
+
+def split_date_range(start_date, end_date, interval, size):
+    """
+    Splits the date range into consecutive windows holding at most size
+    bars of the interval, both ends included. Adjacent windows share their
+    boundary, so rows at the edges should be de-duplicated by the caller.
+
+    :returns: list of (start, end) tuples of datetime
+    """
+    minutes = parse_interval_in_minutes(interval)
+    if not minutes:
+        raise ValueError("Unsupported interval: {}".format(interval))
+
+    start = parse_date(start_date)
+    end = parse_date(end_date)
+    # A window of n intervals holds n + 1 bars when both ends are included
+    step = datetime.timedelta(minutes=minutes * max(size - 1, 1))
+
+    windows = []
+    while start < end:
+        windows.append((start, min(start + step, end)))
+        start += step
+    return windows
+
+
+class ExponentialBackoff(object):
+    """
+    Delays between reconnection attempts which grow exponentially up to
+    the cap. With jitter the delay is picked uniformly from zero to the
+    exponential value, so many clients don't reconnect in lockstep.
+
+    :param base: delay of the first attempt in seconds
+    :param factor: multiplier applied after every attempt
+    :param cap: maximum delay in seconds
+    :param jitter: randomize delays
+    """
+
+    def __init__(self, base=1.0, factor=2.0, cap=60.0, jitter=True):
+        self.base = base
+        self.factor = factor
+        self.cap = cap
+        self.jitter = jitter
+        self.attempts = 0
+
+    def next(self):
+        """
+        Returns the delay before the next attempt
+        """
+        # The exponent is bounded to avoid overflow after long outages
+        delay = min(self.cap, self.base * self.factor ** min(self.attempts, 64))
+        self.attempts += 1
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def reset(self):
+        self.attempts = 0
@@ -3,8 +3,204 @@ import threading
 import json
 import logging
 import queue
+import asyncio
+import textwrap
+import zlib
+from collections import deque, namedtuple
+
+from .context import Context
+from .utils import decode_json, ExponentialBackoff
 
 MAX_QUEUE_SIZE = 12000
+BATCH_SIZE = 500
+BATCH_TIMEOUT_MS = 50
+SHARDS = 4
+HEARTBEAT_INTERVAL_S = 10
+MAX_BACKOFF_S = 60
+CIRCUIT_THRESHOLD = 10
+CIRCUIT_COOLDOWN_S = 300
+
+
+Quote = namedtuple("Quote", ("symbol", "price", "timestamp", "day_volume"))
+
+
+class QuoteSnapshotStore(object):
+    """
+    Latest quote of every symbol received by the websocket.
+
+    Quotes are immutable tuples replaced as a whole, so reads don't take
+    any lock and never see a partially updated quote.
+    """
+
+    def __init__(self):
+        self.quotes = {}
+
+    def update(self, event):
+        if event.get("event") != "price":
+            return
+        symbol = event.get("symbol")
+        if symbol is None:
+            return
+        self.quotes[symbol.upper()] = Quote(
+            symbol.upper(), event.get("price"), event.get("timestamp"), event.get("day_volume"),
+        )
+
+    def get(self, symbol, default=None):
+        return self.quotes.get(symbol.upper(), default)
+
+    def price(self, symbol, default=None):
+        quote = self.quotes.get(symbol.upper())
+        return default if quote is None else quote.price
+
+    def get_many(self, symbols, fallback=None):
+        """
+        Returns dict of symbol to Quote, None for unknown symbols.
+
+        :param fallback: function called with the list of unknown symbols,
+            returning dict of symbol to Quote, e.g. rest_quotes(td)
+        """
+        quotes = self.quotes
+        out = {symbol: quotes.get(symbol.upper()) for symbol in symbols}
+        missing = [symbol for symbol, quote in out.items() if quote is None]
+        if missing and fallback is not None:
+            out.update(fallback(missing))
+        return out
+
+    def discard(self, symbols):
+        for symbol in symbols:
+            self.quotes.pop(symbol.upper(), None)
+
+    def clear(self):
+        self.quotes.clear()
+
+    def __contains__(self, symbol):
+        return symbol.upper() in self.quotes
+
+    def __len__(self):
+        return len(self.quotes)
+
+
+def rest_quotes(td):
+    """
+    Returns fallback for QuoteSnapshotStore.get_many() which requests
+    prices of the symbols with a single PriceEndpoint request
+
+    :param td: TDClient instance
+    """
+
+    def fallback(symbols):
+        data = td.price(symbol=",".join(symbols)).as_json()
+        if len(symbols) == 1:
+            data = {symbols[0]: data}
+        quotes = {}
+        for symbol in symbols:
+            row = data.get(symbol) or data.get(symbol.upper()) or {}
+            if "price" in row:
+                quotes[symbol] = Quote(symbol.upper(), float(row["price"]), None, None)
+        return quotes
+
+    return fallback
+
+
+class EventQueue(queue.Queue):
+    """
+    Queue of received events with a policy applied when handlers fall
+    behind:
+
+    * drop_newest - new events are rejected when the queue is full
+    * drop_oldest - the oldest events are discarded to make room for new ones
+    * conflate - a price event replaces the pending event of the same
+      symbol, so handlers get the latest price instead of a backlog;
+      other events are rejected when the queue is full
+
+    Counters of enqueued, dropped and conflated events are available
+    through stats().
+    """
+
+    POLICIES = ("drop_newest", "drop_oldest", "conflate")
+
+    def __init__(self, maxsize=0, policy="drop_newest"):
+        if policy not in self.POLICIES:
+            raise ValueError("Unknown queue policy: {}".format(policy))
+        self.policy = policy
+        self.enqueued = 0
+        self.dropped = 0
+        self.conflated = 0
+        queue.Queue.__init__(self, maxsize)
+
+    def _init(self, maxsize):
+        self.queue = deque()
+        # Pending price events by symbol, wrapped into lists to be replaced in place
+        self.pending = {}
+
+    @staticmethod
+    def _symbol(item):
+        if isinstance(item, dict) and item.get("event") == "price":
+            return item.get("symbol")
+        return None
+
+    def _put(self, item):
+        symbol = self._symbol(item) if self.policy == "conflate" else None
+        if symbol is not None:
+            item = [item]
+            self.pending[symbol] = item
+        self.queue.append(item)
+        self.enqueued += 1
+
+    def _get(self):
+        item = self.queue.popleft()
+        if isinstance(item, list):
+            event = item[0]
+            symbol = self._symbol(event)
+            if self.pending.get(symbol) is item:
+                del self.pending[symbol]
+            return event
+        return item
+
+    def put(self, item, block=True, timeout=None):
+        if self.policy != "drop_newest":
+            with self.mutex:
+                symbol = self._symbol(item) if self.policy == "conflate" else None
+                if symbol in self.pending:
+                    self.pending[symbol][0] = item
+                    self.conflated += 1
+                    return
+
+                if self.policy == "drop_oldest" and self.maxsize > 0:
+                    while self._qsize() >= self.maxsize:
+                        self._get()
+                        self.unfinished_tasks -= 1
+                        self.dropped += 1
+                    self._put(item)
+                    self.unfinished_tasks += 1
+                    self.not_empty.notify()
+                    return
+
+        try:
+            queue.Queue.put(self, item, block, timeout)
+        except queue.Full:
+            with self.mutex:
+                self.dropped += 1
+            raise
+
+    def get_many(self, max_items):
+        """
+        Removes and returns up to max_items events without waiting for them
+        """
+        with self.mutex:
+            items = [self._get() for _ in range(min(max_items, self._qsize()))]
+            if items:
+                self.not_full.notify(len(items))
+            return items
+
+    def stats(self):
+        with self.mutex:
+            return {
+                "enqueued": self.enqueued,
+                "dropped": self.dropped,
+                "conflated": self.conflated,
+                "depth": self._qsize(),
+            }
 
 
 class TDWebSocket:
@@ -19,14 +215,42 @@ class TDWebSocket:
         self.event_handler = None
         self.last_queue_warning_time = 0
         self.subscribed_symbols = set()
+        self.listeners = []
+        self.lock = threading.RLock()
+        self.quotes = QuoteSnapshotStore()
+
+        # Reconnection: jittered exponential backoff, after circuit_threshold
+        # consecutive failures the circuit opens and the next attempt
+        # is delayed by circuit_cooldown_s
+        self.backoff = ExponentialBackoff(
+            base=self.self_heal_time_s, cap=self.defaults.get("max_backoff_s", MAX_BACKOFF_S),
+        )
+        self.circuit_threshold = self.defaults.get("circuit_threshold", CIRCUIT_THRESHOLD)
+        self.circuit_cooldown_s = self.defaults.get("circuit_cooldown_s", CIRCUIT_COOLDOWN_S)
+        self.failures = 0
+        self.disconnected_at = None
+        self.reconnect_metrics = {
+            "reconnects": 0,
+            "failures": 0,
+            "circuit_opened": 0,
+            "last_reconnect_latency_s": None,
+            "max_reconnect_latency_s": None,
+        }
 
         self.logger = self.set_default_logger()
         self.symbols = self.set_default_symbols()
         self.events = self.set_default_events_queue()
         self.on_event = self.set_default_event_function()
+        self.on_events = self.set_default_events_function()
+        self.batch_size = self.defaults.get("batch_size", BATCH_SIZE)
+        self.batch_timeout_ms = self.defaults.get("batch_timeout_ms", BATCH_TIMEOUT_MS)
+        self.columnar = self.defaults.get("columnar", False)
 
         self.url = "wss://ws.twelvedata.com/v1/quotes/price?apikey={}".format(self.apikey)
 
+        self.start_event_handler()
+
+    def start_event_handler(self):
         EventHandler(self).start()
 
     def set_default_logger(self):
@@ -56,9 +280,10 @@ class TDWebSocket:
         return set()
 
     def set_default_events_queue(self):
-        if "max_queue_size" in self.defaults:
-            return queue.Queue(maxsize=self.defaults["max_queue_size"])
-        return queue.Queue(maxsize=MAX_QUEUE_SIZE)
+        return EventQueue(
+            maxsize=self.defaults.get("max_queue_size", MAX_QUEUE_SIZE),
+            policy=self.defaults.get("queue_policy", "drop_newest"),
+        )
 
     def set_default_event_function(self):
         if "on_event" in self.defaults:
@@ -68,30 +293,60 @@ class TDWebSocket:
                 return self.defaults["on_event"]
         return None
 
+    def set_default_events_function(self):
+        if "on_events" in self.defaults:
+            if not callable(self.defaults["on_events"]):
+                raise ValueError("Parameter 'on_events' must be a function")
+            else:
+                return self.defaults["on_events"]
+        return None
+
+    def add_listener(self, listener):
+        """
+        Adds function which is called with every event, after on_event
+        """
+        if not callable(listener):
+            raise ValueError("Listener must be a function")
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
     def connect(self):
         self.logger.info("Connecting...")
-        self.ready = False
-        self.subscribed_symbols = set()
+        with self.lock:
+            self.ready = False
+            self.subscribed_symbols = set()
 
         if self.ws:
             self.ws.close()
-            time.sleep(1)
+            self.wait_event_receiver()
 
         while True:
             try:
                 self.refresh_websocket()
                 break
             except Exception as e:
-                self.logger.error("Cannot connect: {}. Retrying...".format(e))
-                time.sleep(self.self_heal_time_s)
+                delay = self.reconnect_delay()
+                self.logger.error("Cannot connect: {}. Retrying in {:.1f}s...".format(e, delay))
+                time.sleep(delay)
 
     def disconnect(self):
-        self.ready = False
-        self.subscribed_symbols = set()
+        with self.lock:
+            self.ready = False
+            self.subscribed_symbols = set()
 
         if self.ws:
             self.ws.close()
-            time.sleep(1)
+            self.wait_event_receiver()
+
+    def wait_event_receiver(self, timeout=1):
+        """
+        Waits until the closed connection stops its receiver thread
+        """
+        receiver = self.event_receiver
+        if receiver is not None and receiver is not threading.current_thread():
+            receiver.join(timeout)
 
     def keep_alive(self):
         self.logger.info('Method keep_alive is deprecated, use heartbeat method instead')
@@ -111,12 +366,52 @@ class TDWebSocket:
         self.event_receiver.start()
 
     def self_heal(self):
-        time.sleep(self.self_heal_time_s)
+        if self.disconnected_at is None:
+            self.disconnected_at = time.time()
+        time.sleep(self.reconnect_delay())
         self.connect()
 
+    def reconnect_delay(self):
+        """
+        Registers failed connection and returns the delay before the next
+        attempt
+        """
+        self.failures += 1
+        self.reconnect_metrics["failures"] += 1
+        if self.failures < self.circuit_threshold:
+            return self.backoff.next()
+
+        # Too many failures in a row, stop hammering the server for a while
+        self.failures = 0
+        self.backoff.reset()
+        self.reconnect_metrics["circuit_opened"] += 1
+        self.logger.error(
+            "Reconnection failed {} times, next attempt in {}s".format(
+                self.circuit_threshold, self.circuit_cooldown_s)
+        )
+        return self.circuit_cooldown_s
+
     def on_connect(self):
-        self.ready = True
-        self.update_subscription_symbols()
+        if self.disconnected_at is not None:
+            latency = time.time() - self.disconnected_at
+            metrics = self.reconnect_metrics
+            metrics["reconnects"] += 1
+            metrics["last_reconnect_latency_s"] = latency
+            metrics["max_reconnect_latency_s"] = max(metrics["max_reconnect_latency_s"] or 0, latency)
+            self.disconnected_at = None
+        self.failures = 0
+        self.backoff.reset()
+
+        with self.lock:
+            self.ready = True
+            self.update_subscription_symbols()
+
+    def enqueue_event(self, event):
+        self.quotes.update(event)
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.on_queue_full()
 
     def on_queue_full(self):
         if time.time() - self.last_queue_warning_time > 1:
@@ -129,8 +424,9 @@ class TDWebSocket:
         else:
             symbols = self.normalize_symbols(symbols)
 
-        self.symbols = self.symbols | set(symbols)
-        self.update_subscription_symbols()
+        with self.lock:
+            self.symbols = self.symbols | set(symbols)
+            self.update_subscription_symbols()
 
     def unsubscribe(self, symbols):
         if isinstance(symbols, str):
@@ -138,34 +434,44 @@ class TDWebSocket:
         else:
             symbols = self.normalize_symbols(symbols)
 
-        self.symbols = self.symbols - set(symbols)
-        self.update_subscription_symbols()
+        with self.lock:
+            self.symbols = self.symbols - set(symbols)
+            self.update_subscription_symbols()
+        self.quotes.discard(symbols)
 
     def reset(self):
-        self.symbols = set()
-        self.subscribed_symbols = set()
-        self.ws.send('{"action": "reset"}')
+        with self.lock:
+            self.symbols = set()
+            self.subscribed_symbols = set()
+            self.ws.send('{"action": "reset"}')
+        self.quotes.clear()
 
     def update_subscription_symbols(self):
-        if not self.ready:
-            return
-
-        # Subscribe
-        new_symbols = self.symbols - self.subscribed_symbols
-        if len(new_symbols) > 0:
-            self.logger.debug("New symbols: {}".format(new_symbols))
-            ev = self.subscribe_event(new_symbols)
-            self.ws.send(json.dumps(ev))
-
-        # Unsubscribe
-        remove_symbols = self.subscribed_symbols - self.symbols
-        if len(remove_symbols) > 0:
-            self.logger.debug("Removed symbols: {}".format(remove_symbols))
-            ev = self.unsubscribe_event(remove_symbols)
-            self.ws.send(json.dumps(ev))
-
-        self.subscribed_symbols = self.symbols.copy()
-        self.logger.debug("Current symbols: {}".format(self.subscribed_symbols))
+        """
+        Sends the difference between wanted and subscribed symbols. After
+        reconnection nothing is subscribed, so all symbols are replayed
+        in one message.
+        """
+        with self.lock:
+            if not self.ready:
+                return
+
+            # Subscribe
+            new_symbols = self.symbols - self.subscribed_symbols
+            if len(new_symbols) > 0:
+                self.logger.debug("New symbols: {}".format(new_symbols))
+                ev = self.subscribe_event(new_symbols)
+                self.ws.send(json.dumps(ev))
+
+            # Unsubscribe
+            remove_symbols = self.subscribed_symbols - self.symbols
+            if len(remove_symbols) > 0:
+                self.logger.debug("Removed symbols: {}".format(remove_symbols))
+                ev = self.unsubscribe_event(remove_symbols)
+                self.ws.send(json.dumps(ev))
+
+            self.subscribed_symbols = self.symbols.copy()
+            self.logger.debug("Current symbols: {}".format(self.subscribed_symbols))
 
     @staticmethod
     def normalize_symbols(s):
@@ -190,6 +496,374 @@ class TDWebSocket:
         }
 
 
+class TDWebSocketShard(TDWebSocket):
+    """
+    Single connection of ShardedTDWebSocket. Received events are put into
+    the queue of the manager, so they are handled by its pipeline.
+    """
+
+    def __init__(self, ctx, manager, index):
+        ctx = Context.from_context(ctx)
+        for key in ("symbols", "on_event", "on_events"):
+            ctx.defaults.pop(key, None)
+        ctx.defaults["logger"] = manager.logger
+
+        self.manager = manager
+        self.index = index
+        self.events_received = 0
+        self.last_event_at = None
+        self.connects = 0
+        super(TDWebSocketShard, self).__init__(ctx)
+        self.events = manager.events
+
+    def start_event_handler(self):
+        pass
+
+    def enqueue_event(self, event):
+        self.events_received += 1
+        self.last_event_at = time.time()
+        self.manager.enqueue_event(event)
+
+    def connect(self):
+        self.connects += 1
+        super(TDWebSocketShard, self).connect()
+
+
+class ShardedTDWebSocket(TDWebSocket):
+    """
+    Spreads subscribed symbols across several websocket connections, each
+    of them receives and parses its events in a separate thread. Events of
+    all connections are merged into one queue and handled as by TDWebSocket.
+
+    Besides TDWebSocket options, defaults accept ``shards`` (number of
+    connections) and ``sharding``: "hash" assigns symbols by CRC32 of the
+    name, so the assignment is stable, "round_robin" assigns them to the
+    least loaded connection and rebalances on unsubscribe.
+    """
+
+    def __init__(self, ctx):
+        super(ShardedTDWebSocket, self).__init__(ctx)
+        self.sharding = self.defaults.get("sharding", "hash")
+        if self.sharding not in ("hash", "round_robin"):
+            raise ValueError("Parameter 'sharding' must be 'hash' or 'round_robin'")
+
+        self.assignments = {}
+        self.shards = [
+            TDWebSocketShard(ctx, self, index)
+            for index in range(max(1, self.defaults.get("shards", SHARDS)))
+        ]
+
+        symbols, self.symbols = self.symbols, set()
+        self.subscribe(symbols)
+
+    def _shard_index(self, symbol):
+        if self.sharding == "hash":
+            return zlib.crc32(symbol.encode("utf-8")) % len(self.shards)
+        return min(range(len(self.shards)), key=lambda index: len(self.shards[index].symbols))
+
+    def _group(self, symbols):
+        groups = {}
+        for symbol in symbols:
+            groups.setdefault(self.assignments[symbol], set()).add(symbol)
+        return groups
+
+    def subscribe(self, symbols):
+        if isinstance(symbols, str):
+            symbols = [symbols.upper()]
+        else:
+            symbols = self.normalize_symbols(symbols)
+
+        with self.lock:
+            for symbol in set(symbols) - self.symbols:
+                index = self._shard_index(symbol)
+                self.assignments[symbol] = index
+                # Keep the load up to date for round robin assignment
+                self.shards[index].symbols = self.shards[index].symbols | {symbol}
+            self.symbols = self.symbols | set(symbols)
+            self.update_subscription_symbols()
+
+    def unsubscribe(self, symbols):
+        if isinstance(symbols, str):
+            symbols = [symbols.upper()]
+        else:
+            symbols = self.normalize_symbols(symbols)
+
+        with self.lock:
+            removed = set(symbols) & self.symbols
+            for index, group in self._group(removed).items():
+                self.shards[index].unsubscribe(group)
+            for symbol in removed:
+                del self.assignments[symbol]
+            self.symbols = self.symbols - removed
+            self.quotes.discard(removed)
+
+            if self.sharding == "round_robin":
+                self.rebalance()
+
+    def rebalance(self):
+        """
+        Moves symbols from the most loaded connections to the least loaded
+        ones until they differ by one symbol at most. Returns the number of
+        moved symbols.
+        """
+        moved = 0
+        with self.lock:
+            while True:
+                shards = sorted(self.shards, key=lambda shard: len(shard.symbols))
+                least, most = shards[0], shards[-1]
+                if len(most.symbols) - len(least.symbols) <= 1:
+                    return moved
+
+                symbol = sorted(most.symbols)[0]
+                most.unsubscribe(symbol)
+                least.subscribe(symbol)
+                self.assignments[symbol] = least.index
+                moved += 1
+
+    def reset(self):
+        with self.lock:
+            self.symbols = set()
+            self.assignments = {}
+            self.quotes.clear()
+            for shard in self.shards:
+                if shard.ws:
+                    shard.reset()
+                else:
+                    shard.symbols = set()
+
+    def update_subscription_symbols(self):
+        for shard in self.shards:
+            shard.update_subscription_symbols()
+
+    def connect(self):
+        for shard in self.shards:
+            shard.connect()
+
+    def disconnect(self):
+        for shard in self.shards:
+            shard.disconnect()
+
+    def heartbeat(self):
+        for shard in self.shards:
+            shard.heartbeat()
+
+    def metrics(self):
+        """
+        Returns health metrics of every connection
+        """
+        return [
+            {
+                "shard": shard.index,
+                "connected": shard.ready,
+                "symbols": len(shard.symbols),
+                "events": shard.events_received,
+                "last_event_at": shard.last_event_at,
+                "connects": shard.connects,
+                "reconnect": dict(shard.reconnect_metrics),
+            }
+            for shard in self.shards
+        ]
+
+
+class AsyncTDWebSocket(object):
+    """
+    Websocket client based on aiohttp, events are received on the event
+    loop and exposed as an asynchronous iterator::
+
+        async with td.websocket(symbols=["AAPL", "BTC/USD"]) as ws:
+            async for event in ws:
+                print(event)
+
+    Heartbeats are sent automatically. When the connection is lost, it's
+    reopened with jittered exponential backoff and the symbols are
+    subscribed again.
+    """
+
+    _closed = object()
+
+    def __init__(self, ctx):
+        self.apikey = ctx.apikey
+        self.defaults = ctx.defaults
+        self.url = "wss://ws.twelvedata.com/v1/quotes/price?apikey={}".format(self.apikey)
+        self.logger = self.defaults.get("logger") or logging.getLogger("ws-twelvedata")
+        self.heartbeat_interval = self.defaults.get("heartbeat_interval", HEARTBEAT_INTERVAL_S)
+        self.max_queue_size = self.defaults.get("max_queue_size", MAX_QUEUE_SIZE)
+        self.backoff = ExponentialBackoff(
+            base=1 if ctx.self_heal_time_s is None else ctx.self_heal_time_s,
+            cap=self.defaults.get("max_backoff_s", 60),
+        )
+
+        symbols = self.defaults.get("symbols", ())
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        self.symbols = TDWebSocket.normalize_symbols(symbols)
+        self.subscribed_symbols = set()
+
+        self.session = None
+        self.ws = None
+        self.events = None
+        self.tasks = []
+        self.closed = True
+        self.last_queue_warning_time = 0
+
+    def _get_session(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                textwrap.dedent(
+                    """
+                        No module named 'aiohttp'. You can install it with follow command:
+
+                        > pip install twelvedata[async]
+
+                        or
+
+                        > pip install aiohttp
+                    """
+                ).strip()
+            )
+
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    async def connect(self):
+        self.closed = False
+        self.events = asyncio.Queue(maxsize=self.max_queue_size)
+        await self._open()
+        self.tasks = [
+            asyncio.ensure_future(self._receive()),
+            asyncio.ensure_future(self._heartbeat()),
+        ]
+
+    async def _open(self):
+        while not self.closed:
+            try:
+                self.logger.info("Connecting...")
+                self.ws = await self._get_session().ws_connect(self.url)
+                self.subscribed_symbols = set()
+                await self.update_subscription_symbols()
+                self.backoff.reset()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = self.backoff.next()
+                self.logger.error("Cannot connect: {}. Retrying in {:.1f}s...".format(e, delay))
+                await asyncio.sleep(delay)
+
+    async def _receive(self):
+        import aiohttp
+
+        while not self.closed:
+            try:
+                msg = await self.ws.receive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                msg = aiohttp.WSMessage(aiohttp.WSMsgType.ERROR, e, None)
+
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                self._enqueue(decode_json(msg.data))
+            elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING,
+                              aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                if self.closed:
+                    break
+                self.logger.error("TDWebSocket closed: {}. Reconnecting...".format(msg.data))
+                await self._open()
+
+    def _enqueue(self, event):
+        try:
+            self.events.put_nowait(event)
+        except asyncio.QueueFull:
+            if time.time() - self.last_queue_warning_time > 1:
+                self.logger.error("Event queue is full. New events are not added.")
+                self.last_queue_warning_time = time.time()
+
+    async def _heartbeat(self):
+        while not self.closed:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self._send({"action": "heartbeat"})
+
+    async def _send(self, event):
+        try:
+            await self.ws.send_str(json.dumps(event))
+        except Exception as e:
+            self.logger.error("Error sending {}: {}".format(event.get("action"), e))
+
+    async def subscribe(self, symbols):
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        self.symbols = self.symbols | TDWebSocket.normalize_symbols(symbols)
+        await self.update_subscription_symbols()
+
+    async def unsubscribe(self, symbols):
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        self.symbols = self.symbols - TDWebSocket.normalize_symbols(symbols)
+        await self.update_subscription_symbols()
+
+    async def reset(self):
+        self.symbols = set()
+        self.subscribed_symbols = set()
+        await self._send({"action": "reset"})
+
+    async def update_subscription_symbols(self):
+        if self.ws is None or self.ws.closed:
+            return
+
+        new_symbols = self.symbols - self.subscribed_symbols
+        if new_symbols:
+            await self.ws.send_str(json.dumps(TDWebSocket.subscribe_event(new_symbols)))
+
+        remove_symbols = self.subscribed_symbols - self.symbols
+        if remove_symbols:
+            await self.ws.send_str(json.dumps(TDWebSocket.unsubscribe_event(remove_symbols)))
+
+        self.subscribed_symbols = self.symbols.copy()
+
+    async def close(self):
+        self.closed = True
+        for task in self.tasks:
+            task.cancel()
+        self.tasks = []
+
+        if self.ws is not None:
+            await self.ws.close()
+            self.ws = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.events is not None and not self.events.full():
+            # Wakes up consumers waiting for the next event. Nobody waits
+            # on a full queue, consumers stop once they have drained it.
+            self.events.put_nowait(self._closed)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.events is None:
+            raise StopAsyncIteration
+        if self.closed and self.events.empty():
+            raise StopAsyncIteration
+
+        event = await self.events.get()
+        if event is self._closed:
+            # Passes the wake up on to the other consumers
+            self.events.put_nowait(self._closed)
+            raise StopAsyncIteration
+        return event
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
 class EventReceiver(threading.Thread):
     def __init__(self, client, ping_interval=15, ping_timeout=10):
         threading.Thread.__init__(self)
@@ -231,13 +905,28 @@ class EventReceiver(threading.Thread):
         self.client.self_heal()
 
     def on_message(self, _, message):
-        event = json.loads(message)
+        event = decode_json(message)
         self.client.logger.debug("Received event: {}".format(event))
+        self.client.enqueue_event(event)
 
-        try:
-            self.client.events.put_nowait(event)
-        except queue.Full:
-            self.client.on_queue_full()
+
+def to_columns(events):
+    """
+    Converts price events to a dict of numpy arrays: symbol, price,
+    timestamp and day_volume (NaN when it's not reported). Other events
+    are skipped.
+    """
+    import numpy as np
+
+    events = [ev for ev in events if ev.get("event") == "price"]
+    return {
+        "symbol": np.array([ev.get("symbol") for ev in events], dtype=object),
+        "price": np.array([ev.get("price") for ev in events], dtype="float64"),
+        "timestamp": np.array([ev.get("timestamp") for ev in events], dtype="int64"),
+        "day_volume": np.array(
+            [ev.get("day_volume", np.nan) for ev in events], dtype="float64"
+        ),
+    }
 
 
 class EventHandler(threading.Thread):
@@ -249,9 +938,58 @@ class EventHandler(threading.Thread):
     def run(self):
         self.client.logger.debug("EventHandler ready")
         while True:
-            data = self.client.events.get()
-            if callable(self.client.on_event):
+            if callable(self.client.on_events):
+                batch = self.get_batch()
+            else:
+                batch = (self.client.events.get(),)
+
+            # In batch mode events are passed one by one only to on_event and listeners
+            if callable(self.client.on_event) or self.client.listeners:
+                for data in batch:
+                    self.dispatch(data)
+
+            if callable(self.client.on_events):
                 try:
-                    self.client.on_event(data)
+                    self.client.on_events(to_columns(batch) if self.client.columnar else batch)
                 except Exception as e:
                     self.client.logger.error(e)
+
+    def get_batch(self):
+        """
+        Waits for an event, then collects the following ones until there
+        are batch_size of them or batch_timeout_ms passes
+        """
+        events = self.client.events
+        batch = [events.get()]
+        deadline = time.monotonic() + self.client.batch_timeout_ms / 1000.0
+
+        while True:
+            batch.extend(events.get_many(self.client.batch_size - len(batch)))
+            if len(batch) >= self.client.batch_size:
+                break
+
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(events.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def dispatch(self, data):
+        """
+        Passes single event to on_event and listeners, it isn't called when
+        only on_events is set
+        """
+        if callable(self.client.on_event):
+            try:
+                self.client.on_event(data)
+            except Exception as e:
+                self.client.logger.error(e)
+
+        for listener in list(self.client.listeners):
+            try:
+                listener(data)
+            except Exception as e:
+                self.client.logger.error(e)
@@ -2,13 +2,34 @@
 # coding: utf-8
 
 import json
+import time
+import asyncio
+import queue
 import pytest
 from requests import Response
 from unittest.mock import patch, MagicMock, PropertyMock
 
 from matplotlib import pyplot as plt
-from twelvedata import TDClient
-from twelvedata.http_client import DefaultHttpClient
+from twelvedata import TDClient, AsyncTDClient
+from twelvedata.http_client import DefaultHttpClient, AsyncHttpClient
+from twelvedata.rate_limiter import RateLimiter
+from twelvedata.cache import MemoryCache, DiskCache
+from twelvedata.context import Context
+from twelvedata.endpoints import TimeSeriesEndpoint, chunk_symbols
+from twelvedata.time_series import TimeSeries
+from twelvedata.store import OHLCVStore
+from twelvedata.retry import RetryPolicy
+from twelvedata.websocket import TDWebSocket, ShardedTDWebSocket, AsyncTDWebSocket, EventQueue, EventHandler, Quote
+from twelvedata.streaming import BarBuilder, IndicatorFeed, SMA, EMA, OBV
+from twelvedata import utils
+from twelvedata.utils import (
+    convert_collection_to_pandas_multi_index,
+    decode_json,
+    decode_response,
+    parse_date,
+    set_json_decoder,
+    split_date_range,
+)
 from twelvedata.exceptions import (
     BadRequestError,
     InternalServerError,
@@ -47,6 +68,7 @@ def _fake_json_resp(json_content):
     resp = MagicMock(spec=Response)
     type(resp).ok = PropertyMock(return_value=True)
     resp.json = MagicMock(return_value=json_content)
+    type(resp).content = PropertyMock(return_value=json.dumps(json_content).encode())
     type(resp).headers = PropertyMock(return_value={})
     resp.status_code = 200
     return resp
@@ -1411,3 +1433,989 @@ def test_http_other_invalid_response_in_json(mock_get):
         http_client.get('/fake_url')
         assert str(err) == 'error message'
     mock_get.assert_called_once_with(API_URL + '/fake_url', timeout=30, params={'source': 'python'})
+
+
+class _FakeAiohttpResponse(object):
+    def __init__(self, status, content, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    def get_encoding(self):
+        return 'utf-8'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def _fake_aiohttp_session(status, content):
+    session = MagicMock()
+    session.get = MagicMock(return_value=_FakeAiohttpResponse(status, content))
+    return session
+
+
+@pytest.mark.parametrize('status, content, error', [
+    (500, b'', InternalServerError),
+    (400, b'', BadRequestError),
+    (401, b'', InvalidApiKeyError),
+    (520, b'', TwelveDataError),
+    (200, b'{"status": "error", "code": 401, "message": "error message"}', InvalidApiKeyError),
+    (200, b'{"status": "error", "code": 500, "message": "error message"}', InternalServerError),
+])
+def test_async_http_error_response(status, content, error):
+    pytest.importorskip('aiohttp')
+    http_client = AsyncHttpClient(API_URL)
+    session = _fake_aiohttp_session(status, content)
+    with patch.object(AsyncHttpClient, '_get_session', return_value=session):
+        with pytest.raises(error):
+            asyncio.run(http_client.get('/fake_url'))
+    session.get.assert_called_once_with(API_URL + '/fake_url', params={'source': 'python'})
+
+
+@patch('twelvedata.client.patch_endpoints_meta')
+def test_async_client_as_json(mock_patch):
+    pytest.importorskip('aiohttp')
+    content = b'{"meta": {}, "values": [{"datetime": "2020-01-01", "close": "1.0"}], "status": "ok"}'
+    session = _fake_aiohttp_session(200, content)
+    with patch.object(AsyncHttpClient, '_get_session', return_value=session):
+        td = AsyncTDClient("demo")
+        ts = td.time_series(symbol="AAPL", interval="1day")
+        assert asyncio.run(ts.as_json()) == ({"datetime": "2020-01-01", "close": "1.0"},)
+        df = asyncio.run(ts.as_pandas())
+        assert df['close'].iloc[0] == 1.0
+
+
+@patch('twelvedata.client.patch_endpoints_meta')
+def test_async_client_context(mock_patch):
+    td = AsyncTDClient("demo", base_url='http://localhost', outputsize=5)
+    assert isinstance(td.ctx.http_client, AsyncHttpClient)
+    assert td.ctx.defaults == {'outputsize': 5}
+    meta_ctx = mock_patch.call_args[0][0]
+    assert isinstance(meta_ctx.http_client, DefaultHttpClient)
+    assert meta_ctx.base_url == 'http://localhost'
+
+
+def test_rate_limiter_cost():
+    limiter = RateLimiter(8)
+    assert limiter.cost('/time_series', {'symbol': 'AAPL'}) == 1
+    assert limiter.cost('/time_series', {'symbol': 'AAPL,MSFT,EUR/USD'}) == 3
+    assert limiter.cost('/statistics', {'symbol': 'AAPL'}) == 50
+    assert limiter.cost('/api_usage', {}) == 0
+
+
+def test_rate_limiter_reserve():
+    limiter = RateLimiter.from_api_usage({'current_usage': 50, 'plan_limit': 60})
+    assert limiter.reserve(10) == 0
+    assert limiter.reserve(1) == pytest.approx(1, rel=0.05)
+    assert limiter.reserve(1) == pytest.approx(2, rel=0.05)
+
+
+def _fake_content_resp(content):
+    resp = Response()
+    resp.status_code = 200
+    resp._content = content
+    return resp
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(maxsize=2)
+    cache.set('/stocks', {'exchange': 'NASDAQ', 'apikey': 'a'}, 1)
+    cache.set('/etf', {}, 2)
+    assert cache.get('/stocks', {'exchange': 'NASDAQ', 'apikey': 'b', 'source': 'python'}) == 1
+    cache.set('/indices', {}, 3)
+    assert cache.get('/etf', {}) is None
+    assert cache.get('/stocks', {'exchange': 'NASDAQ'}) == 1
+    cache.set('/time_series', {'symbol': 'AAPL'}, 4)
+    assert cache.get('/time_series', {'symbol': 'AAPL'}) is None
+
+
+def test_disk_cache_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path), ttls={'/price': -1})
+    cache.set('/stocks', {}, _fake_content_resp(b'{"data": []}'))
+    assert cache.get('/stocks', {}).json() == {"data": []}
+    cache.set('/price', {'symbol': 'AAPL'}, _fake_content_resp(b'{"price": "1"}'))
+    assert cache.get('/price', {'symbol': 'AAPL'}) is None
+
+
+def test_disk_cache_stores_plain_data(tmp_path):
+    import os
+    import pickle
+    from twelvedata.http_client import AsyncHttpResponse
+
+    class Exploit(object):
+        def __reduce__(self):
+            return os.mkdir, (str(tmp_path / 'pwned'),)
+
+    cache = DiskCache(str(tmp_path))
+    resp = _fake_content_resp(b'{"data": [1]}')
+    resp.headers['Content-Type'] = 'application/json'
+    cache.set('/stocks', {}, resp)
+    cached = cache.get('/stocks', {})
+    assert isinstance(cached, Response)
+    assert cached.json() == {"data": [1]}
+    assert cached.headers['content-type'] == 'application/json'
+
+    cache.set('/etf', {}, AsyncHttpResponse(200, {}, b'{"data": [2]}'))
+    cached = cache.get('/etf', {})
+    assert isinstance(cached, AsyncHttpResponse)
+    assert cached.json() == {"data": [2]}
+
+    with open(cache._path(cache.key('/stocks', {})), 'wb') as f:
+        pickle.dump((time.time() + 60, Exploit()), f)
+    assert cache.get('/stocks', {}) is None
+    assert not (tmp_path / 'pwned').exists()
+
+
+@patch('twelvedata.http_client.Session.get', return_value=_fake_content_resp(b'{"data": []}'))
+def test_http_cached_response(mock_get):
+    http_client = DefaultHttpClient(API_URL, cache=MemoryCache())
+    http_client.get('/stocks', params={'apikey': 'a'})
+    http_client.get('/stocks', params={'apikey': 'b'})
+    mock_get.assert_called_once()
+
+
+def _init_ctx(http_client):
+    ctx = Context()
+    ctx.apikey = 'demo'
+    ctx.base_url = API_URL
+    ctx.http_client = http_client
+    ctx.defaults = {}
+    return ctx
+
+
+def test_chunk_symbols():
+    assert chunk_symbols(['A', 'B', 'C', 'D', 'E'], 2) == [['A', 'B', 'C'], ['D', 'E']]
+    assert [len(c) for c in chunk_symbols(list(range(250)), 120)] == [84, 83, 83]
+
+
+def test_batch_chunks():
+    def get(url, params):
+        symbols = params['symbol'].split(',')
+        if 'C' in symbols:
+            raise BadRequestError('error message')
+        return _fake_json_resp({s: {'status': 'ok', 'values': []} for s in symbols})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    ep = TimeSeriesEndpoint(_init_ctx(http_client), symbol='A,B,C,D,E,F', interval='1min')
+    ep.batch_size = 2
+    data = ep.as_json()
+    assert http_client.get.call_count == 3
+    assert list(data) == ['A', 'B', 'C', 'D', 'E', 'F']
+    assert data['C'] == data['D'] == {'status': 'error', 'message': 'error message'}
+    assert data['A'] == {'status': 'ok', 'values': []}
+
+
+def test_batch_chunks_are_requested_concurrently():
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get(url, params):
+        # Fails unless every chunk is in flight at the same time
+        barrier.wait()
+        return _fake_json_resp({s: {'status': 'ok', 'values': []} for s in params['symbol'].split(',')})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    ep = TimeSeriesEndpoint(_init_ctx(http_client), symbol='A,B,C,D,E,F', interval='1min')
+    ep.batch_size = 2
+    data = ep.as_json()
+    assert all(value == {'status': 'ok', 'values': []} for value in data.values())
+
+
+def test_split_date_range():
+    windows = split_date_range('2020-01-01', '2020-01-01 10:30:00', '1h', 4)
+    assert [(s.hour, e.hour, e.minute) for s, e in windows] == [
+        (0, 3, 0), (3, 6, 0), (6, 9, 0), (9, 10, 30),
+    ]
+
+
+def test_time_series_history():
+    def get(url, params):
+        start, end = parse_date(params['start_date']), parse_date(params['end_date'])
+        values = [
+            {'datetime': '2020-01-01 {:02d}:00:00'.format(h), 'close': str(h)}
+            for h in range(end.hour, start.hour - 1, -1)
+        ]
+        # The API returns the latest outputsize bars of the window
+        return _fake_json_resp({'status': 'ok', 'values': values[:params['outputsize']]})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    ep = TimeSeriesEndpoint(
+        _init_ctx(http_client), symbol='AAPL', interval='1h',
+        start_date='2020-01-01', end_date='2020-01-01 10:00:00',
+    )
+    df = ep.as_pandas_history(page_size=3)
+    assert http_client.get.call_count == 5
+    assert list(df['close']) == list(range(10, -1, -1))
+
+
+def test_time_series_history_async():
+    class AsyncClient(object):
+        calls = 0
+
+        async def get(self, url, params):
+            self.calls += 1
+            start, end = parse_date(params['start_date']), parse_date(params['end_date'])
+            values = [
+                {'datetime': '2020-01-01 {:02d}:00:00'.format(h), 'close': str(h)}
+                for h in range(end.hour, start.hour - 1, -1)
+            ]
+            return _fake_json_resp({'status': 'ok', 'values': values[:params['outputsize']]})
+
+    http_client = AsyncClient()
+    ep = TimeSeriesEndpoint(
+        _init_ctx(http_client), symbol='AAPL', interval='1h',
+        start_date='2020-01-01', end_date='2020-01-01 10:00:00',
+    )
+    df = asyncio.run(ep.as_pandas_history(page_size=3, max_workers=2))
+    assert http_client.calls == 5
+    assert list(df['close']) == list(range(10, -1, -1))
+
+    with pytest.raises(TypeError):
+        next(ep.iter_history(page_size=3))
+
+
+def test_time_series_iter_pages():
+    def get(url, params):
+        start, end = parse_date(params['start_date']), parse_date(params['end_date'])
+        values = [
+            {'datetime': '2020-01-01 {:02d}:00:00'.format(h), 'close': str(h)}
+            for h in range(end.hour, start.hour - 1, -1)
+        ]
+        # The API returns the latest outputsize bars of the window
+        return _fake_json_resp({'status': 'ok', 'values': values[:params['outputsize']]})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    ep = TimeSeriesEndpoint(
+        _init_ctx(http_client), symbol='AAPL', interval='1h',
+        start_date='2020-01-01', end_date='2020-01-01 10:00:00',
+    )
+    pages = ep.iter_pages(page_size=3, prefetch=False)
+    assert [row['close'] for row in next(pages)] == ['10', '9', '8']
+    assert http_client.get.call_count == 1
+    assert [row['close'] for row in next(pages)] == ['7', '6']
+    pages = list(ep.iter_pages(page_size=3, as_pandas=True))
+    assert [len(df) for df in pages] == [3, 2, 2, 2, 2]
+    assert str(pages[-1].index[-1]) == '2020-01-01 00:00:00'
+
+
+def test_time_series_aiter_pages():
+    class AsyncClient(object):
+        calls = 0
+
+        async def get(self, url, params):
+            self.calls += 1
+            start, end = parse_date(params['start_date']), parse_date(params['end_date'])
+            values = [
+                {'datetime': '2020-01-01 {:02d}:00:00'.format(h), 'close': str(h)}
+                for h in range(end.hour, start.hour - 1, -1)
+            ]
+            return _fake_json_resp({'status': 'ok', 'values': values[:params['outputsize']]})
+
+    http_client = AsyncClient()
+    ep = TimeSeriesEndpoint(
+        _init_ctx(http_client), symbol='AAPL', interval='1h',
+        start_date='2020-01-01', end_date='2020-01-01 10:00:00',
+    )
+
+    async def collect(**kwargs):
+        pages = []
+        async for page in ep.aiter_pages(page_size=3, **kwargs):
+            pages.append(page)
+            if len(pages) == 1:
+                calls.append(http_client.calls)
+        return pages
+
+    calls = []
+    pages = asyncio.run(collect(prefetch=False))
+    assert [[row['close'] for row in rows] for rows in pages[:2]] == [['10', '9', '8'], ['7', '6']]
+    assert calls == [1]
+    pages = asyncio.run(collect(as_pandas=True))
+    assert [len(df) for df in pages] == [3, 2, 2, 2, 2]
+    assert str(pages[-1].index[-1]) == '2020-01-01 00:00:00'
+
+    with pytest.raises(TypeError):
+        next(ep.iter_pages(page_size=3))
+
+
+def test_time_series_pandas_dtypes():
+    values = [
+        {'datetime': '2020-01-02', 'open': '1.5', 'high': '2', 'low': '1', 'close': '1.5', 'volume': '100'},
+        {'datetime': '2020-01-01', 'open': '1.0', 'high': '2', 'low': '1', 'close': '1.5', 'volume': '200'},
+    ]
+    http_client = MagicMock()
+    http_client.get = MagicMock(return_value=_fake_json_resp({'status': 'ok', 'values': values}))
+    df = TimeSeriesEndpoint(_init_ctx(http_client), symbol='AAPL', interval='1day').as_pandas()
+    assert list(df.dtypes) == ['float64'] * 4 + ['int64']
+    assert str(df.index[0]) == '2020-01-02 00:00:00'
+
+
+def test_decoded_json_is_handed_over_once():
+    resp = _fake_content_resp(b'{"status": "ok", "values": [{"datetime": "2020-01-01"}]}')
+    data = decode_response(resp, keep=True)
+    assert decode_response(resp) is data
+    assert decode_response(resp) is not data
+    assert decode_response(resp) == data
+
+
+@patch('twelvedata.http_client.Session.get', return_value=_fake_content_resp(
+    b'{"status": "ok", "data": [{"symbol": "AAPL"}]}'))
+def test_cached_response_is_not_shared(mock_get):
+    http_client = DefaultHttpClient(API_URL, cache=MemoryCache())
+    td = TDClient('demo', http_client=http_client)
+    data = td.get_stocks_list().as_json()
+    data[0]['symbol'] = 'MSFT'
+    data.append({'symbol': 'TSLA'})
+    assert td.get_stocks_list().as_json() == [{'symbol': 'AAPL'}]
+    mock_get.assert_called_once()
+
+
+def test_set_json_decoder():
+    try:
+        set_json_decoder(lambda data: {'decoded': True})
+        assert decode_json(b'{}') == {'decoded': True}
+        set_json_decoder('json')
+        assert decode_json(b'{"a": NaN}')['a'] != 0
+    finally:
+        set_json_decoder(utils._default_json_decoder())
+
+
+
+def test_multi_index_with_different_columns():
+    df = convert_collection_to_pandas_multi_index({
+        'EUR/USD': {'status': 'ok', 'values': [
+            {'datetime': '2020-01-02', 'open': '1.1', 'close': '1.2'},
+            {'datetime': '2020-01-01', 'open': '1.0', 'close': '1.1'},
+        ]},
+        'AAPL': {'status': 'ok', 'values': [
+            {'datetime': '2020-01-02', 'open': '300', 'close': '301', 'volume': '100'},
+        ]},
+    })
+    assert list(df.columns) == ['open', 'close', 'volume']
+    assert list(df.index) == [('EUR/USD', '2020-01-02'), ('EUR/USD', '2020-01-01'), ('AAPL', '2020-01-02')]
+    assert df.loc[('AAPL', '2020-01-02'), 'volume'] == '100'
+    assert df.loc[('EUR/USD', '2020-01-01'), 'close'] == '1.1'
+
+
+def test_time_series_concurrent_requests():
+    def get(url, params):
+        # Price request is the slowest one, but it still goes first in the output
+        time.sleep(0.2 if url == '/time_series' else 0.05)
+        name = url.strip('/')
+        key = 'close' if name == 'time_series' else name
+        return _fake_json_resp({'status': 'ok', 'values': [{'datetime': '2020-01-01', key: '1'}]})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    ctx = _init_ctx(http_client)
+    ctx.defaults = {'symbol': 'AAPL', 'interval': '1day'}
+    ts = TimeSeries(ctx).with_ema().with_rsi().with_ema()
+    started = time.time()
+    assert ts.as_json() == ({'datetime': '2020-01-01', 'close': '1', 'ema_1': '1', 'rsi': '1', 'ema_2': '1'},)
+    assert time.time() - started < 0.35
+    assert ts.with_executor(max_workers=1).as_json() == ts.as_json()
+
+
+def test_time_series_local_indicators():
+    values = [
+        {
+            'datetime': '2020-01-{:02d}'.format(d), 'open': str(d), 'high': str(d + 1),
+            'low': str(d - 1), 'close': str(d), 'volume': '100',
+        }
+        for d in range(30, 0, -1)
+    ]
+
+    def get(url, params):
+        if url != '/time_series':
+            return _fake_json_resp({'status': 'ok', 'values': [{'datetime': '2020-01-30', 'cci': '1'}]})
+        return _fake_json_resp({'status': 'ok', 'values': values[:int(params['outputsize'])]})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    ctx = _init_ctx(http_client)
+    ctx.defaults = {'symbol': 'AAPL', 'interval': '1day', 'outputsize': 5}
+    ts = TimeSeries(ctx).with_sma(time_period=3).with_sma(time_period=5).with_macd().with_cci()
+    df = ts.with_local_indicators().as_pandas()
+
+    # Price data is requested once with extra bars to warm up indicators
+    assert sorted(call[0][0] for call in http_client.get.call_args_list) == ['/cci', '/time_series']
+    assert len(df) == 5
+    assert list(df['sma1']) == [29.0, 28.0, 27.0, 26.0, 25.0]
+    assert list(df['sma2']) == [28.0, 27.0, 26.0, 25.0, 24.0]
+    assert list(df.columns[-4:]) == ['macd', 'macd_signal', 'macd_hist', 'cci']
+    assert df['macd'].notna().all()
+
+
+def test_streaming_indicators():
+    sma = SMA(time_period=3)
+    assert [sma.update(x) for x in (1, 2, 3, 4)] == [None, None, 2.0, 3.0]
+    assert sma.preview(10) == 17 / 3
+    assert sma.value == 3.0
+
+    ema = EMA(time_period=3)
+    assert [ema.update(x) for x in (1, 2, 3, 5)] == [None, None, 2.0, 3.5]
+
+
+def test_indicator_feed():
+    feed = IndicatorFeed('AAPL', '1min', sma=SMA(time_period=2), obv=OBV())
+    events = [
+        {'event': 'price', 'symbol': 'AAPL', 'price': 10, 'timestamp': 60, 'day_volume': 100},
+        {'event': 'price', 'symbol': 'AAPL', 'price': 12, 'timestamp': 90, 'day_volume': 150},
+        {'event': 'price', 'symbol': 'MSFT', 'price': 99, 'timestamp': 100},
+        {'event': 'price', 'symbol': 'AAPL', 'price': 14, 'timestamp': 120, 'day_volume': 170},
+    ]
+    for event in events:
+        feed.on_event(event)
+
+    # The first bar is closed, the second one is forming
+    assert feed.bar['open'] == feed.bar['close'] == 14
+    assert feed.indicators['sma'].value is None
+    assert feed.indicators['obv'].value == 50
+    assert feed.values() == {'sma': 13.0, 'obv': 70.0}
+
+
+def test_bar_builder():
+    closed = []
+    builder = BarBuilder(['1min', '5min'], maxlen=2, on_bar=lambda *args: closed.append(args))
+    for ts, price in ((0, 10), (30, 12), (45, 9), (60, 11), (120, 13), (180, 14), (300, 15)):
+        builder.on_event({'event': 'price', 'symbol': 'aapl', 'price': price, 'timestamp': ts})
+
+    assert [(s, i, b['close']) for s, i, b in closed[:2]] == [('AAPL', '1min', 9), ('AAPL', '1min', 11)]
+    first = closed[0][2]
+    assert (first['open'], first['high'], first['low'], first['close']) == (10, 12, 9, 9)
+    assert [b['close'] for b in builder.get_bars('AAPL', '1min')] == [13, 14]
+    assert [b['close'] for b in builder.get_bars('AAPL', '5min', include_forming=True)] == [14, 15]
+
+
+def test_bar_builder_exchange_timezone():
+    import datetime
+    import pandas as pd
+    from zoneinfo import ZoneInfo
+
+    df = pd.DataFrame(
+        {'open': [1.0, 2.0], 'high': [1.0, 2.0], 'low': [1.0, 2.0], 'close': [1.0, 2.0],
+         'volume': [0, 0]},
+        index=pd.DatetimeIndex(['2024-01-04 09:01:00', '2024-01-04 09:00:00'], name='datetime'),
+    )
+    builder = BarBuilder('1min')
+    assert len(builder.warm_up('7203', '1min', df, timezone='Asia/Tokyo')) == 1
+
+    def _tick(minute, second, price):
+        dt = datetime.datetime(2024, 1, 4, 9, minute, second, tzinfo=ZoneInfo('Asia/Tokyo'))
+        builder.on_event({'event': 'price', 'symbol': '7203', 'price': price,
+                          'timestamp': int(dt.timestamp())})
+
+    # Ticks of the forming bar update it, late ticks are skipped
+    _tick(1, 30, 5.0)
+    _tick(0, 30, 9.0)
+    assert builder.get_forming_bar('7203', '1min')['high'] == 5.0
+    assert builder.late_events == 1
+
+    _tick(2, 10, 3.0)
+    bars = builder.get_bars('7203', '1min', include_forming=True)
+    assert [b['close'] for b in bars] == [2.0, 5.0, 3.0]
+    assert bars[-1]['datetime'].isoformat() == '2024-01-04T09:02:00+09:00'
+
+
+def test_websocket_batched_dispatch():
+    batches = []
+    ctx = _init_ctx(None)
+    ctx.defaults = {
+        'on_events': batches.append, 'batch_size': 3, 'batch_timeout_ms': 20, 'columnar': True,
+    }
+    ws = TDWebSocket(ctx)
+    for i in range(4):
+        ws.events.put({'event': 'price', 'symbol': 'AAPL', 'price': 10 + i, 'timestamp': i})
+    ws.events.put({'event': 'heartbeat', 'status': 'ok'})
+
+    deadline = time.time() + 2
+    while len(batches) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert list(batches[0]['price']) == [10.0, 11.0, 12.0]
+    assert list(batches[1]['timestamp']) == [3]
+    assert list(batches[1]['symbol']) == ['AAPL']
+
+
+def test_event_queue_get_many():
+    events = EventQueue(maxsize=3, policy="conflate")
+    for i in range(3):
+        events.put({'event': 'price', 'symbol': 'S{}'.format(i), 'price': i})
+    events.put({'event': 'price', 'symbol': 'S0', 'price': 10})
+
+    assert [e['price'] for e in events.get_many(2)] == [10, 1]
+    assert events.pending.keys() == {'S2'}
+    events.put_nowait({'event': 'heartbeat'})
+    events.put_nowait({'event': 'heartbeat'})
+    assert [e.get('price') for e in events.get_many(5)] == [2, None, None]
+    assert events.get_many(5) == []
+
+
+def test_websocket_batched_dispatch_skips_single_events():
+    batches = []
+    ctx = _init_ctx(None)
+    ctx.defaults = {'on_events': batches.append, 'batch_size': 2, 'batch_timeout_ms': 20}
+    ws = TDWebSocket(ctx)
+    with patch.object(EventHandler, 'dispatch') as dispatch:
+        for i in range(2):
+            ws.events.put({'event': 'price', 'symbol': 'AAPL', 'price': i})
+        deadline = time.time() + 2
+        while not batches and time.time() < deadline:
+            time.sleep(0.01)
+    assert [e['price'] for e in batches[0]] == [0, 1]
+    dispatch.assert_not_called()
+
+
+def test_sharded_websocket():
+    received = []
+    ctx = _init_ctx(None)
+    ctx.defaults = {
+        'symbols': ['AAPL', 'MSFT', 'EUR/USD', 'BTC/USD', 'TSLA'], 'shards': 2,
+        'sharding': 'round_robin', 'on_event': received.append,
+    }
+    ws = ShardedTDWebSocket(ctx)
+    assert sorted(m['symbols'] for m in ws.metrics()) == [2, 3]
+
+    ws.unsubscribe(sorted(ws.shards[0].symbols)[:2])
+    assert sorted(m['symbols'] for m in ws.metrics()) == [1, 2]
+    assert set().union(*(shard.symbols for shard in ws.shards)) == ws.symbols
+
+    ws.shards[1].enqueue_event({'event': 'price', 'symbol': 'TSLA'})
+    deadline = time.time() + 2
+    while not received and time.time() < deadline:
+        time.sleep(0.01)
+    assert received == [{'event': 'price', 'symbol': 'TSLA'}]
+    assert ws.metrics()[1]['events'] == 1
+
+
+class _FakeAiohttpWebSocket(object):
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.sent = []
+        self.closed = False
+
+    async def receive(self):
+        import aiohttp
+
+        if not self.messages:
+            await asyncio.sleep(10)
+        text = self.messages.pop(0)
+        if text is None:
+            return aiohttp.WSMessage(aiohttp.WSMsgType.CLOSED, None, None)
+        return aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, text, None)
+
+    async def send_str(self, data):
+        self.sent.append(json.loads(data))
+
+    async def close(self):
+        self.closed = True
+
+
+def test_async_websocket_reconnects():
+    pytest.importorskip('aiohttp')
+    sockets = [
+        _FakeAiohttpWebSocket(['{"event": "price", "symbol": "AAPL", "price": 1}', None]),
+        _FakeAiohttpWebSocket(['{"event": "price", "symbol": "AAPL", "price": 2}']),
+    ]
+    session = MagicMock(closed=False)
+
+    async def ws_connect(url):
+        return sockets[session.ws_connect.call_count - 1]
+
+    async def close():
+        pass
+
+    session.ws_connect = MagicMock(side_effect=ws_connect)
+    session.close = close
+
+    async def run():
+        ctx = _init_ctx(None)
+        ctx.defaults = {'symbols': 'aapl', 'heartbeat_interval': 0.01}
+        ws = AsyncTDWebSocket(ctx)
+        ws.session = session
+        prices = []
+        async with ws:
+            async for event in ws:
+                prices.append(event['price'])
+                if len(prices) == 2:
+                    await asyncio.sleep(0.05)
+                    break
+        return prices
+
+    assert asyncio.run(run()) == [1, 2]
+    subscribe = {'action': 'subscribe', 'params': {'symbols': 'AAPL'}}
+    assert sockets[0].sent[0] == sockets[1].sent[0] == subscribe
+    assert {'action': 'heartbeat'} in sockets[1].sent
+
+
+def test_async_websocket_close_with_full_queue():
+    async def run():
+        ctx = _init_ctx(None)
+        ctx.defaults = {'symbols': 'AAPL', 'max_queue_size': 2}
+        ws = AsyncTDWebSocket(ctx)
+        ws.events = asyncio.Queue(maxsize=ws.max_queue_size)
+        ws.events.put_nowait({'price': 1})
+        ws.events.put_nowait({'price': 2})
+        await ws.close()
+        return [event['price'] async for event in ws]
+
+    assert asyncio.run(run()) == [1, 2]
+
+
+@patch('twelvedata.websocket.time.sleep')
+def test_websocket_self_heal_backoff(mock_sleep):
+    ctx = _init_ctx(None)
+    ctx.defaults = {'symbols': ['AAPL', 'MSFT'], 'circuit_threshold': 3, 'circuit_cooldown_s': 100}
+    ws = TDWebSocket(ctx)
+    ws.refresh_websocket = MagicMock()
+    ws.ws = MagicMock()
+
+    for _ in range(4):
+        ws.self_heal()
+    delays = [call[0][0] for call in mock_sleep.call_args_list]
+    assert 0 <= delays[0] <= 1 and 0 <= delays[1] <= 2
+    assert delays[2] == 100
+    assert ws.reconnect_metrics['circuit_opened'] == 1
+
+    ws.on_connect()
+    assert ws.ws.send.call_count == 1
+    assert sorted(json.loads(ws.ws.send.call_args[0][0])['params']['symbols'].split(',')) == ['AAPL', 'MSFT']
+    assert ws.reconnect_metrics['reconnects'] == 1
+    assert ws.reconnect_metrics['last_reconnect_latency_s'] is not None
+    assert ws.backoff.attempts == 0
+
+
+@pytest.mark.parametrize("policy, prices, stats", [
+    ('drop_newest', [1, 2, None], {'enqueued': 3, 'dropped': 3, 'conflated': 0}),
+    ('drop_oldest', [3, 4, 5], {'enqueued': 6, 'dropped': 3, 'conflated': 0}),
+    ('conflate', [5, 4, None], {'enqueued': 3, 'dropped': 0, 'conflated': 3}),
+])
+def test_event_queue_policies(policy, prices, stats):
+    events = EventQueue(maxsize=3, policy=policy)
+    for i, symbol in enumerate(['AAPL', 'MSFT', 'AAPL', 'MSFT', 'AAPL'], start=1):
+        try:
+            if i == 3:
+                events.put_nowait({'event': 'heartbeat'})
+            events.put_nowait({'event': 'price', 'symbol': symbol, 'price': i})
+        except queue.Full:
+            pass
+
+    assert [events.get_nowait().get('price') for _ in range(3)] == prices
+    assert events.stats() == dict(stats, depth=0)
+
+
+def test_quote_snapshot_store():
+    ctx = _init_ctx(None)
+    ctx.defaults = {'symbols': ['AAPL', 'MSFT']}
+    ws = TDWebSocket(ctx)
+    ws.enqueue_event({'event': 'price', 'symbol': 'AAPL', 'price': 150.5, 'timestamp': 1, 'day_volume': 10})
+    ws.enqueue_event({'event': 'price', 'symbol': 'AAPL', 'price': 151, 'timestamp': 2, 'day_volume': 12})
+
+    assert ws.quotes.price('aapl') == 151
+    assert ws.quotes.get('AAPL') == Quote('AAPL', 151, 2, 12)
+
+    fallback = MagicMock(return_value={'MSFT': Quote('MSFT', 300.0, None, None)})
+    quotes = ws.quotes.get_many(['AAPL', 'MSFT', 'TSLA'], fallback=fallback)
+    fallback.assert_called_once_with(['MSFT', 'TSLA'])
+    assert quotes['MSFT'].price == 300.0 and quotes['TSLA'] is None
+
+    ws.unsubscribe('AAPL')
+    assert 'AAPL' not in ws.quotes
+
+
+def test_time_series_store(tmp_path):
+    bars = [
+        {'datetime': '2020-01-{:02d}'.format(d), 'open': '1', 'high': '2', 'low': '0.5',
+         'close': str(d), 'volume': '10'}
+        for d in range(10, 0, -1)
+    ]
+    available = [6]
+
+    def get(url, params):
+        values = bars[-available[0]:]
+        if 'start_date' in params:
+            start = parse_date(params['start_date'])
+            values = [v for v in values if parse_date(v['datetime']) >= start]
+        return _fake_json_resp({'status': 'ok', 'values': values[:int(params['outputsize'])]})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    store = OHLCVStore(str(tmp_path))
+    ep = TimeSeriesEndpoint(_init_ctx(http_client), symbol='AAPL', interval='1day', outputsize=5)
+    ep = ep.with_store(store)
+
+    assert list(ep.as_pandas()['close']) == [6, 5, 4, 3, 2]
+    assert 'start_date' not in http_client.get.call_args[1]['params']
+
+    # Only the bars after the latest stored one are requested
+    available[0] = 8
+    df = ep.as_pandas()
+    assert http_client.get.call_args[1]['params']['start_date'] == '2020-01-06 00:00:00'
+    assert list(df['close']) == [8, 7, 6, 5, 4]
+    assert list(df.dtypes) == ['float64'] * 4 + ['int64']
+    assert len(store.read(store.key('AAPL', '1day'))) == 7
+
+
+def test_time_series_store_keeps_bars_contiguous(tmp_path):
+    import datetime
+    import pandas as pd
+
+    first = datetime.date(2020, 1, 1)
+    bars = [
+        {'datetime': str(first + datetime.timedelta(days=d)), 'open': '1', 'high': '2',
+         'low': '0.5', 'close': str(d), 'volume': '10'}
+        for d in range(99, -1, -1)
+    ]
+
+    def get(url, params):
+        size = int(params['outputsize'])
+        if 'start_date' not in params:
+            return _fake_json_resp({'status': 'ok', 'values': bars[:size]})
+        start = parse_date(params['start_date'])
+        values = [v for v in bars if parse_date(v['datetime']) >= start]
+        return _fake_json_resp({'status': 'ok', 'values': values[-size:]})
+
+    http_client = MagicMock()
+    http_client.get = MagicMock(side_effect=get)
+    store = OHLCVStore(str(tmp_path))
+    ctx = _init_ctx(http_client)
+
+    def request(**kwargs):
+        ep = TimeSeriesEndpoint(ctx, symbol='AAPL', interval='1day', **kwargs)
+        return ep.with_store(store).as_pandas()
+
+    request(outputsize=5)
+    request(start_date='2020-01-01', outputsize=5)
+    assert len(store.read(store.key('AAPL', '1day'))) == 5
+
+    # The store serves the request without a hole between the two windows
+    df = request(start_date='2020-01-01', outputsize=50)
+    assert len(df) == 50
+    assert (df.index[:-1] - df.index[1:] == pd.Timedelta(days=1)).all()
+    stored = store.read(store.key('AAPL', '1day'))
+    assert (stored.index[1:] - stored.index[:-1] == pd.Timedelta(days=1)).all()
+
+
+def test_endpoints_meta_is_loaded_lazily(tmp_path, monkeypatch):
+    import os
+    from twelvedata import endpoints
+
+    monkeypatch.setenv('TWELVEDATA_CACHE_DIR', str(tmp_path))
+    monkeypatch.delattr(utils.patch_endpoints_meta, 'patched', raising=False)
+    monkeypatch.setattr(utils, '_meta_ctx', [])
+    monkeypatch.setattr(endpoints.SMAEndpoint, 'is_overlay', False)
+    monkeypatch.setattr(endpoints.RSIEndpoint, 'colormap', {})
+
+    TDClient('throwaway', http_client=MagicMock())
+    http_client = MagicMock()
+    http_client.get = MagicMock(return_value=_fake_json_resp({'status': 'ok', 'data': {
+        'rsi': {'overlay': False, 'output_values': {'rsi': {'default_color': '#FF0000'}}},
+    }}))
+    td = TDClient('demo', http_client=http_client)
+    assert http_client.get.call_count == 0
+    assert utils._meta_ctx == [td.ctx]
+
+    # The bundled snapshot is applied at once and refreshed in background
+    with patch('twelvedata.utils.threading.Thread') as thread:
+        utils.ensure_endpoints_meta()
+    assert endpoints.SMAEndpoint.is_overlay is True
+    assert thread.call_args[1]['args'] == (td.ctx,)
+    assert http_client.get.call_count == 0
+    assert utils.refresh_endpoints_meta(td.ctx)
+    assert endpoints.RSIEndpoint.colormap == {'rsi': '#FF0000'}
+    assert (tmp_path / 'technical_indicators.json').exists()
+
+    # Fresh copy is used without requests
+    monkeypatch.delattr(utils.patch_endpoints_meta, 'patched')
+    monkeypatch.setattr(endpoints.RSIEndpoint, 'colormap', {})
+    with patch('twelvedata.utils.threading.Thread') as thread:
+        utils.ensure_endpoints_meta()
+    assert thread.call_count == 0
+    assert endpoints.RSIEndpoint.colormap == {'rsi': '#FF0000'}
+
+    # Stale copy is applied at once and refreshed in background
+    monkeypatch.delattr(utils.patch_endpoints_meta, 'patched')
+    monkeypatch.setattr(endpoints.RSIEndpoint, 'colormap', {})
+    stale = time.time() - utils.META_CACHE_TTL_S - 1
+    os.utime(str(tmp_path / 'technical_indicators.json'), (stale, stale))
+    with patch('twelvedata.utils.threading.Thread') as thread:
+        utils.ensure_endpoints_meta()
+    assert endpoints.RSIEndpoint.colormap == {'rsi': '#FF0000'}
+    assert thread.call_count == 1
+    assert http_client.get.call_count == 1
+
+
+def test_import_does_not_load_endpoints():
+    import os
+    import subprocess
+    import sys
+    import twelvedata
+
+    code = (
+        "import sys, twelvedata; twelvedata.TDClient('demo'); "
+        "print(','.join(sorted(m for m in sys.modules if m.startswith('twelvedata'))))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(twelvedata.__file__)))
+    out = subprocess.check_output([sys.executable, '-c', code], env=env).decode().strip()
+    modules = out.split(',')
+    assert 'twelvedata.client' in modules
+    for name in ('twelvedata.endpoints', 'twelvedata.time_series', 'twelvedata.websocket'):
+        assert name not in modules
+
+    # Endpoint classes are still loaded on demand
+    td = TDClient('demo', http_client=MagicMock())
+    assert isinstance(td.time_series(symbol='AAPL', interval='1day'), TimeSeries)
+
+
+def test_endpoint_params_spec():
+    import inspect
+    from twelvedata import endpoints
+
+    for name in endpoints.__all__:
+        cls = getattr(endpoints, name)
+        args = inspect.signature(cls.__init__).parameters
+        assert all(param in args for param in cls._params), name
+
+    http_client = MagicMock()
+    ctx = _init_ctx(http_client)
+    endpoints.ExchangeRateEndpoint(ctx, 'USD/JPY', dp=2).execute()
+    http_client.get.assert_called_once_with('/exchange_rate', params={
+        'symbol': 'USD/JPY', 'dp': 2, 'format': 'JSON', 'apikey': 'demo',
+    })
+    assert 'date' not in http_client.get.call_args[1]['params']
+
+    ep = endpoints.PriceEndpoint(ctx, 'AAPL, MSFT')
+    assert ep.as_url() == (
+        API_URL + '/price?symbol=AAPL,MSFT&dp=5&prepost=false&format=JSON&apikey=demo'
+    )
+    assert ep.is_batch
+
+
+def test_http_client_coalesces_requests():
+    import threading
+
+    http_client = DefaultHttpClient(API_URL, coalesce=True)
+    release = threading.Event()
+
+    def _get(*args, **kwargs):
+        release.wait(5)
+        if kwargs['params']['symbol'] == 'FAIL':
+            return _fake_json_resp({'status': 'error', 'code': 400, 'message': 'error message'})
+        return _fake_content_resp(b'{"price": "1.0"}')
+
+    results = []
+    params = [{'symbol': 'AAPL', 'dp': 5}, {'dp': '5', 'symbol': 'AAPL'}, {'symbol': 'AAPL', 'dp': 5},
+              {'symbol': 'FAIL'}, {'symbol': 'FAIL'}]
+
+    def _request(p):
+        try:
+            results.append(http_client.get('/price', params=dict(p)))
+        except BadRequestError as e:
+            results.append(e)
+
+    with patch('twelvedata.http_client.Session.get', side_effect=_get) as mock_get:
+        threads = [threading.Thread(target=_request, args=(p,)) for p in params]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 5
+        while http_client.singleflight.stats()['shared'] < 3 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+
+    assert mock_get.call_count == 2
+    assert http_client.singleflight.stats() == {'executed': 2, 'shared': 3, 'in_flight': 0}
+    responses = [r for r in results if not isinstance(r, Exception)]
+    assert len(responses) == 3 and all(r is responses[0] for r in responses)
+    assert len(results) == 5
+
+
+def test_async_http_client_coalesces_requests():
+    pytest.importorskip('aiohttp')
+    http_client = AsyncHttpClient(API_URL, coalesce=True)
+    session = _fake_aiohttp_session(200, b'{"price": "1.0"}')
+
+    async def _gather():
+        return await asyncio.gather(
+            http_client.get('/price', params={'symbol': 'AAPL'}),
+            http_client.get('/price', params={'symbol': 'AAPL'}),
+            http_client.get('/price', params={'symbol': 'AAPL', 'source': 'other'}),
+        )
+
+    with patch.object(AsyncHttpClient, '_get_session', return_value=session):
+        results = asyncio.run(_gather())
+    session.get.assert_called_once()
+    assert all(r is results[0] for r in results)
+    assert http_client.singleflight.stats() == {'executed': 1, 'shared': 2, 'in_flight': 0}
+
+
+def test_retry_policy_delay():
+    from collections import Counter
+
+    policy = RetryPolicy(statuses={429: 2, 503: 1}, base=1, cap=4, deadline=10)
+    started_at = time.monotonic()
+    retries = Counter()
+    assert policy.delay('GET', 400, retries, started_at) is None
+    assert policy.delay('POST', 503, retries, started_at) is None
+    assert 0 <= policy.delay('GET', 503, retries, started_at) <= 1
+    assert policy.delay('GET', 503, retries, started_at) is None
+    assert policy.delay('GET', 429, retries, started_at, {'Retry-After': '3'}) == 3
+    assert policy.delay('GET', 429, retries, started_at, {'Retry-After': '30'}) is None
+    assert 0 <= policy.delay('GET', None, retries, started_at) <= 4
+    assert retries == {503: 1, 429: 1, 'error': 1}
+    assert policy.stats() == {
+        'retries': {503: 1, 429: 1, 'error': 1},
+        'gave_up': {503: 1, 429: 1},
+    }
+    assert policy.timeout(30, started_at) == pytest.approx(10, abs=0.1)
+
+
+def test_http_client_retries():
+    import requests
+
+    error_429 = _fake_json_resp({'status': 'error', 'code': 429, 'message': 'error message'})
+    responses = [_fake_resp(503), error_429, requests.ConnectionError(), _fake_content_resp(b'{"price": "1"}')]
+    policy = RetryPolicy(base=0.01)
+    http_client = DefaultHttpClient(API_URL, timeout=5, retry_policy=policy)
+    with patch('twelvedata.http_client.Session.get', side_effect=responses) as mock_get, \
+            patch('twelvedata.http_client.time.sleep') as mock_sleep:
+        assert http_client.get('/price', params={'symbol': 'AAPL'}).json() == {'price': '1'}
+    assert mock_get.call_count == 4
+    assert mock_sleep.call_count == 3
+    assert mock_get.call_args[1]['timeout'] <= 5
+    assert policy.stats() == {'retries': {503: 1, 429: 1, 'error': 1}, 'gave_up': {}}
+
+    # Errors which are not retried are raised at once with the response headers
+    resp = _fake_resp(400)
+    resp.headers['X-Request-Id'] = 'abc'
+    with patch('twelvedata.http_client.Session.get', return_value=resp) as mock_get:
+        with pytest.raises(BadRequestError) as e:
+            http_client.get('/price', params={'symbol': 'AAPL'})
+    mock_get.assert_called_once()
+    assert e.value.code == 400 and e.value.headers['X-Request-Id'] == 'abc'
+
+
+def test_async_http_client_retries():
+    pytest.importorskip('aiohttp')
+    policy = RetryPolicy(statuses={502: 1}, base=0.01)
+    http_client = AsyncHttpClient(API_URL, retry_policy=policy)
+    session = MagicMock()
+    session.get = MagicMock(side_effect=[
+        _FakeAiohttpResponse(502, b'', {'Retry-After': '0'}),
+        _FakeAiohttpResponse(502, b''),
+    ])
+    with patch.object(AsyncHttpClient, '_get_session', return_value=session):
+        with pytest.raises(InternalServerError):
+            asyncio.run(http_client.get('/price', params={'symbol': 'AAPL'}))
+    assert session.get.call_count == 2
+    assert policy.stats() == {'retries': {502: 1}, 'gave_up': {502: 1}}